@@ -139,7 +139,7 @@ def create_graph(
 
 
 def create_sparse_graph(
-    edgelist,
+    edgelist=None,
     num_of_vertices=None,
     directed=True,
     weighted=True,
@@ -147,6 +147,10 @@ def create_sparse_graph(
     any_hashable=False,
     vertex_supplier=None,
     edge_supplier=None,
+    csr=None,
+    sources=None,
+    targets=None,
+    weights=None,
 ):
     """Create a sparse graph.
 
@@ -176,10 +180,27 @@ def create_sparse_graph(
     :param edge_supplier: used only in the case that the graph allows any hashable as
       vertices/edges. Called everytime the graph needs to create a new edge. If not given,
       then object instances are used.
+    :param csr: a tuple (indptr, indices, edge_ids, weights) of arrays in CSR
+      (compressed-sparse-rows) format, such as the one returned by the `to_csr()` method
+      of integer graphs. When given, it is used instead of the edgelist and the graph is
+      constructed without any per-edge python work. Edge identifiers are ignored, weights
+      are required for weighted graphs and ignored otherwise. The index pointer must start
+      at zero and be non-decreasing. For undirected graphs each edge is expected in the rows
+      of both of its endpoints. Only valid if `any_hashable` is false.
+    :param sources: the edge sources as a column, used instead of the edgelist. Columns can
+      be any objects supporting the buffer protocol, such as :py:class:`array.array` or numpy
+      arrays, and are handed to the backend using a single call. Only valid if `any_hashable`
+      is false.
+    :param targets: the edge targets as a column, used instead of the edgelist
+    :param weights: optional edge weights as a column, used instead of the edgelist
     :returns: a graph
     :rtype: :class:`~jgrapht.types.Graph`
     """
     if any_hashable:
+        if csr is not None:
+            raise ValueError("CSR input is only supported for integer graphs")
+        if sources is not None or targets is not None or weights is not None:
+            raise ValueError("Edge columns are only supported for integer graphs")
         return _create_sparse_anyhashable_graph(
             edgelist=edgelist,
             directed=directed,
@@ -195,6 +216,10 @@ def create_sparse_graph(
             directed=directed,
             weighted=weighted,
             incoming_edges_support=incoming_edges_support,
+            csr=csr,
+            sources=sources,
+            targets=targets,
+            weights=weights,
         )
 
 
@@ -216,13 +241,15 @@ def copy_to_sparse_graph(graph):
 
 
 def create_succinct_graph(
-    edgelist,
+    edgelist=None,
     num_of_vertices=None,
     directed=True,
     incoming_edges_support=IncomingEdgesSupport.FULL_INCOMING_EDGES,
     any_hashable=False,
     vertex_supplier=None,
     edge_supplier=None,
+    sources=None,
+    targets=None,
 ):
     """Create a succinct graph.
 
@@ -254,6 +281,11 @@ def create_succinct_graph(
     :param edge_supplier: used only in the case that the graph allows any hashable as
       vertices/edges. Called everytime the graph needs to create a new edge. If not given,
       then object instances are used.
+    :param sources: the edge sources as a column, used instead of the edgelist. Columns can
+      be any objects supporting the buffer protocol, such as :py:class:`array.array` or numpy
+      arrays, and are handed to the backend using a single call. Only valid if `any_hashable`
+      is false.
+    :param targets: the edge targets as a column, used instead of the edgelist
     :returns: a graph
     :rtype: :class:`~jgrapht.types.Graph`
     """
@@ -261,6 +293,8 @@ def create_succinct_graph(
         incoming_edges_support = IncomingEdgesSupport.FULL_INCOMING_EDGES
 
     if any_hashable:
+        if sources is not None or targets is not None:
+            raise ValueError("Edge columns are only supported for integer graphs")
         return _create_succinct_anyhashable_graph(
             edgelist=edgelist,
             directed=directed,
@@ -274,6 +308,8 @@ def create_succinct_graph(
             num_of_vertices=num_of_vertices,
             directed=directed,
             incoming_edges_support=incoming_edges_support,
+            sources=sources,
+            targets=targets,
         )
 
 
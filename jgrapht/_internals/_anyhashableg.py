@@ -1,9 +1,11 @@
+from abc import abstractmethod
+from array import array
 from collections import defaultdict
 from collections.abc import (
     Set,
+    Mapping,
     MutableMapping,
 )
-import copy
 
 from .. import backend
 from ..types import (
@@ -30,7 +32,11 @@ from ._views import (
     _EdgeReversedGraphView,
     _WeightedView,
     _MaskedSubgraphView,
+    _BitmapMaskedSubgraphView,
 )
+from ._idmaps import _IdToObjectMap
+from ._columns import _AttributeColumn
+from ._arrays import _as_mask_callback
 from ._anyhashableg_collections import (
     _AnyHashableGraphVertexSet,
     _AnyHashableGraphVertexIterator,
@@ -86,15 +92,19 @@ class _AnyHashableGraph(Graph, AttributesGraph, ListenableGraph):
             self._vertex_hash_to_id = copy_from._vertex_hash_to_id
             self._vertex_id_to_hash = copy_from._vertex_id_to_hash
             self._vertex_hash_to_attrs = copy_from._vertex_hash_to_attrs
+            self._vertex_attr_columns = copy_from._vertex_attr_columns
             self._vertex_attrs = self._VertexAttributes(
-                self, self._vertex_hash_to_attrs
+                self, self._vertex_hash_to_attrs, self._vertex_attr_columns
             )
 
             # copy edge maps
             self._edge_hash_to_id = copy_from._edge_hash_to_id
             self._edge_id_to_hash = copy_from._edge_id_to_hash
             self._edge_hash_to_attrs = copy_from._edge_hash_to_attrs
-            self._edge_attrs = self._EdgeAttributes(self, self._edge_hash_to_attrs)
+            self._edge_attr_columns = copy_from._edge_attr_columns
+            self._edge_attrs = self._EdgeAttributes(
+                self, self._edge_hash_to_attrs, self._edge_attr_columns
+            )
 
             # initialize graph maps
             self._graph_attrs = copy_from._graph_attrs
@@ -110,17 +120,21 @@ class _AnyHashableGraph(Graph, AttributesGraph, ListenableGraph):
 
             # initialize vertex maps
             self._vertex_hash_to_id = {}
-            self._vertex_id_to_hash = {}
-            self._vertex_hash_to_attrs = defaultdict(lambda: {})
+            self._vertex_id_to_hash = _IdToObjectMap()
+            self._vertex_hash_to_attrs = {}
+            self._vertex_attr_columns = {}
             self._vertex_attrs = self._VertexAttributes(
-                self, self._vertex_hash_to_attrs
+                self, self._vertex_hash_to_attrs, self._vertex_attr_columns
             )
 
             # initialize edge maps
             self._edge_hash_to_id = {}
-            self._edge_id_to_hash = {}
-            self._edge_hash_to_attrs = defaultdict(lambda: {})
-            self._edge_attrs = self._EdgeAttributes(self, self._edge_hash_to_attrs)
+            self._edge_id_to_hash = _IdToObjectMap()
+            self._edge_hash_to_attrs = {}
+            self._edge_attr_columns = {}
+            self._edge_attrs = self._EdgeAttributes(
+                self, self._edge_hash_to_attrs, self._edge_attr_columns
+            )
 
             # initialize graph maps
             self._graph_attrs = {}
@@ -321,12 +335,16 @@ class _AnyHashableGraph(Graph, AttributesGraph, ListenableGraph):
         v = self._vertex_id_to_hash.pop(vid)
         self._vertex_hash_to_id.pop(v)
         self._vertex_hash_to_attrs.pop(v, None)
+        for column in self._vertex_attr_columns.values():
+            column.reset(vid)
         return v
 
     def _remove_edge(self, eid):
         e = self._edge_id_to_hash.pop(eid)
         self._edge_hash_to_id.pop(e)
         self._edge_hash_to_attrs.pop(e, None)
+        for column in self._edge_attr_columns.values():
+            column.reset(eid)
         return e
 
     def _structural_event_listener(self, element, event_type):
@@ -415,128 +433,250 @@ class _AnyHashableGraph(Graph, AttributesGraph, ListenableGraph):
         def _from_iterable(cls, it):
             return set(it)
 
-    class _VertexAttributes(MutableMapping):
-        """Wrapper around a dictionary to ensure vertex existence."""
+    class _Attributes(MutableMapping):
+        """Base class of the vertex and edge attributes of a graph.
 
-        def __init__(self, graph, storage):
+        Attributes are kept in per-element dictionaries, which are created only once
+        an element gets an attribute. Additionally attributes can be stored in typed
+        columns indexed by the internal identifier of each element.
+        """
+
+        def __init__(self, graph, storage, columns):
             self._graph = graph
             self._storage = storage
+            self._columns = columns
 
         def __getitem__(self, key):
-            if key not in self._graph.vertices:
-                raise ValueError("Vertex {} not in graph".format(key))
-            return self._storage[key]
+            self._check(key)
+            return self._graph._LazyAttributesDict(self, key)
 
         def __setitem__(self, key, value):
-            if key not in self._graph.vertices:
-                raise ValueError("Vertex {} not in graph".format(key))
+            self._check(key)
+            if self._columns:
+                value = dict(value)
+                element_id = self._element_id(key)
+                for name, column in self._columns.items():
+                    if name in value:
+                        column[element_id] = value.pop(name)
+                    else:
+                        column.reset(element_id)
             self._storage[key] = value
 
         def __delitem__(self, key):
-            if key not in self._graph.vertices:
-                raise ValueError("Vertex {} not in graph".format(key))
-            del self._storage[key]
+            self._check(key)
+            self._storage.pop(key, None)
+            if self._columns:
+                element_id = self._element_id(key)
+                for column in self._columns.values():
+                    column.reset(element_id)
 
         def __len__(self):
+            if self._columns:
+                return len(self._elements())
             return len(self._storage)
 
         def __iter__(self):
+            if self._columns:
+                return iter(self._elements())
             return iter(self._storage)
 
-        def __repr__(self):
-            return "_AnyHashableGraph-VertexAttributes(%r)" % repr(self._storage)
-
         def __str__(self):
             items = []
-            for v in self._graph.vertices:
-                items.append("{}: {}".format(v, self._storage[v]))
+            for element in self._elements():
+                items.append("{}: {}".format(element, self[element]))
             return "{" + ", ".join(items) + "}"
 
-    class _EdgeAttributes(MutableMapping):
+        def add_column(self, key, dtype="float64", default=0.0):
+            """Store an attribute in a typed column instead of the per-element
+            dictionaries. Existing values of the attribute are moved into the column
+            and elements without a value get the default value.
+
+            Columns require numpy.
+
+            :param key: the attribute name
+            :param dtype: the numpy data type of the column
+            :param default: the default value of the column
+            """
+            if key in self._columns:
+                raise ValueError("Column {} already exists".format(key))
+            column = _AttributeColumn(dtype, default)
+            for element, attrs in list(self._storage.items()):
+                if key in attrs:
+                    column[self._element_id(element)] = attrs.pop(key)
+                    if not attrs:
+                        del self._storage[element]
+            self._columns[key] = column
+
+        def column(self, key):
+            """Get the values of a columnar attribute as a numpy array indexed by the
+            internal identifier of each element. The array is a read-only snapshot,
+            use :py:meth:`set_column` in order to update all values at once.
+
+            :param key: the attribute name
+            :returns: a read-only numpy array
+            :raises KeyError: if the attribute is not stored in a column
+            """
+            return self._columns[key].snapshot(self._id_to_hash().table_size)
+
+        def set_column(self, key, values):
+            """Replace the values of a columnar attribute with an array indexed by the
+            internal identifier of each element. Elements past the end of the array
+            get the default value of the column.
+
+            :param key: the attribute name
+            :param values: the new values
+            :raises KeyError: if the attribute is not stored in a column
+            """
+            self._columns[key].assign(values)
+
+        @abstractmethod
+        def _check(self, element):
+            pass
+
+        @abstractmethod
+        def _elements(self):
+            pass
+
+        @abstractmethod
+        def _element_id(self, element):
+            pass
+
+        @abstractmethod
+        def _id_to_hash(self):
+            pass
+
+    class _VertexAttributes(_Attributes):
+        """Wrapper around a dictionary to ensure vertex existence."""
+
+        def __repr__(self):
+            return "_AnyHashableGraph-VertexAttributes(%r)" % repr(self._storage)
+
+        def _check(self, vertex):
+            if vertex not in self._graph.vertices:
+                raise ValueError("Vertex {} not in graph".format(vertex))
+
+        def _elements(self):
+            return self._graph.vertices
+
+        def _element_id(self, vertex):
+            return self._graph._vertex_hash_to_id[vertex]
+
+        def _id_to_hash(self):
+            return self._graph._vertex_id_to_hash
+
+    class _EdgeAttributes(_Attributes):
         """Wrapper around a dictionary to ensure edge existence."""
 
-        def __init__(self, graph, storage):
-            self._graph = graph
-            self._storage = storage
+        def __getitem__(self, key):
+            self._check(key)
+            return self._graph._PerEdgeWeightAwareDict(self._graph, key, self)
+
+        def __repr__(self):
+            return "_AnyHashableGraph-EdgeAttributes(%r)" % repr(self._storage)
+
+        def _check(self, edge):
+            if edge not in self._graph.edges:
+                raise ValueError("Edge {} not in graph".format(edge))
+
+        def _elements(self):
+            return self._graph.edges
+
+        def _element_id(self, edge):
+            return self._graph._edge_hash_to_id[edge]
+
+        def _id_to_hash(self):
+            return self._graph._edge_id_to_hash
+
+    class _LazyAttributesDict(MutableMapping):
+        """A view of the attributes of a single element. The actual dictionary is
+        only created once an attribute is set, so that elements without attributes
+        do not cost any memory. Columnar attributes are read from their columns."""
+
+        def __init__(self, attributes, element, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._attributes = attributes
+            self._element = element
 
         def __getitem__(self, key):
-            if key not in self._graph.edges:
-                raise ValueError("Edge {} not in graph".format(key))
-            return self._graph._PerEdgeWeightAwareDict(
-                self._graph, key, self._storage[key]
-            )
+            column = self._attributes._columns.get(key)
+            if column is not None:
+                return column[self._attributes._element_id(self._element)]
+            attrs = self._attributes._storage.get(self._element)
+            if attrs is None:
+                raise KeyError(key)
+            return attrs[key]
 
         def __setitem__(self, key, value):
-            if key not in self._graph.edges:
-                raise ValueError("Edge {} not in graph".format(key))
-            self._storage[key] = value
+            column = self._attributes._columns.get(key)
+            if column is not None:
+                column[self._attributes._element_id(self._element)] = value
+                return
+            storage = self._attributes._storage
+            attrs = storage.get(self._element)
+            if attrs is None:
+                attrs = {}
+                storage[self._element] = attrs
+            attrs[key] = value
 
         def __delitem__(self, key):
-            if key not in self._graph.edges:
-                raise ValueError("Edge {} not in graph".format(key))
-            del self._storage[key]
+            column = self._attributes._columns.get(key)
+            if column is not None:
+                column.reset(self._attributes._element_id(self._element))
+                return
+            attrs = self._attributes._storage.get(self._element)
+            if attrs is None:
+                raise KeyError(key)
+            del attrs[key]
 
         def __len__(self):
-            return len(self._storage)
+            attrs = self._attributes._storage.get(self._element, ())
+            return len(attrs) + len(self._attributes._columns)
 
         def __iter__(self):
-            return iter(self._storage)
+            yield from self._attributes._storage.get(self._element, ())
+            yield from self._attributes._columns
 
         def __repr__(self):
-            return "_AnyHashableGraph-EdgeAttributes(%r)" % repr(self._storage)
+            return "_LazyAttributesDict(%r, %r)" % (self._element, dict(self))
 
         def __str__(self):
-            items = []
-            for e in self._graph.edges:
-                items.append("{}: {}".format(e, self._storage[e]))
-            return "{" + ", ".join(items) + "}"
+            return str(dict(self))
 
-    class _PerEdgeWeightAwareDict(MutableMapping):
+    class _PerEdgeWeightAwareDict(_LazyAttributesDict):
         """A dictionary view which knows about the special key weight and delegates
         to the graph. This is only a view."""
 
-        def __init__(self, graph, edge, storage, *args, **kwargs):
-            super().__init__(*args, **kwargs)
+        def __init__(self, graph, edge, attributes, *args, **kwargs):
+            super().__init__(attributes, edge, *args, **kwargs)
             self._graph = graph
-            self._edge = edge
-            self._storage = storage
 
         def __getitem__(self, key):
             if key == "weight":
-                return self._graph.get_edge_weight(self._edge)
+                return self._graph.get_edge_weight(self._element)
             else:
-                return self._storage[key]
+                return super().__getitem__(key)
 
         def __setitem__(self, key, value):
             if key == "weight":
                 if not isinstance(value, (float)):
                     raise TypeError("Weight is not a floating point number")
-                self._graph.set_edge_weight(self._edge, value)
+                self._graph.set_edge_weight(self._element, value)
             else:
-                self._storage[key] = value
+                super().__setitem__(key, value)
 
         def __delitem__(self, key):
             if key == "weight":
-                self._graph.set_edge_weight(self._edge, 1.0)
+                self._graph.set_edge_weight(self._element, 1.0)
             else:
-                del self._storage[key]
-
-        def __len__(self):
-            return len(self._storage)
-
-        def __iter__(self):
-            return iter(self._storage)
+                super().__delitem__(key)
 
         def __repr__(self):
             return "_PerEdgeWeightAwareDict(%r, %r, %r)" % (
                 repr(self._graph),
-                repr(self._edge),
-                repr(self._storage),
+                repr(self._element),
+                repr(dict(self)),
             )
 
-        def __str__(self):
-            return str(self._storage)
-
 
 class _AnyHashableDirectedAcyclicGraph(_AnyHashableGraph, DirectedAcyclicGraph):
     """The directed acyclic graph wrapper."""
@@ -591,7 +731,7 @@ class _MaskedSubgraphAnyHashableGraph(_AnyHashableGraph):
         **kwargs
     ):
         assert isinstance(
-            graph, _MaskedSubgraphView
+            graph, (_MaskedSubgraphView, _BitmapMaskedSubgraphView)
         ), "Can only be used with a masked subgraph backend"
 
         super().__init__(graph, vertex_supplier, edge_supplier, copy_from)
@@ -632,6 +772,57 @@ class _MaskedSubgraphAnyHashableGraph(_AnyHashableGraph):
         return eid
 
 
+class _BitmapMaskedSubgraphAnyHashableGraph(_MaskedSubgraphAnyHashableGraph):
+    """A masked subgraph any-hashable graph whose masks are kept in the backend."""
+
+    def __init__(self, graph, vertex_supplier, edge_supplier, copy_from, **kwargs):
+        super().__init__(
+            graph,
+            vertex_supplier,
+            edge_supplier,
+            copy_from,
+            vertex_mask_cb=self._is_vertex_masked,
+            edge_mask_cb=self._is_edge_masked,
+        )
+
+    def set_masks(self, vertex_mask, edge_mask=None):
+        """Apply new masks to the view.
+
+        Sets contain the masked vertices or edges. Boolean sequences, arrays and
+        integer bitsets are indexed by the internal identifiers of the vertices
+        or edges, the same as attribute columns.
+
+        :param vertex_mask: the vertex mask or None
+        :param edge_mask: the edge mask or None
+        """
+        self._graph.set_masks(
+            self._mask_to_ids(vertex_mask, self._vertex_hash_to_id),
+            self._mask_to_ids(edge_mask, self._edge_hash_to_id),
+        )
+
+    def __repr__(self):
+        return "_BitmapMaskedSubgraphAnyHashableGraph(%r)" % self._graph.handle
+
+    def _is_vertex_masked(self, v):
+        return not self._graph.contains_vertex(self._vertex_hash_to_id[v])
+
+    def _is_edge_masked(self, e):
+        return not self._graph.contains_edge(self._edge_hash_to_id[e])
+
+    @staticmethod
+    def _mask_to_ids(mask, hash_to_id):
+        if isinstance(mask, bool):
+            raise TypeError("A boolean is not a valid mask")
+        if isinstance(mask, Set):
+            ids = set()
+            for x in mask:
+                if x not in hash_to_id:
+                    raise ValueError("Masked element {} not in graph".format(x))
+                ids.add(hash_to_id[x])
+            return ids
+        return mask
+
+
 def _create_anyhashable_graph_subgraph(anyhashable_graph, subgraph):
     """Create an any hashable graph subgraph.
 
@@ -661,7 +852,9 @@ def _create_anyhashable_graph_subgraph(anyhashable_graph, subgraph):
     for vid in subgraph.vertices:
         v = _vertex_g_to_anyhashableg(anyhashable_graph, vid)
         res.add_vertex(vertex=v)
-        res.vertex_attrs[v] = copy.copy(anyhashable_graph.vertex_attrs[v])
+        attrs = anyhashable_graph.vertex_attrs[v]
+        if len(attrs) > 0:
+            res.vertex_attrs[v] = dict(attrs)
         vertex_map[vid] = v
 
     weighted = subgraph.type.weighted
@@ -672,7 +865,9 @@ def _create_anyhashable_graph_subgraph(anyhashable_graph, subgraph):
             res.add_edge(vertex_map[s], vertex_map[t], weight=w, edge=e)
         else:
             res.add_edge(vertex_map[s], vertex_map[t], edge=e)
-        res.edge_attrs[e] = copy.copy(anyhashable_graph.edge_attrs[e])
+        attrs = anyhashable_graph.edge_attrs[e]
+        if len(attrs) > 0:
+            res.edge_attrs[e] = dict(attrs)
 
     return res
 
@@ -726,9 +921,16 @@ def _as_edgereversed_anyhashable_graph(anyhashable_graph):
 
 
 def _as_weighted_anyhashable_graph(
-    anyhashable_graph, edge_weight_cb, cache_weights, write_weights_through
+    anyhashable_graph, edge_weight_cb, cache_weights, write_weights_through, weights=None
 ):
-    """Create a weighted view of an any-hashable graph."""
+    """Create a weighted view of an any-hashable graph. Weights given as an array are
+    indexed by the internal edge identifiers, such as an edge attribute column, while
+    weights given as a dictionary are keyed by edge."""
+    if isinstance(weights, Mapping):
+        weights = {
+            anyhashable_graph._get_edge_id(e): w for e, w in weights.items()
+        }
+
     if edge_weight_cb is not None:
 
         def actual_edge_weight_cb(e):
@@ -740,7 +942,7 @@ def _as_weighted_anyhashable_graph(
 
     graph = anyhashable_graph._graph
     weighted_graph = _WeightedView(
-        graph, actual_edge_weight_cb, cache_weights, write_weights_through
+        graph, actual_edge_weight_cb, cache_weights, write_weights_through, weights
     )
 
     weighted_anyhashable_graph = _AnyHashableGraph(
@@ -784,6 +986,44 @@ def _as_masked_subgraph_anyhashable_graph(
     return masked_subgraph_anyhashable_graph
 
 
+def _as_anyhashable_mask_callback(anyhashable_graph, mask, edges=False):
+    """Turn a mask of an any-hashable graph into a mask callback which accepts vertices
+    or edges."""
+    if edges:
+        hash_to_id = anyhashable_graph._edge_hash_to_id
+    else:
+        hash_to_id = anyhashable_graph._vertex_hash_to_id
+    to_ids = _BitmapMaskedSubgraphAnyHashableGraph._mask_to_ids
+    id_mask_cb = _as_mask_callback(to_ids(mask, hash_to_id))
+
+    def mask_cb(x):
+        return id_mask_cb(hash_to_id[x])
+
+    return mask_cb
+
+
+def _as_bitmap_masked_subgraph_anyhashable_graph(
+    anyhashable_graph, vertex_mask, edge_mask=None
+):
+    """ Create a masked subgraph view of an any-hashable graph with the masks kept
+    in the backend."""
+    to_ids = _BitmapMaskedSubgraphAnyHashableGraph._mask_to_ids
+    masked_subgraph = _BitmapMaskedSubgraphView(
+        anyhashable_graph._graph,
+        to_ids(vertex_mask, anyhashable_graph._vertex_hash_to_id),
+        to_ids(edge_mask, anyhashable_graph._edge_hash_to_id),
+    )
+
+    masked_subgraph_anyhashable_graph = _BitmapMaskedSubgraphAnyHashableGraph(
+        masked_subgraph,
+        vertex_supplier=None,
+        edge_supplier=None,
+        copy_from=anyhashable_graph,
+    )
+
+    return masked_subgraph_anyhashable_graph
+
+
 def _is_anyhashable_graph(graph):
     """Check if a graph instance is an any-hashable graph.
 
@@ -914,21 +1154,29 @@ def _create_sparse_anyhashable_graph(
     # Transform edge list from hashable to ints
     next_int = IntegerSupplier()
     vertex_hash_to_id = defaultdict(lambda: next_int())
-    int_edgelist = list()
+    sources = array("i")
+    targets = array("i")
     if weighted:
+        weights = array("d")
         for v, u, w in edgelist:
-            int_edgelist.append((vertex_hash_to_id[v], vertex_hash_to_id[u], w))
+            sources.append(vertex_hash_to_id[v])
+            targets.append(vertex_hash_to_id[u])
+            weights.append(w)
     else:
+        weights = None
         for v, u, *w in edgelist:
-            int_edgelist.append((vertex_hash_to_id[v], vertex_hash_to_id[u]))
+            sources.append(vertex_hash_to_id[v])
+            targets.append(vertex_hash_to_id[u])
 
     # Create graph
     sparse_int_graph = _create_sparse_int_graph(
-        int_edgelist,
         num_of_vertices=len(vertex_hash_to_id),
         directed=directed,
         weighted=weighted,
         incoming_edges_support=incoming_edges_support,
+        sources=sources,
+        targets=targets,
+        weights=weights,
     )
     g = _AnyHashableGraph(
         sparse_int_graph, vertex_supplier=vertex_supplier, edge_supplier=edge_supplier
@@ -940,7 +1188,7 @@ def _create_sparse_anyhashable_graph(
         g._vertex_id_to_hash[vid] = vhash
 
     # Record mapping of existing edges
-    for eid in range(0, len(int_edgelist)):
+    for eid in range(0, len(sources)):
         ehash = g._edge_supplier()
         g._edge_hash_to_id[ehash] = eid
         g._edge_id_to_hash[eid] = ehash
@@ -1040,16 +1288,19 @@ def _create_succinct_anyhashable_graph(
     # Transform edge list from hashable to ints
     next_int = IntegerSupplier()
     vertex_hash_to_id = defaultdict(lambda: next_int())
-    int_edgelist = list()
+    sources = array("i")
+    targets = array("i")
     for v, u, *w in edgelist:
-        int_edgelist.append((vertex_hash_to_id[v], vertex_hash_to_id[u]))
+        sources.append(vertex_hash_to_id[v])
+        targets.append(vertex_hash_to_id[u])
 
     # Create graph
     succinct_int_graph = _create_succinct_int_graph(
-        int_edgelist,
         num_of_vertices=len(vertex_hash_to_id),
         directed=directed,
         incoming_edges_support=incoming_edges_support,
+        sources=sources,
+        targets=targets,
     )
     g = _AnyHashableGraph(
         succinct_int_graph, vertex_supplier=vertex_supplier, edge_supplier=edge_supplier
@@ -1061,7 +1312,7 @@ def _create_succinct_anyhashable_graph(
         g._vertex_id_to_hash[vid] = vhash
 
     # Record mapping of existing edges
-    for eid in range(0, len(int_edgelist)):
+    for eid in range(0, len(sources)):
         ehash = g._edge_supplier()
         g._edge_hash_to_id[ehash] = eid
         g._edge_id_to_hash[eid] = ehash
@@ -1,6 +1,7 @@
 from .. import backend
 
 from ._wrappers import _JGraphTObjectIterator
+from ._arrays import _as_numpy, _as_numpy_objects
 from ._anyhashableg_wrappers import (
     _AnyHashableGraphVertexIterator,
     _AnyHashableGraphEdgeIterator,
@@ -120,6 +121,18 @@ class _AnyHashableGraphVertexDoubleMap(_JGraphTIntegerDoubleMap):
             raise KeyError()
         return backend.jgrapht_map_int_double_get(self._handle, key)
 
+    def to_arrays(self):
+        """Export the map as a list of vertices and an array of values."""
+        ids, values = super().to_arrays()
+        id_to_hash = self._graph._vertex_id_to_hash
+        return [id_to_hash[i] for i in ids], values
+
+    def to_numpy(self):
+        """Export the map as a numpy object array of vertices and a numpy
+        array of values."""
+        keys, values = self.to_arrays()
+        return _as_numpy_objects(keys), _as_numpy(values, "float64")
+
     def __repr__(self):
         return "_AnyHashableGraphVertexDoubleMap(%r)" % self._handle
 
@@ -156,6 +169,18 @@ class _AnyHashableGraphEdgeDoubleMap(_JGraphTIntegerDoubleMap):
             raise KeyError()
         return backend.jgrapht_map_int_double_get(self._handle, key)
 
+    def to_arrays(self):
+        """Export the map as a list of edges and an array of values."""
+        ids, values = super().to_arrays()
+        id_to_hash = self._graph._edge_id_to_hash
+        return [id_to_hash[i] for i in ids], values
+
+    def to_numpy(self):
+        """Export the map as a numpy object array of edges and a numpy
+        array of values."""
+        keys, values = self.to_arrays()
+        return _as_numpy_objects(keys), _as_numpy(values, "float64")
+
     def __repr__(self):
         return "_AnyHashableGraphEdgeDoubleMap(%r)" % self._handle
 
@@ -207,6 +232,18 @@ class _AnyHashableGraphVertexIntegerMap(_JGraphTIntegerIntegerMap):
             raise KeyError()
         return backend.jgrapht_map_int_int_get(self._handle, key)
 
+    def to_arrays(self):
+        """Export the map as a list of vertices and an array of values."""
+        ids, values = super().to_arrays()
+        id_to_hash = self._graph._vertex_id_to_hash
+        return [id_to_hash[i] for i in ids], values
+
+    def to_numpy(self):
+        """Export the map as a numpy object array of vertices and a numpy
+        array of values."""
+        keys, values = self.to_arrays()
+        return _as_numpy_objects(keys), _as_numpy(values, "int32")
+
     def __repr__(self):
         return "_AnyHashableGraphVertexIntegerMap(%r)" % self._handle
 
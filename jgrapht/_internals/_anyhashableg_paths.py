@@ -1,3 +1,5 @@
+from array import array
+
 from .. import backend
 
 from ..types import (
@@ -9,8 +11,30 @@ from ..types import (
 
 from ._wrappers import _HandleWrapper, _JGraphTObjectIterator
 
-from ._anyhashableg import _vertex_anyhashableg_to_g
+from ._arrays import _zeros, _as_numpy_objects
+from ._anyhashableg import _vertex_anyhashableg_to_g, _edge_g_to_anyhashableg
 from ._anyhashableg_wrappers import _AnyHashableGraphEdgeIterator
+from ._paths import _distance_matrix
+
+
+def _anyhashableg_distance_matrix(kind, handle, graph, sources, targets, with_paths):
+    """Fill a distance matrix, translating the vertices and the edges of the packed
+    paths."""
+    res = _distance_matrix(
+        kind,
+        handle,
+        graph._graph,
+        [_vertex_anyhashableg_to_g(graph, v) for v in sources],
+        [_vertex_anyhashableg_to_g(graph, v) for v in targets],
+        with_paths,
+    )
+    if not with_paths:
+        return res
+    distances, paths = res
+    edges = _as_numpy_objects(
+        [_edge_g_to_anyhashableg(graph, e) for e in paths.edges.tolist()]
+    )
+    return distances, paths._replace(edges=edges)
 
 
 class _AnyHashableGraphGraphPath(_HandleWrapper, GraphPath):
@@ -116,6 +140,33 @@ class _AnyHashableGraphSingleSourcePaths(_HandleWrapper, SingleSourcePaths):
         )
         return _AnyHashableGraphGraphPath(gp, self._graph) if gp is not None else None
 
+    def get_distances(self, target_vertices, with_predecessors=False):
+        """Get the distances to a sequence of target vertices using a single backend
+        call. See :py:meth:`.SingleSourcePaths.get_distances` for its cost.
+
+        :param target_vertices: the target vertices
+        :param with_predecessors: whether to also return the last edge of each path
+        :returns: an :py:class:`array.array` of doubles with the distance to each
+          target, infinity if unreachable. If with_predecessors is True, a tuple with the
+          distances and a list with the last edge of each path, None for the source and
+          unreachable vertices.
+        """
+        vertices = array(
+            "i", (_vertex_anyhashableg_to_g(self._graph, v) for v in target_vertices)
+        )
+        distances = _zeros("d", len(vertices))
+        predecessors = _zeros("i", len(vertices)) if with_predecessors else None
+        backend.jgrapht_ix_sp_singlesource_get_distances(
+            self._handle, len(vertices), vertices, distances, predecessors
+        )
+        if with_predecessors:
+            predecessors = [
+                _edge_g_to_anyhashableg(self._graph, e) if e >= 0 else None
+                for e in predecessors
+            ]
+            return distances, predecessors
+        return distances
+
     def __repr__(self):
         return "_AnyHashableGraphSingleSourcePaths(%r)" % self._handle
 
@@ -145,6 +196,26 @@ class _AnyHashableGraphAllPairsPaths(_HandleWrapper, AllPairsPaths):
             singlesource, self._graph, source_vertex
         )
 
+    def get_distance_matrix(
+        self, source_vertices=None, target_vertices=None, with_paths=False
+    ):
+        """Get the distances between all pairs of a block of source and target vertices
+        as a NumPy matrix, filled using a single backend call. See
+        :py:meth:`.AllPairsPaths.get_distance_matrix`.
+        """
+        if source_vertices is None:
+            source_vertices = self._graph.vertices
+        if target_vertices is None:
+            target_vertices = self._graph.vertices
+        return _anyhashableg_distance_matrix(
+            "allpairs",
+            self._handle,
+            self._graph,
+            source_vertices,
+            target_vertices,
+            with_paths,
+        )
+
     def __repr__(self):
         return "_AnyHashableGraphAllPairsPaths(%r)" % self._handle
 
@@ -180,9 +251,11 @@ class _AnyHashableGraphMultiObjectiveSingleSourcePaths(
 class _AnyHashableGraphContractionHierarchiesManyToMany(_HandleWrapper):
     """Many to many result with contraction hierarchies"""
 
-    def __init__(self, handle, graph, **kwargs):
+    def __init__(self, handle, graph, sources=None, targets=None, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._graph = graph
+        self._sources = sources
+        self._targets = targets
 
     def get_path(self, source_vertex, target_vertex):
         source_vertex = _vertex_anyhashableg_to_g(self._graph, source_vertex)
@@ -193,5 +266,25 @@ class _AnyHashableGraphContractionHierarchiesManyToMany(_HandleWrapper):
         )
         return _AnyHashableGraphGraphPath(gp, self._graph) if gp is not None else None
 
+    def get_distance_matrix(
+        self, source_vertices=None, target_vertices=None, with_paths=False
+    ):
+        """Get the distances between all pairs of a block of source and target vertices
+        as a NumPy matrix, filled using a single backend call. See
+        :py:meth:`.ManyToManyPaths.get_distance_matrix`.
+        """
+        if source_vertices is None:
+            source_vertices = self._sources
+        if target_vertices is None:
+            target_vertices = self._targets
+        return _anyhashableg_distance_matrix(
+            "manytomany",
+            self._handle,
+            self._graph,
+            source_vertices,
+            target_vertices,
+            with_paths,
+        )
+
     def __repr__(self):
         return "_AnyHashableGraphContractionHierarchiesManyToMany(%r)" % self._handle
\ No newline at end of file
@@ -0,0 +1,171 @@
+from array import array
+from collections.abc import Set as AbstractSet
+
+
+_INTEGER_FORMATS = "bBhHiIlLqQnN"
+_SIGNED_INTEGER_FORMATS = "bhilqn"
+_FLOATING_FORMATS = "fd"
+
+
+def _as_buffer(values, typecode):
+    """Get a contiguous buffer with items compatible with an array typecode.
+
+    Objects which support the buffer protocol (e.g. :py:class:`array.array` or numpy
+    arrays) are used directly if their item type matches, without any copying.
+    Everything else is copied into a new :py:class:`array.array`, which raises
+    :py:class:`OverflowError` if a value does not fit, e.g. a large unsigned value.
+
+    :param values: a buffer or any iterable of numbers
+    :param typecode: an :py:class:`array.array` typecode
+    :returns: a buffer which can be passed to the backend
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return array(typecode, values)
+
+    fmt = view.format.lstrip("@=")
+    if typecode in _FLOATING_FORMATS:
+        kinds = _FLOATING_FORMATS
+    elif typecode in _SIGNED_INTEGER_FORMATS:
+        kinds = _SIGNED_INTEGER_FORMATS
+    else:
+        kinds = _INTEGER_FORMATS
+    if (
+        view.ndim == 1
+        and view.c_contiguous
+        and view.itemsize == array(typecode).itemsize
+        and len(fmt) == 1
+        and fmt in kinds
+    ):
+        return view
+    return array(typecode, values)
+
+
+def _as_int_buffer(values):
+    """Get a buffer of 32-bit integers."""
+    return _as_buffer(values, "i")
+
+
+def _as_long_buffer(values):
+    """Get a buffer of 64-bit integers."""
+    return _as_buffer(values, "q")
+
+
+def _as_double_buffer(values):
+    """Get a buffer of doubles."""
+    return _as_buffer(values, "d")
+
+
+def _buffers_length(*buffers):
+    """Get the common length of a set of buffers. Buffers which are None are
+    ignored.
+
+    :raises ValueError: if the buffers have different lengths
+    """
+    lengths = set(len(b) for b in buffers if b is not None)
+    if len(lengths) > 1:
+        raise ValueError("Buffers must have the same length")
+    return lengths.pop() if lengths else 0
+
+
+# Bytes of a little-endian bitset expanded to one byte per bit
+_BITS_OF_BYTE = [bytes((b >> i) & 1 for i in range(8)) for b in range(256)]
+
+
+def _as_mask_buffer(mask):
+    """Get a buffer with one byte per identifier from a mask.
+
+    The mask can be a sequence or buffer of booleans indexed by identifier (e.g. a
+    numpy boolean array), a set of masked identifiers or an integer bitset where bit
+    i masks identifier i. Identifiers past the end of the buffer are not masked.
+
+    :param mask: the mask or None
+    :returns: a buffer which can be passed to the backend, or None
+    :raises TypeError: if the mask is a boolean
+    :raises ValueError: if the mask contains negative identifiers
+    """
+    if mask is None:
+        return None
+    if isinstance(mask, bool):
+        raise TypeError("A boolean is not a valid mask")
+    if isinstance(mask, int):
+        if mask < 0:
+            raise ValueError("Bitset mask cannot be negative")
+        data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+        return b"".join(_BITS_OF_BYTE[b] for b in data)
+    if isinstance(mask, AbstractSet):
+        if any(i < 0 for i in mask):
+            raise ValueError("Identifiers cannot be negative")
+        res = bytearray(max(mask) + 1 if mask else 0)
+        for i in mask:
+            res[i] = 1
+        return res
+
+    try:
+        view = memoryview(mask)
+    except TypeError:
+        return bytes(1 if m else 0 for m in mask)
+
+    fmt = view.format.lstrip("@=")
+    if view.ndim == 1 and view.c_contiguous and fmt in ("?", "b", "B"):
+        return view
+    return bytes(1 if m else 0 for m in mask)
+
+
+def _as_mask_callback(mask):
+    """Get a callback which looks up identifiers in a mask. Used when a mask is
+    combined with a mask callback, which cannot be kept in the backend.
+
+    :param mask: a mask accepted by :py:func:`_as_mask_buffer`
+    :returns: a function which returns whether an identifier is masked
+    """
+    buffer = _as_mask_buffer(mask)
+
+    def mask_cb(i):
+        return 0 <= i < len(buffer) and bool(buffer[i])
+
+    return mask_cb
+
+
+def _as_string_buffer(strings):
+    """Encode strings into a single buffer of consecutive NUL-terminated utf-8
+    strings, so that they can be passed to the backend using a single call.
+
+    :param strings: an iterable of strings
+    :returns: a tuple with an array of the offsets where each string starts and the buffer
+    """
+    encoded = [s.encode(encoding="utf-8") for s in strings]
+    offsets = array("q")
+    position = 0
+    for b in encoded:
+        offsets.append(position)
+        position += len(b) + 1
+    encoded.append(b"")
+    return offsets, b"\0".join(encoded)
+
+
+def _zeros(typecode, size):
+    """Create a zero-filled :py:class:`array.array` with a given size."""
+    return array(typecode, bytes(array(typecode).itemsize * size))
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy required")
+    return numpy
+
+
+def _as_numpy(buffer, dtype):
+    """Wrap a buffer as a numpy array without copying."""
+    return _import_numpy().frombuffer(buffer, dtype=dtype)
+
+
+def _as_numpy_objects(values):
+    """Create a one-dimensional numpy array of python objects."""
+    result = _import_numpy().empty(len(values), dtype=object)
+    for i, v in enumerate(values):
+        result[i] = v
+    return result
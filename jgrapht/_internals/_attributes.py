@@ -1,4 +1,7 @@
+from collections.abc import Mapping
+
 from .. import backend
+from ._arrays import _zeros, _as_int_buffer, _as_string_buffer
 from ._wrappers import _HandleWrapper
 
 
@@ -22,6 +25,18 @@ class _JGraphTAttributeStore(_HandleWrapper):
             self._handle, element, encoded_key, encoded_value
         )
 
+    def put_all(self, key, elements, values):
+        """Put the values of a single attribute key for many elements, using a single
+        backend call."""
+        elements = _as_int_buffer(elements)
+        offsets, encoded_values = _as_string_buffer(values)
+        if len(elements) != len(offsets):
+            raise ValueError("Elements and values must have the same length")
+        encoded_key = bytearray(key, encoding="utf-8")
+        backend.jgrapht_ii_attributes_store_put_string_attributes(
+            self._handle, encoded_key, len(offsets), elements, offsets, encoded_values
+        )
+
     def remove(self, element, key):
         encoded_key = bytearray(key, encoding="utf-8")
         backend.jgrapht_ii_attributes_store_remove_attribute(
@@ -70,3 +85,114 @@ class _JGraphTAttributesRegistry(_HandleWrapper):
 
     def __repr__(self):
         return "_JGraphTAttributesRegistry(%r)" % self._handle
+
+
+# Number of attributes read from an attribute table using a single backend call
+_ATTRIBUTE_TABLE_CHUNK_SIZE = 4096
+
+
+class _JGraphTAttributeTable(_HandleWrapper, Mapping):
+    """Attribute Table.
+
+    This attribute table is used by the importers in order to collect
+    attributes without calling back into Python for each of them. The
+    backend appends all attributes to the table while parsing and the table
+    is read back in chunks, each using a single call. The table is a mapping
+    from vertex or edge identifiers to attribute dictionaries.
+    """
+
+    def __init__(self, edges=False, handle=None, **kwargs):
+        if handle is None:
+            handle = backend.jgrapht_attribute_table_create()
+        super().__init__(handle=handle, **kwargs)
+        self._edges = edges
+        self._skip_keys = frozenset()
+        self._attrs = None
+
+    def bind(self, skip_keys=()):
+        """Make the importers of the current thread collect into the table.
+
+        :param skip_keys: attribute keys to discard when reading the table
+        :returns: the address of the native attribute callback
+        """
+        self._skip_keys = frozenset(skip_keys)
+        return backend.jgrapht_attribute_table_bind(self._handle, self._edges)
+
+    def unbind(self):
+        """Stop collecting the attributes of the importers of the current thread."""
+        backend.jgrapht_attribute_table_unbind(self._handle)
+
+    def iter_attributes(self, chunk_size=None):
+        """Iterate over the collected attributes, skipping the keys given when binding.
+
+        The attributes are read from the backend in chunks, thus only a chunk of them
+        is copied into Python at any time.
+
+        :param chunk_size: how many attributes to read using a single backend call, None
+          for the default
+        :returns: an iterator over tuples (identifier, key, value)
+        """
+        if chunk_size is None:
+            chunk_size = _ATTRIBUTE_TABLE_CHUNK_SIZE
+        self.unbind()
+        size, _, failed = backend.jgrapht_attribute_table_size(self._handle)
+        if failed:
+            raise MemoryError("Not enough memory to collect the attributes")
+
+        skip_keys = self._skip_keys
+        for start in range(0, size, chunk_size):
+            count = min(chunk_size, size - start)
+            strings_size = backend.jgrapht_attribute_table_range_strings_size(
+                self._handle, start, count
+            )
+            ids = _zeros("i", count)
+            offsets = _zeros("q", 2 * count + 1)
+            strings = bytearray(strings_size)
+            backend.jgrapht_attribute_table_get_range(
+                self._handle, start, count, ids, offsets, strings
+            )
+
+            try:
+                # byte offsets are also character offsets in ascii
+                strings = strings.decode("ascii")
+                decode = False
+            except UnicodeDecodeError:
+                decode = True
+
+            for i in range(count):
+                key = strings[offsets[2 * i] : offsets[2 * i + 1]]
+                if decode:
+                    key = key.decode(encoding="utf-8")
+                if key in skip_keys:
+                    continue
+                value = strings[offsets[2 * i + 1] : offsets[2 * i + 2]]
+                if decode:
+                    value = value.decode(encoding="utf-8")
+                yield ids[i], key, value
+
+    def _attributes(self):
+        if self._attrs is None:
+            attrs = {}
+            for id, key, value in self.iter_attributes():
+                element_attrs = attrs.get(id)
+                if element_attrs is None:
+                    element_attrs = attrs[id] = {}
+                element_attrs[key] = value
+            self._attrs = attrs
+        return self._attrs
+
+    def __getitem__(self, key):
+        return self._attributes()[key]
+
+    def __iter__(self):
+        return iter(self._attributes())
+
+    def __len__(self):
+        return len(self._attributes())
+
+    def __del__(self):
+        if backend.jgrapht_is_initialized():
+            backend.jgrapht_attribute_table_destroy(self._handle)
+
+    def __repr__(self):
+        return "_JGraphTAttributeTable(%r)" % self._handle
@@ -0,0 +1,281 @@
+import json
+import mmap
+import pickle
+import struct
+
+from ..types import IncomingEdgesSupport
+from ._arrays import _import_numpy
+from ._columns import _AttributeColumn
+from ._int_graphs import _create_sparse_int_graph, _create_succinct_int_graph
+from ._anyhashableg import _AnyHashableGraph, _is_anyhashable_graph
+
+
+# The file starts with the magic, the format version and the length of the header.
+# The header is a JSON document which describes the sections following it. Sections
+# are aligned to 8 bytes and their offsets are relative to the end of the header.
+_MAGIC = b"JGRAPHTB"
+_VERSION = 1
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+# Section type of pickled python objects
+_PICKLE = "pickle"
+
+
+def _aligned(offset):
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _dense_csr(graph):
+    """Get the CSR representation of an integer graph with vertices renumbered to
+    :math:`0` up to :math:`n-1`.
+
+    :returns: a tuple with the CSR representation, where the edge identifiers are the
+      ones of the graph, and an array with the original identifier of each vertex
+    """
+    np = _import_numpy()
+    try:
+        csr = graph.to_csr()
+        return csr, np.arange(len(csr.indptr) - 1, dtype=np.int32)
+    except ValueError:
+        pass
+
+    # vertices with gaps, copy into a graph with dense vertices first
+    vertex_ids = sorted(graph.vertices)
+    position = {v: i for i, v in enumerate(vertex_ids)}
+    edge_ids = list(graph.edges)
+    dense = _create_sparse_int_graph(
+        num_of_vertices=len(vertex_ids),
+        directed=graph.type.directed,
+        weighted=True,
+        sources=[position[graph.edge_source(e)] for e in edge_ids],
+        targets=[position[graph.edge_target(e)] for e in edge_ids],
+        weights=[graph.get_edge_weight(e) for e in edge_ids],
+    )
+    csr = dense.to_csr()
+    edge_ids = np.array(edge_ids, dtype=np.int32)
+    return (
+        csr._replace(edge_ids=edge_ids[csr.edge_ids]),
+        np.array(vertex_ids, dtype=np.int32),
+    )
+
+
+def _stored_edges(csr, directed):
+    """Mask of the CSR entries which become edges when reading the snapshot. Undirected
+    edges are stored in the rows of both endpoints and kept only once."""
+    np = _import_numpy()
+    if directed:
+        return np.ones(len(csr.indices), dtype=bool)
+    n = len(csr.indptr) - 1
+    rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(csr.indptr))
+    return rows <= csr.indices
+
+
+def _columns_sections(columns, order, prefix, sections, objects):
+    """Collect attribute columns, renumbered according to the new identifiers."""
+    np = _import_numpy()
+    metadata = []
+    for i, (key, column) in enumerate(columns.items()):
+        data = column.array()
+        values = np.full(len(order), column.default, dtype=column.dtype)
+        inside = order < len(data)
+        values[inside] = data[order[inside]]
+        name = "{}_column_{}".format(prefix, i)
+        if values.dtype.hasobject:
+            objects[name] = values
+        else:
+            sections[name] = np.ascontiguousarray(values)
+        metadata.append((key, column.dtype.str, column.default, name))
+    return metadata
+
+
+def _write_binary(graph, filename):
+    np = _import_numpy()
+
+    anyhashable = _is_anyhashable_graph(graph)
+    int_graph = graph._graph if anyhashable else graph
+    if not hasattr(int_graph, "to_csr"):
+        raise ValueError("Only graphs with integer vertices can be written as a snapshot")
+    graph_type = graph.type
+
+    csr, vertex_order = _dense_csr(int_graph)
+    stored = _stored_edges(csr, graph_type.directed)
+
+    sections = {"indptr": csr.indptr, "indices": csr.indices}
+    if graph_type.weighted:
+        sections["weights"] = csr.weights
+
+    if anyhashable:
+        edge_order = csr.edge_ids[stored]
+        objects = {
+            "vertices": [graph._vertex_id_to_hash[v] for v in vertex_order.tolist()],
+            "edges": [graph._edge_id_to_hash[e] for e in edge_order.tolist()],
+            "vertex_attrs": graph._vertex_hash_to_attrs,
+            "edge_attrs": graph._edge_hash_to_attrs,
+            "graph_attrs": graph._graph_attrs,
+        }
+        objects["vertex_columns"] = _columns_sections(
+            graph._vertex_attr_columns, vertex_order, "vertex", sections, objects
+        )
+        objects["edge_columns"] = _columns_sections(
+            graph._edge_attr_columns, edge_order, "edge", sections, objects
+        )
+        sections[_PICKLE] = pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # lay out the sections
+    descriptions = {}
+    offset = 0
+    for name, data in sections.items():
+        if name == _PICKLE:
+            descriptions[name] = {"offset": offset, "dtype": _PICKLE, "length": len(data)}
+            offset = _aligned(offset + len(data))
+        else:
+            data = sections[name] = np.asarray(data).astype(
+                np.asarray(data).dtype.newbyteorder("<"), copy=False
+            )
+            descriptions[name] = {
+                "offset": offset,
+                "dtype": data.dtype.str,
+                "length": len(data),
+            }
+            offset = _aligned(offset + data.nbytes)
+
+    header = {
+        "type": {
+            "directed": graph_type.directed,
+            "allowing_self_loops": graph_type.allowing_self_loops,
+            "allowing_multiple_edges": graph_type.allowing_multiple_edges,
+            "allowing_cycles": graph_type.allowing_cycles,
+            "weighted": graph_type.weighted,
+        },
+        "any_hashable": anyhashable,
+        "vertices": len(csr.indptr) - 1,
+        "edges": int(np.count_nonzero(stored)),
+        "sections": descriptions,
+    }
+    header = json.dumps(header).encode("utf-8")
+
+    with open(filename, "wb") as f:
+        f.write(_PREAMBLE.pack(_MAGIC, _VERSION, len(header)))
+        f.write(header)
+        data_offset = _aligned(_PREAMBLE.size + len(header))
+        f.write(bytes(data_offset - _PREAMBLE.size - len(header)))
+        for name, data in sections.items():
+            position = f.tell() - data_offset
+            f.write(bytes(descriptions[name]["offset"] - position))
+            f.write(data if name == _PICKLE else data.tobytes())
+
+
+def _read_binary(
+    filename,
+    kind="sparse",
+    incoming_edges_support=None,
+    vertex_supplier=None,
+    edge_supplier=None,
+):
+    if kind not in ("sparse", "succinct"):
+        raise ValueError("Unknown graph kind {}".format(kind))
+
+    with open(filename, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        return _create_from_snapshot(
+            buffer, kind, incoming_edges_support, vertex_supplier, edge_supplier
+        )
+    finally:
+        try:
+            buffer.close()
+        except BufferError:
+            # arrays still referenced from a traceback, released later
+            pass
+
+
+def _create_from_snapshot(
+    buffer, kind, incoming_edges_support, vertex_supplier, edge_supplier
+):
+    np = _import_numpy()
+
+    magic, version, header_length = _PREAMBLE.unpack_from(buffer, 0)
+    if magic != _MAGIC:
+        raise ValueError("Not a graph snapshot")
+    if version != _VERSION:
+        raise ValueError("Unsupported snapshot version {}".format(version))
+    header = json.loads(
+        buffer[_PREAMBLE.size : _PREAMBLE.size + header_length].decode("utf-8")
+    )
+    data_offset = _aligned(_PREAMBLE.size + header_length)
+    descriptions = header["sections"]
+
+    def section(name):
+        description = descriptions[name]
+        start = data_offset + description["offset"]
+        if description["dtype"] == _PICKLE:
+            return pickle.loads(buffer[start : start + description["length"]])
+        # arrays are views of the mapped file, converted only on big-endian machines
+        values = np.frombuffer(
+            buffer, dtype=description["dtype"], count=description["length"], offset=start
+        )
+        return values.astype(values.dtype.newbyteorder("="), copy=False)
+
+    directed = header["type"]["directed"]
+    weighted = header["type"]["weighted"]
+    anyhashable = header["any_hashable"]
+    num_of_vertices = header["vertices"]
+    indptr = section("indptr")
+    indices = section("indices")
+
+    if kind == "sparse":
+        if incoming_edges_support is None:
+            incoming_edges_support = IncomingEdgesSupport.LAZY_INCOMING_EDGES
+        int_graph = _create_sparse_int_graph(
+            num_of_vertices=num_of_vertices,
+            directed=directed,
+            weighted=weighted,
+            incoming_edges_support=incoming_edges_support,
+            csr=(indptr, indices, None, section("weights") if weighted else None),
+        )
+    else:
+        if anyhashable:
+            raise ValueError(
+                "Snapshots of any-hashable graphs can only be read as sparse graphs"
+            )
+        if incoming_edges_support is None:
+            incoming_edges_support = IncomingEdgesSupport.FULL_INCOMING_EDGES
+        rows = np.repeat(np.arange(num_of_vertices, dtype=np.int32), np.diff(indptr))
+        stored = slice(None) if directed else rows <= indices
+        int_graph = _create_succinct_int_graph(
+            num_of_vertices=num_of_vertices,
+            directed=directed,
+            incoming_edges_support=incoming_edges_support,
+            sources=np.ascontiguousarray(rows[stored]),
+            targets=np.ascontiguousarray(indices[stored]),
+        )
+
+    if not anyhashable:
+        return int_graph
+
+    objects = section(_PICKLE)
+    g = _AnyHashableGraph(
+        int_graph, vertex_supplier=vertex_supplier, edge_supplier=edge_supplier
+    )
+    for vid, vhash in enumerate(objects["vertices"]):
+        g._vertex_hash_to_id[vhash] = vid
+        g._vertex_id_to_hash[vid] = vhash
+    for eid, ehash in enumerate(objects["edges"]):
+        g._edge_hash_to_id[ehash] = eid
+        g._edge_id_to_hash[eid] = ehash
+    g._vertex_hash_to_attrs.update(objects["vertex_attrs"])
+    g._edge_hash_to_attrs.update(objects["edge_attrs"])
+    g._graph_attrs.update(objects["graph_attrs"])
+
+    for metadata, columns in [
+        (objects["vertex_columns"], g._vertex_attr_columns),
+        (objects["edge_columns"], g._edge_attr_columns),
+    ]:
+        for key, dtype, default, name in metadata:
+            column = _AttributeColumn(dtype, default)
+            column.assign(objects[name] if name in objects else section(name))
+            columns[key] = column
+
+    return g
+
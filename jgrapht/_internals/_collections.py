@@ -1,5 +1,7 @@
 from .. import backend
 
+from ._arrays import _zeros, _as_numpy, _as_int_buffer, _as_string_buffer
+
 from ._wrappers import (
     _HandleWrapper,
     _JGraphTString,
@@ -321,6 +323,28 @@ class _JGraphTIntegerDoubleMap(_HandleWrapper, Mapping):
         res = backend.jgrapht_map_int_double_get(self._handle, key)
         return res
 
+    def to_arrays(self):
+        """Export the map as two dense arrays of keys and values, using a
+        single backend call.
+
+        :returns: a tuple with an :py:class:`array.array` of keys (64-bit integers)
+          and an :py:class:`array.array` of values (doubles)
+        """
+        size = len(self)
+        keys = _zeros("q", size)
+        values = _zeros("d", size)
+        backend.jgrapht_map_int_double_to_arrays(self._handle, size, keys, values)
+        return keys, values
+
+    def to_numpy(self):
+        """Export the map as two numpy arrays of keys (int64) and values (float64).
+        The numpy arrays share memory with the arrays returned by :py:meth:`to_arrays`.
+
+        :returns: a tuple of numpy arrays
+        """
+        keys, values = self.to_arrays()
+        return _as_numpy(keys, "int64"), _as_numpy(values, "float64")
+
     def __repr__(self):
         return "_JGraphTIntegerDoubleMap(%r)" % self._handle
 
@@ -405,6 +429,28 @@ class _JGraphTIntegerIntegerMap(_HandleWrapper, Mapping):
         res = backend.jgrapht_map_int_int_get(self._handle, key)
         return res
 
+    def to_arrays(self):
+        """Export the map as two dense arrays of keys and values, using a
+        single backend call.
+
+        :returns: a tuple with an :py:class:`array.array` of keys (64-bit integers)
+          and an :py:class:`array.array` of values (32-bit integers)
+        """
+        size = len(self)
+        keys = _zeros("q", size)
+        values = _zeros("i", size)
+        backend.jgrapht_map_int_int_to_arrays(self._handle, size, keys, values)
+        return keys, values
+
+    def to_numpy(self):
+        """Export the map as two numpy arrays of keys (int64) and values (int32).
+        The numpy arrays share memory with the arrays returned by :py:meth:`to_arrays`.
+
+        :returns: a tuple of numpy arrays
+        """
+        keys, values = self.to_arrays()
+        return _as_numpy(keys, "int64"), _as_numpy(values, "int32")
+
     def __repr__(self):
         return "_JGraphTIntegerIntegerMap(%r)" % self._handle
 
@@ -484,6 +530,16 @@ class _JGraphTIntegerStringMap(_HandleWrapper, MutableMapping):
         encoded_value = bytearray(value, encoding="utf-8")
         backend.jgrapht_map_int_string_put(self._handle, key, encoded_value)
 
+    def put_all(self, keys, values):
+        """Put many items using a single backend call."""
+        keys = _as_int_buffer(keys)
+        offsets, encoded_values = _as_string_buffer(values)
+        if len(keys) != len(offsets):
+            raise ValueError("Keys and values must have the same length")
+        backend.jgrapht_map_int_string_put_all(
+            self._handle, len(offsets), keys, offsets, encoded_values
+        )
+
     def pop(self, key, defaultvalue=__marker):
         try:
             res = backend.jgrapht_map_int_string_remove(self._handle, key)
@@ -567,6 +623,28 @@ class _JGraphTLongIntegerMap(_HandleWrapper, Mapping):
         res = backend.jgrapht_map_long_int_get(self._handle, key)
         return res
 
+    def to_arrays(self):
+        """Export the map as two dense arrays of keys and values, using a
+        single backend call.
+
+        :returns: a tuple with an :py:class:`array.array` of keys (64-bit integers)
+          and an :py:class:`array.array` of values (32-bit integers)
+        """
+        size = len(self)
+        keys = _zeros("q", size)
+        values = _zeros("i", size)
+        backend.jgrapht_map_long_int_to_arrays(self._handle, size, keys, values)
+        return keys, values
+
+    def to_numpy(self):
+        """Export the map as two numpy arrays of keys (int64) and values (int32).
+        The numpy arrays share memory with the arrays returned by :py:meth:`to_arrays`.
+
+        :returns: a tuple of numpy arrays
+        """
+        keys, values = self.to_arrays()
+        return _as_numpy(keys, "int64"), _as_numpy(values, "int32")
+
     def __repr__(self):
         return "_JGraphTLongIntegerMap(%r)" % self._handle
 
@@ -652,6 +730,28 @@ class _JGraphTLongDoubleMap(_HandleWrapper, Mapping):
         res = backend.jgrapht_map_long_double_get(self._handle, key)
         return res
 
+    def to_arrays(self):
+        """Export the map as two dense arrays of keys and values, using a
+        single backend call.
+
+        :returns: a tuple with an :py:class:`array.array` of keys (64-bit integers)
+          and an :py:class:`array.array` of values (doubles)
+        """
+        size = len(self)
+        keys = _zeros("q", size)
+        values = _zeros("d", size)
+        backend.jgrapht_map_long_double_to_arrays(self._handle, size, keys, values)
+        return keys, values
+
+    def to_numpy(self):
+        """Export the map as two numpy arrays of keys (int64) and values (float64).
+        The numpy arrays share memory with the arrays returned by :py:meth:`to_arrays`.
+
+        :returns: a tuple of numpy arrays
+        """
+        keys, values = self.to_arrays()
+        return _as_numpy(keys, "int64"), _as_numpy(values, "float64")
+
     def __repr__(self):
         return "_JGraphTLongDoubleMap(%r)" % self._handle
 
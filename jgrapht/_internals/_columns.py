@@ -0,0 +1,82 @@
+from ._arrays import _import_numpy
+
+
+_INITIAL_CAPACITY = 16
+
+
+class _AttributeColumn:
+    """A typed attribute column indexed by internal identifier.
+
+    Values are kept in a numpy array which grows on demand. Identifiers without
+    an explicitly set value have the default value of the column.
+    """
+
+    def __init__(self, dtype, default):
+        np = _import_numpy()
+        self._default = default
+        self._data = np.full(_INITIAL_CAPACITY, default, dtype=dtype)
+        self._size = 0
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def default(self):
+        return self._default
+
+    def __getitem__(self, key):
+        if 0 <= key < self._size:
+            return self._data[key].item()
+        return self._default
+
+    def __setitem__(self, key, value):
+        if key < 0:
+            raise ValueError("Identifier {} cannot be stored in a column".format(key))
+        self._ensure_size(key + 1)
+        self._data[key] = value
+
+    def reset(self, key):
+        """Reset the value of an identifier to the default value."""
+        if 0 <= key < self._size:
+            self._data[key] = self._default
+
+    def array(self, size=0):
+        """Get a numpy view of the column, covering at least identifiers up to size-1.
+
+        The view shares memory with the column. It becomes detached if the column
+        later needs to grow, thus it must not be kept around.
+        """
+        self._ensure_size(size)
+        return self._data[: self._size]
+
+    def snapshot(self, size=0):
+        """Get a read-only copy of the column, covering at least identifiers up to
+        size-1."""
+        data = self.array(size).copy()
+        data.flags.writeable = False
+        return data
+
+    def assign(self, values):
+        """Replace the contents of the column with a copy of an array of values."""
+        np = _import_numpy()
+        values = np.asarray(values, dtype=self._data.dtype)
+        self._data = np.full(
+            max(len(values), _INITIAL_CAPACITY), self._default, dtype=values.dtype
+        )
+        self._data[: len(values)] = values
+        self._size = len(values)
+
+    def _ensure_size(self, size):
+        if size <= self._size:
+            return
+        if size > len(self._data):
+            np = _import_numpy()
+            capacity = max(size, 2 * len(self._data))
+            data = np.full(capacity, self._default, dtype=self._data.dtype)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+        self._size = size
+
+    def __repr__(self):
+        return "_AttributeColumn(%r)" % self._data[: self._size]
@@ -0,0 +1,100 @@
+from array import array
+from collections import namedtuple
+
+
+# Decoded graph6/sparse6 record. Vertices are 0 up to num_of_vertices-1 and the
+# undirected edges are given as two columns.
+_Graph6Record = namedtuple("Graph6Record", ["num_of_vertices", "sources", "targets"])
+
+# Each printable character carries six bits, most significant first
+_BITS = {c: format(c - 63, "06b") for c in range(63, 127)}
+
+_HEADERS = (b">>graph6<<", b">>sparse6<<")
+
+
+def _to_bits(data, record):
+    try:
+        return "".join([_BITS[c] for c in data])
+    except KeyError:
+        raise ValueError("Invalid graph6/sparse6 record {!r}".format(record))
+
+
+def _decode_size(data, record):
+    """Decode N(n) at the start of data, returning n and the rest of the data."""
+    if len(data) >= 1 and data[0] != 126:
+        return int(_to_bits(data[:1], record), 2), data[1:]
+    if len(data) >= 4 and data[1] != 126:
+        return int(_to_bits(data[1:4], record), 2), data[4:]
+    if len(data) >= 8:
+        return int(_to_bits(data[2:8], record), 2), data[8:]
+    raise ValueError("Invalid graph6/sparse6 record {!r}".format(record))
+
+
+def _decode_graph6(data, record):
+    n, data = _decode_size(data, record)
+    bits = _to_bits(data, record)
+    if len(bits) < n * (n - 1) // 2:
+        raise ValueError("Invalid graph6 record {!r}".format(record))
+
+    # the upper triangle of the adjacency matrix, column by column
+    sources = array("i")
+    targets = array("i")
+    start = 0
+    for j in range(1, n):
+        column = bits[start : start + j]
+        i = column.find("1")
+        while i >= 0:
+            sources.append(i)
+            targets.append(j)
+            i = column.find("1", i + 1)
+        start += j
+    return _Graph6Record(n, sources, targets)
+
+
+def _decode_sparse6(data, record):
+    n, data = _decode_size(data, record)
+    bits = _to_bits(data, record)
+    k = (n - 1).bit_length() if n > 1 else 0
+
+    sources = array("i")
+    targets = array("i")
+    v = 0
+    position = 0
+    while position + 1 + k <= len(bits):
+        if bits[position] == "1":
+            v += 1
+        x = int(bits[position + 1 : position + 1 + k], 2) if k > 0 else 0
+        position += 1 + k
+        if v >= n:
+            # padding at the end of the record
+            break
+        if x > v:
+            v = x
+        else:
+            sources.append(x)
+            targets.append(v)
+    return _Graph6Record(n, sources, targets)
+
+
+def _decode_graph6sparse6(line):
+    """Decode a single line in graph6 or sparse6 format.
+
+    :param line: the record as bytes, without the line terminator
+    :returns: a record with the number of vertices and the edges as columns
+    :raises ValueError: in case of an invalid record, or a digraph6 or incremental
+      sparse6 record which are not supported
+    """
+    for header in _HEADERS:
+        if line.startswith(header):
+            line = line[len(header) :]
+    if line.startswith(b":"):
+        return _decode_sparse6(line[1:], line)
+    if line.startswith(b";") or line.startswith(b"&"):
+        raise ValueError("Incremental sparse6 and digraph6 are not supported")
+    return _decode_graph6(line, line)
+
+
+def _decode_graph6sparse6_lines(lines):
+    """Decode a list of lines. Runs inside the workers of a pool, thus both the
+    input and the result are picklable."""
+    return [_decode_graph6sparse6(line) for line in lines]
@@ -0,0 +1,85 @@
+from collections.abc import MutableMapping
+
+
+# Marker of an empty slot
+_EMPTY = object()
+
+# Identifiers up to this distance past the end of the table are stored in the
+# table, larger ones in the overflow dictionary.
+_MIN_GROWTH = 1024
+
+
+class _IdToObjectMap(MutableMapping):
+    """A compact map from backend identifiers to python objects.
+
+    Backend identifiers of vertices and edges are dense non-negative integers.
+    The map is therefore a slot table, a list indexed by identifier, which costs
+    a single pointer per element instead of a full dictionary entry. Removals
+    leave an empty slot behind, which is reused when the backend hands out the same
+    identifier again. Empty slots at the end of the table are released.
+
+    Identifiers which would make the table grow too much at once, such as negative
+    or very large ones, are kept in a plain dictionary. Such an identifier stays in
+    the dictionary even if the table later grows past it.
+    """
+
+    def __init__(self, items=None):
+        self._slots = []
+        self._size = 0
+        self._overflow = {}
+        if items is not None:
+            self.update(items)
+
+    def __getitem__(self, key):
+        if 0 <= key < len(self._slots):
+            value = self._slots[key]
+            if value is not _EMPTY:
+                return value
+        return self._overflow[key]
+
+    def __setitem__(self, key, value):
+        slots = self._slots
+        if key in self._overflow:
+            self._overflow[key] = value
+        elif 0 <= key < len(slots):
+            if slots[key] is _EMPTY:
+                self._size += 1
+            slots[key] = value
+        elif 0 <= key <= 2 * len(slots) + _MIN_GROWTH:
+            slots.extend([_EMPTY] * (key - len(slots)))
+            slots.append(value)
+            self._size += 1
+        else:
+            self._overflow[key] = value
+
+    def __delitem__(self, key):
+        slots = self._slots
+        if 0 <= key < len(slots) and slots[key] is not _EMPTY:
+            slots[key] = _EMPTY
+            self._size -= 1
+            while slots and slots[-1] is _EMPTY:
+                slots.pop()
+        else:
+            del self._overflow[key]
+
+    def __contains__(self, key):
+        if 0 <= key < len(self._slots) and self._slots[key] is not _EMPTY:
+            return True
+        return key in self._overflow
+
+    def __len__(self):
+        return self._size + len(self._overflow)
+
+    @property
+    def table_size(self):
+        """All identifiers stored in the slot table are smaller than this value."""
+        return len(self._slots)
+
+    def __iter__(self):
+        for key, value in enumerate(self._slots):
+            if value is not _EMPTY:
+                yield key
+        yield from self._overflow
+
+    def __repr__(self):
+        return "_IdToObjectMap(%r)" % dict(self.items())
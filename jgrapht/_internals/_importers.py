@@ -1,13 +1,48 @@
-from collections import defaultdict
+from collections.abc import MutableMapping
 
 from .. import backend as _backend
 
+from ._attributes import _JGraphTAttributeTable
+
 from ._ioutils import _create_wrapped_import_integer_id_callback
 from ._ioutils import _create_wrapped_import_string_id_callback
 from ._ioutils import _create_wrapped_attribute_callback
 from ._ioutils import _create_wrapped_notify_id_callback
 
 
+def _create_attribute_callback(attribute_cb, edges=False, skip_keys=()):
+    """Create an attribute callback for the importers.
+
+    A dictionary instead of a function means that the attributes are collected
+    natively into an attribute table, which is copied into the dictionary after
+    the import using :py:func:`_copy_collected_attributes`.
+    """
+    if isinstance(attribute_cb, (MutableMapping, _JGraphTAttributeTable)):
+        table = attribute_cb
+        if not isinstance(table, _JGraphTAttributeTable):
+            table = _JGraphTAttributeTable(edges=edges)
+        return table.bind(skip_keys=skip_keys), table
+    return _create_wrapped_attribute_callback(attribute_cb)
+
+
+def _unbind_attribute_tables(*attribute_fs):
+    """Unbind the attribute tables of an import, even if the import failed."""
+    for attribute_f in attribute_fs:
+        if isinstance(attribute_f, _JGraphTAttributeTable):
+            attribute_f.unbind()
+
+
+def _copy_collected_attributes(attribute_cb, attribute_f):
+    """Copy the attributes collected by an import into the user dictionary."""
+    if isinstance(attribute_cb, MutableMapping):
+        for id, attrs in attribute_f.items():
+            element_attrs = attribute_cb.get(id)
+            if element_attrs is None:
+                attribute_cb[id] = attrs
+            else:
+                element_attrs.update(attrs)
+
+
 def _create_graph_callbacks(
     import_id_cb,
     vertex_attribute_cb,
@@ -24,11 +59,11 @@ def _create_graph_callbacks(
         import_id_f_ptr, import_id_f = _create_wrapped_import_string_id_callback(
             import_id_cb
         )
-    vertex_attribute_f_ptr, vertex_attribute_f = _create_wrapped_attribute_callback(
+    vertex_attribute_f_ptr, vertex_attribute_f = _create_attribute_callback(
         vertex_attribute_cb
     )
-    edge_attribute_f_ptr, edge_attribute_f = _create_wrapped_attribute_callback(
-        edge_attribute_cb
+    edge_attribute_f_ptr, edge_attribute_f = _create_attribute_callback(
+        edge_attribute_cb, edges=True
     )
     vertex_notify_f_ptr, vertex_notify_f = _create_wrapped_notify_id_callback(
         vertex_notify_id_cb
@@ -51,23 +86,84 @@ def _create_graph_callbacks(
     )
 
 
+class _AnyHashableImportTarget:
+    """The destination of an import into an any-hashable graph.
+
+    New vertices and edges are written directly into the maps of the graph while the
+    backend reports them, instead of being staged in temporary dictionaries. Attributes
+    are collected natively by the backend and written into the graph after the import
+    in a single pass.
+
+    Exceptions cannot propagate through the backend callbacks, thus the first one is
+    kept and raised when the import finishes.
+    """
+
+    def __init__(self, graph, attributes=True):
+        self.graph = graph
+        if attributes:
+            self.vertex_attrs = _JGraphTAttributeTable()
+            self.edge_attrs = _JGraphTAttributeTable(edges=True)
+        else:
+            self.vertex_attrs = None
+            self.edge_attrs = None
+        self._error = None
+
+    def add_vertex(self, vid, vertex=None):
+        try:
+            self.graph._add_new_vertex(vid, vertex)
+        except Exception as e:
+            self.failed(e)
+
+    def add_edge(self, eid, edge=None):
+        try:
+            self.graph._add_new_edge(eid, edge)
+        except Exception as e:
+            self.failed(e)
+
+    def failed(self, error):
+        if self._error is None:
+            self._error = error
+
+    def finish(self):
+        """Raise any error which happened during the import and copy the attributes
+        into the graph."""
+        if self._error is not None:
+            raise self._error
+        if self.vertex_attrs is not None:
+            self._copy_attributes(
+                self.vertex_attrs,
+                self.graph._vertex_id_to_hash,
+                self.graph.vertex_attrs,
+            )
+        if self.edge_attrs is not None:
+            self._copy_attributes(
+                self.edge_attrs, self.graph._edge_id_to_hash, self.graph.edge_attrs
+            )
+
+    @staticmethod
+    def _copy_attributes(table, id_to_hash, graph_attrs):
+        # entries of the same element are usually consecutive
+        current_id = None
+        attrs = None
+        for id, key, value in table.iter_attributes():
+            if id != current_id:
+                current_id = id
+                attrs = graph_attrs[id_to_hash[id]] if id in id_to_hash else None
+            if attrs is not None:
+                attrs[key] = value
+
+
 def _create_anyhashable_graph_callbacks(
-    graph,
-    vertex_id_to_hash,
-    vertex_id_to_attrs,
-    edge_id_to_hash,
-    edge_id_to_attrs,
-    import_id_cb,
-    integer_ids=False,
-    include_weights=False,
+    target, import_id_cb, integer_ids=False, include_weights=False,
 ):
+    graph = target.graph
     next_vertex_id = max(graph._graph.vertices, default=-1) + 1
 
     if import_id_cb is None:
         use_import_id_cb = None
 
         def use_vertex_notify_id_cb(vid):
-            vertex_id_to_hash[vid] = graph.vertex_supplier()
+            target.add_vertex(vid)
 
     else:
 
@@ -76,20 +172,18 @@ def _create_anyhashable_graph_callbacks(
             nonlocal next_vertex_id
             new_vertex = next_vertex_id
             next_vertex_id += 1
-            vertex_id_to_hash[new_vertex] = import_id_cb(id_from_file)
+            try:
+                vertex = import_id_cb(id_from_file)
+            except Exception as e:
+                target.failed(e)
+            else:
+                target.add_vertex(new_vertex, vertex)
             return new_vertex
 
         use_vertex_notify_id_cb = None
 
     def use_edge_notify_id_cb(eid):
-        edge_id_to_hash[eid] = graph.edge_supplier()
-
-    def use_vertex_attribute_cb(id, key, value):
-        vertex_id_to_attrs[id][key] = value
-
-    def use_edge_attribute_cb(id, key, value):
-        if key != "weight" or include_weights:
-            edge_id_to_attrs[id][key] = value
+        target.add_edge(eid)
 
     if integer_ids:
         import_id_f_ptr, import_id_f = _create_wrapped_import_integer_id_callback(
@@ -100,11 +194,13 @@ def _create_anyhashable_graph_callbacks(
             use_import_id_cb
         )
 
-    vertex_attribute_f_ptr, vertex_attribute_f = _create_wrapped_attribute_callback(
-        use_vertex_attribute_cb
+    vertex_attribute_f_ptr, vertex_attribute_f = _create_attribute_callback(
+        target.vertex_attrs
     )
-    edge_attribute_f_ptr, edge_attribute_f = _create_wrapped_attribute_callback(
-        use_edge_attribute_cb
+    edge_attribute_f_ptr, edge_attribute_f = _create_attribute_callback(
+        target.edge_attrs,
+        edges=True,
+        skip_keys=() if include_weights else ("weight",),
     )
     vertex_notify_f_ptr, vertex_notify_f = _create_wrapped_notify_id_callback(
         use_vertex_notify_id_cb
@@ -127,21 +223,6 @@ def _create_anyhashable_graph_callbacks(
     )
 
 
-def _populate_anyhashable(
-    graph, vertex_id_to_hash, vertex_id_to_attrs, edge_id_to_hash, edge_id_to_attrs
-):
-    # After creating, populate the any-hashable graph with the new vertices and edges
-    for vid, vhash in vertex_id_to_hash.items():
-        graph._add_new_vertex(vid, vhash)
-        for key, value in vertex_id_to_attrs[vid].items():
-            graph.vertex_attrs[vhash][key] = value
-
-    for eid, ehash in edge_id_to_hash.items():
-        graph._add_new_edge(eid, ehash)
-        for key, value in edge_id_to_attrs[eid].items():
-            graph.edge_attrs[ehash][key] = value
-
-
 def _parse_graph_dimacs(
     graph, input, import_id_cb=None, input_is_filename=False,
 ):
@@ -184,7 +265,7 @@ def _parse_graph_dimacs(
 def _parse_anyhashable_graph_dimacs(
     graph, input_string, import_id_cb, input_is_filename=False
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph, attributes=False)
 
     (
         import_id_f_ptr,
@@ -198,7 +279,7 @@ def _parse_anyhashable_graph_dimacs(
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
     ) = _create_anyhashable_graph_callbacks(
-        graph, *idmaps, import_id_cb, integer_ids=True
+        target, import_id_cb, integer_ids=True
     )
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
@@ -216,7 +297,7 @@ def _parse_anyhashable_graph_dimacs(
         edge_notify_f_ptr,
     )
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 def _parse_graph_gml(
@@ -254,21 +335,27 @@ def _parse_graph_gml(
     else:
         backend_function = _backend.jgrapht_ii_import_string_gml
 
-    backend_function(
-        graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
+
+    _copy_collected_attributes(vertex_attribute_cb, vertex_attribute_f)
+    _copy_collected_attributes(edge_attribute_cb, edge_attribute_f)
 
 
 def _parse_anyhashable_graph_gml(
     graph, input_string, import_id_cb, input_is_filename=False,
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph)
 
     (
         import_id_f_ptr,
@@ -282,7 +369,7 @@ def _parse_anyhashable_graph_gml(
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
     ) = _create_anyhashable_graph_callbacks(
-        graph, *idmaps, import_id_cb, integer_ids=True
+        target, import_id_cb, integer_ids=True
     )
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
@@ -292,17 +379,20 @@ def _parse_anyhashable_graph_gml(
     else:
         backend_function = _backend.jgrapht_ii_import_string_gml
 
-    backend_function(
-        graph._graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph._graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 def _parse_graph_json(
@@ -339,21 +429,27 @@ def _parse_graph_json(
     else:
         backend_function = _backend.jgrapht_ii_import_string_json
 
-    backend_function(
-        graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
+
+    _copy_collected_attributes(vertex_attribute_cb, vertex_attribute_f)
+    _copy_collected_attributes(edge_attribute_cb, edge_attribute_f)
 
 
 def _parse_anyhashable_graph_json(
     graph, input_string, import_id_cb, input_is_filename=False
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph)
 
     (
         import_id_f_ptr,
@@ -366,7 +462,7 @@ def _parse_anyhashable_graph_json(
         vertex_notify_f,  # pylint: disable=unused-variable
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
-    ) = _create_anyhashable_graph_callbacks(graph, *idmaps, import_id_cb,)
+    ) = _create_anyhashable_graph_callbacks(target, import_id_cb,)
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
 
@@ -375,17 +471,20 @@ def _parse_anyhashable_graph_json(
     else:
         backend_function = _backend.jgrapht_ii_import_string_json
 
-    backend_function(
-        graph._graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph._graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 CSV_FORMATS = dict(
@@ -456,7 +555,7 @@ def _parse_anyhashable_graph_csv(
     matrix_format_zero_when_noedge=True,
     input_is_filename=False,
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph, attributes=False)
 
     (
         import_id_f_ptr,
@@ -469,7 +568,7 @@ def _parse_anyhashable_graph_csv(
         vertex_notify_f,  # pylint: disable=unused-variable
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
-    ) = _create_anyhashable_graph_callbacks(graph, *idmaps, import_id_cb)
+    ) = _create_anyhashable_graph_callbacks(target, import_id_cb)
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
 
@@ -490,7 +589,7 @@ def _parse_anyhashable_graph_csv(
         matrix_format_zero_when_noedge,
     )
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 def _parse_graph_gexf(
@@ -528,22 +627,28 @@ def _parse_graph_gexf(
     else:
         backend_function = _backend.jgrapht_ii_import_string_gexf
 
-    backend_function(
-        graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        validate_schema,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            validate_schema,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
+
+    _copy_collected_attributes(vertex_attribute_cb, vertex_attribute_f)
+    _copy_collected_attributes(edge_attribute_cb, edge_attribute_f)
 
 
 def _parse_anyhashable_graph_gexf(
     graph, input_string, import_id_cb, input_is_filename=False, validate_schema=True,
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph)
 
     (
         import_id_f_ptr,
@@ -556,7 +661,7 @@ def _parse_anyhashable_graph_gexf(
         vertex_notify_f,  # pylint: disable=unused-variable
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
-    ) = _create_anyhashable_graph_callbacks(graph, *idmaps, import_id_cb)
+    ) = _create_anyhashable_graph_callbacks(target, import_id_cb)
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
 
@@ -565,18 +670,21 @@ def _parse_anyhashable_graph_gexf(
     else:
         backend_function = _backend.jgrapht_ii_import_string_gexf
 
-    backend_function(
-        graph._graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        validate_schema,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph._graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            validate_schema,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 def _parse_graph_dot(
@@ -613,21 +721,27 @@ def _parse_graph_dot(
     else:
         backend_function = _backend.jgrapht_ii_import_string_dot
 
-    backend_function(
-        graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
+
+    _copy_collected_attributes(vertex_attribute_cb, vertex_attribute_f)
+    _copy_collected_attributes(edge_attribute_cb, edge_attribute_f)
 
 
 def _parse_anyhashable_graph_dot(
     graph, input_string, import_id_cb, input_is_filename=False,
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph)
 
     (
         import_id_f_ptr,
@@ -640,7 +754,7 @@ def _parse_anyhashable_graph_dot(
         vertex_notify_f,  # pylint: disable=unused-variable
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
-    ) = _create_anyhashable_graph_callbacks(graph, *idmaps, import_id_cb)
+    ) = _create_anyhashable_graph_callbacks(target, import_id_cb)
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
 
@@ -649,17 +763,20 @@ def _parse_anyhashable_graph_dot(
     else:
         backend_function = _backend.jgrapht_ii_import_string_dot
 
-    backend_function(
-        graph._graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph._graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 def _parse_graph_graph6sparse6(
@@ -696,21 +813,27 @@ def _parse_graph_graph6sparse6(
     else:
         backend_function = _backend.jgrapht_ii_import_string_graph6sparse6
 
-    backend_function(
-        graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
+
+    _copy_collected_attributes(vertex_attribute_cb, vertex_attribute_f)
+    _copy_collected_attributes(edge_attribute_cb, edge_attribute_f)
 
 
 def _parse_anyhashable_graph_graph6sparse6(
     graph, input_string, import_id_cb, input_is_filename=False,
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph)
 
     (
         import_id_f_ptr,
@@ -723,7 +846,7 @@ def _parse_anyhashable_graph_graph6sparse6(
         vertex_notify_f,  # pylint: disable=unused-variable
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
-    ) = _create_anyhashable_graph_callbacks(graph, *idmaps, import_id_cb)
+    ) = _create_anyhashable_graph_callbacks(target, import_id_cb)
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
 
@@ -732,17 +855,20 @@ def _parse_anyhashable_graph_graph6sparse6(
     else:
         backend_function = _backend.jgrapht_ii_import_string_graph6sparse6
 
-    backend_function(
-        graph._graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph._graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
 
 
 def _parse_graph_graphml(
@@ -787,16 +913,22 @@ def _parse_graph_graphml(
         else:
             backend_function = _backend.jgrapht_ii_import_string_graphml
 
-    backend_function(
-        graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        validate_schema,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            validate_schema,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
+
+    _copy_collected_attributes(vertex_attribute_cb, vertex_attribute_f)
+    _copy_collected_attributes(edge_attribute_cb, edge_attribute_f)
 
 
 def _parse_anyhashable_graph_graphml(
@@ -807,7 +939,7 @@ def _parse_anyhashable_graph_graphml(
     validate_schema=True,
     simple=True,
 ):
-    idmaps = ({}, defaultdict(lambda: {}), {}, defaultdict(lambda: {}))
+    target = _AnyHashableImportTarget(graph)
 
     (
         import_id_f_ptr,
@@ -820,7 +952,7 @@ def _parse_anyhashable_graph_graphml(
         vertex_notify_f,  # pylint: disable=unused-variable
         edge_notify_f_ptr,
         edge_notify_f,  # pylint: disable=unused-variable
-    ) = _create_anyhashable_graph_callbacks(graph, *idmaps, import_id_cb)
+    ) = _create_anyhashable_graph_callbacks(target, import_id_cb)
 
     string_as_bytearray = bytearray(input_string, encoding="utf-8")
 
@@ -835,15 +967,18 @@ def _parse_anyhashable_graph_graphml(
         else:
             backend_function = _backend.jgrapht_ii_import_string_graphml
 
-    backend_function(
-        graph._graph.handle,
-        string_as_bytearray,
-        import_id_f_ptr,
-        validate_schema,
-        vertex_attribute_f_ptr,
-        edge_attribute_f_ptr,
-        vertex_notify_f_ptr,
-        edge_notify_f_ptr,
-    )
+    try:
+        backend_function(
+            graph._graph.handle,
+            string_as_bytearray,
+            import_id_f_ptr,
+            validate_schema,
+            vertex_attribute_f_ptr,
+            edge_attribute_f_ptr,
+            vertex_notify_f_ptr,
+            edge_notify_f_ptr,
+        )
+    finally:
+        _unbind_attribute_tables(vertex_attribute_f, edge_attribute_f)
 
-    _populate_anyhashable(graph, *idmaps)
+    target.finish()
@@ -1,9 +1,19 @@
 from .. import backend
 from ..types import Graph, GraphType, DirectedAcyclicGraph, IncomingEdgesSupport
 
+from array import array
+from collections import namedtuple
 from collections.abc import Set
 
 from ._wrappers import _HandleWrapper
+from ._arrays import (
+    _as_int_buffer,
+    _as_double_buffer,
+    _as_numpy,
+    _buffers_length,
+    _import_numpy,
+    _zeros,
+)
 from ._collections import (
     _JGraphTIntegerIterator,
     _JGraphTIntegerSet,
@@ -11,6 +21,9 @@ from ._collections import (
 )
 
 
+_CSR = namedtuple("CSR", ["indptr", "indices", "edge_ids", "weights"])
+
+
 class _JGraphTIntegerGraph(_HandleWrapper, Graph):
     """The int graph implementation. This implementation always uses integers
     for the vertices and the edges of the graph. All operations are delegated to
@@ -71,11 +84,85 @@ class _JGraphTIntegerGraph(_HandleWrapper, Graph):
             self.set_edge_weight(edge, weight)
         return edge
 
+    def add_edges_from(self, edges=None, sources=None, targets=None, weights=None):
+        """Add edges to the graph.
+
+        Edges are either given as an iterable of tuples, or as parallel columns of
+        sources, targets and optional weights. Columns can be any objects supporting
+        the buffer protocol, such as :py:class:`array.array` or numpy arrays, and
+        are inserted using a single backend call. If any of the column edges cannot be
+        added, none of them is.
+
+        :param edges: any iterable of edges. Each edge is (u, v, weight, id) where possibly
+          weight and id are missing.
+        :param sources: the edge sources, used when edges is None
+        :param targets: the edge targets, used when edges is None
+        :param weights: optional edge weights, used when edges is None
+        :returns: list of added edge identifiers, or a buffer of added edge identifiers
+          if columns were given
+        """
+        if edges is not None:
+            if sources is not None or targets is not None or weights is not None:
+                raise ValueError("Provide either edges or sources and targets")
+            return super().add_edges_from(edges)
+
+        if sources is None or targets is None:
+            raise ValueError("Both sources and targets are required")
+
+        sources = _as_int_buffer(sources)
+        targets = _as_int_buffer(targets)
+        if weights is not None:
+            weights = _as_double_buffer(weights)
+        count = _buffers_length(sources, targets, weights)
+
+        result = _zeros("i", count)
+        backend.jgrapht_ii_graph_add_edges(
+            self._handle, count, sources, targets, weights, result
+        )
+        return result
+
     def remove_edge(self, e):
         if e is None:
             raise ValueError("Edge cannot be None")
         return backend.jgrapht_xi_graph_remove_edge(self._handle, e)
 
+    def to_csr(self):
+        """Export the graph in CSR (compressed-sparse-rows) format.
+
+        The vertices of the graph must be exactly :math:`0` up to :math:`n-1`. Row :math:`u`
+        contains the outgoing edges of vertex :math:`u` at positions ``indptr[u]`` up to
+        ``indptr[u+1]`` of the other arrays. Undirected graphs store each edge in the rows of
+        both of its endpoints. The whole snapshot is produced using a single backend call.
+
+        :returns: a named tuple (indptr, indices, edge_ids, weights) of numpy arrays, where
+          indices contains the opposite endpoint of each edge
+        :raises ValueError: if the vertices are not :math:`0` up to :math:`n-1`
+        """
+        _import_numpy()
+
+        num_of_vertices = len(self.vertices)
+        capacity = len(self.edges)
+        if not self._type.directed:
+            capacity *= 2
+
+        indptr = _zeros("i", num_of_vertices + 1)
+        indices = _zeros("i", capacity)
+        edge_ids = _zeros("i", capacity)
+        weights = _zeros("d", capacity)
+        count = backend.jgrapht_ii_graph_to_csr(
+            self._handle, num_of_vertices, capacity, indptr, indices, edge_ids, weights
+        )
+        del indices[count:]
+        del edge_ids[count:]
+        del weights[count:]
+
+        return _CSR(
+            indptr=_as_numpy(indptr, "int32"),
+            indices=_as_numpy(indices, "int32"),
+            edge_ids=_as_numpy(edge_ids, "int32"),
+            weights=_as_numpy(weights, "float64"),
+        )
+
     def contains_edge(self, e):
         return backend.jgrapht_xi_graph_contains_edge(self._handle, e)
 
@@ -238,11 +325,15 @@ def _create_int_graph(
 
 
 def _create_sparse_int_graph(
-    edgelist,
+    edgelist=None,
     num_of_vertices=None,
     directed=True,
     weighted=True,
     incoming_edges_support=IncomingEdgesSupport.LAZY_INCOMING_EDGES,
+    csr=None,
+    sources=None,
+    targets=None,
+    weights=None,
 ):
     """Create a sparse graph with integer vertices/edges.
 
@@ -259,65 +350,150 @@ def _create_sparse_int_graph(
 
     Sparse graphs can always support self-loops and multiple-edges.
 
+    Edges are either given as an edgelist, or as parallel columns of sources, targets and
+    optional weights. Columns can be any objects supporting the buffer protocol, such as
+    :py:class:`array.array` or numpy arrays, and are handed to the backend using a single
+    call.
+
     :param edgelist: list of tuple (u,v) or (u,v,weight) for weighted graphs
     :param num_of_vertices: number of vertices in the graph. Vertices always start from 0
-      and increase continuously. If not explicitly given the edgelist will be traversed in
-      order to find out the number of vertices
+      and increase continuously. If not explicitly given the edges will be traversed by the
+      backend in order to find out the number of vertices
     :param directed: whether the graph will be directed or undirected
     :param weighted: whether the graph will be weighted or not
     :param incoming_edges_support: full, lazy constructed or no support for incoming edges
+    :param csr: a tuple (indptr, indices, edge_ids, weights) as returned by
+      :py:meth:`to_csr`, used instead of the edgelist. Edge identifiers are ignored and
+      weights must be given only for weighted graphs
+    :param sources: the edge sources, used when edgelist is None
+    :param targets: the edge targets, used when edgelist is None
+    :param weights: optional edge weights, used when edgelist is None
     :returns: a graph
     :rtype: :class:`~jgrapht.types.Graph`
     """
-    track_num_vertices = num_of_vertices is None
+    if csr is not None:
+        if edgelist is not None:
+            raise ValueError("Provide either edgelist or csr")
+        return _create_sparse_int_graph_from_csr(
+            csr, num_of_vertices, directed, weighted, incoming_edges_support
+        )
 
     if weighted and isinstance(edgelist, _JGraphTEdgeTripleList):
         # Special case for internal edge list, created using the edgelist
         # importers. This avoids copying.
-        e_list_owner = False
-        e_list = edgelist.handle
+        if sources is not None or targets is not None or weights is not None:
+            raise ValueError("Provide either edgelist or sources and targets")
+        if num_of_vertices is None:
+            num_of_vertices = backend.jgrapht_ii_list_edge_triple_num_vertices(
+                edgelist.handle
+            )
+        handle = backend.jgrapht_ii_graph_sparse_create(
+            directed,
+            weighted,
+            num_of_vertices,
+            edgelist.handle,
+            incoming_edges_support.value,
+        )
+        return _JGraphTIntegerGraph(handle)
 
-        if track_num_vertices:
-            num_of_vertices = 0
-            for u, v, *w in edgelist:
-                num_of_vertices = max(u, v, num_of_vertices)
-            num_of_vertices += 1
-    else:
-        e_list_owner = True
-        e_list = backend.jgrapht_list_create()
+    sources, targets, weights = _edge_columns(
+        edgelist, sources, targets, weights, weighted
+    )
+    count = _buffers_length(sources, targets, weights)
+    if num_of_vertices is None and edgelist is not None and count == 0:
+        # an empty edgelist results in a graph with a single vertex
+        num_of_vertices = 1
 
-        if track_num_vertices:
-            num_of_vertices = 0
+    handle = backend.jgrapht_ii_graph_sparse_create_from_arrays(
+        directed,
+        weighted,
+        -1 if num_of_vertices is None else num_of_vertices,
+        count,
+        sources,
+        targets,
+        weights,
+        incoming_edges_support.value,
+    )
+    return _JGraphTIntegerGraph(handle)
 
+
+def _edge_columns(edgelist, sources, targets, weights, weighted):
+    """Get the edges either from an edgelist or from columns, as buffers which can
+    be handed to the backend in a single call. Weights are None if not weighted.
+    """
+    if edgelist is not None:
+        if sources is not None or targets is not None or weights is not None:
+            raise ValueError("Provide either edgelist or sources and targets")
+        sources = array("i")
+        targets = array("i")
         if weighted:
+            weights = array("d")
             for u, v, w in edgelist:
-                backend.jgrapht_ii_list_edge_triple_add(e_list, u, v, w)
-                if track_num_vertices:
-                    num_of_vertices = max(u, v, num_of_vertices)
+                sources.append(u)
+                targets.append(v)
+                weights.append(w)
         else:
             for u, v, *w in edgelist:
-                backend.jgrapht_ii_list_edge_pair_add(e_list, u, v)
-                if track_num_vertices:
-                    num_of_vertices = max(u, v, num_of_vertices)
+                sources.append(u)
+                targets.append(v)
+        return sources, targets, weights
 
-        if track_num_vertices:
-            num_of_vertices += 1
+    if sources is None or targets is None:
+        raise ValueError("Both sources and targets are required")
 
-    handle = backend.jgrapht_ii_graph_sparse_create(
-        directed, weighted, num_of_vertices, e_list, incoming_edges_support.value
-    )
+    sources = _as_int_buffer(sources)
+    targets = _as_int_buffer(targets)
+    if weighted and weights is not None:
+        weights = _as_double_buffer(weights)
+    else:
+        weights = None
+    return sources, targets, weights
 
-    if e_list_owner:
-        backend.jgrapht_handles_destroy(e_list)
 
+def _create_sparse_int_graph_from_csr(
+    csr, num_of_vertices, directed, weighted, incoming_edges_support
+):
+    """Create a sparse graph from a graph in CSR format, using a single backend call."""
+    indptr, indices, _, weights = csr
+    indptr = _as_int_buffer(indptr)
+    indices = _as_int_buffer(indices)
+    if not weighted:
+        weights = None
+    elif weights is None:
+        raise ValueError("Weights are required for weighted graphs")
+    else:
+        weights = _as_double_buffer(weights)
+    count = _buffers_length(indices, weights)
+
+    if len(indptr) == 0 or indptr[0] != 0 or indptr[-1] != count:
+        raise ValueError("Invalid CSR index pointer")
+    if any(start > end for start, end in zip(indptr, indptr[1:])):
+        raise ValueError("CSR index pointer must be non-decreasing")
+    if num_of_vertices is None:
+        num_of_vertices = len(indptr) - 1
+    elif num_of_vertices != len(indptr) - 1:
+        raise ValueError("Number of vertices does not match the CSR index pointer")
+
+    handle = backend.jgrapht_ii_graph_sparse_create_from_csr(
+        directed,
+        weighted,
+        num_of_vertices,
+        count,
+        indptr,
+        indices,
+        weights,
+        incoming_edges_support.value,
+    )
     return _JGraphTIntegerGraph(handle)
 
 
 def _create_succinct_int_graph(
-    edgelist,
+    edgelist=None,
     num_of_vertices=None,
     directed=True,
     incoming_edges_support=IncomingEdgesSupport.FULL_INCOMING_EDGES,
+    sources=None,
+    targets=None,
 ):
     """Create a succinct graph with integer vertices/edges.
 
@@ -330,36 +506,36 @@ def _create_succinct_int_graph(
 
     Succinct graphs support self-loops but not multiple-edges. They do not support edge weights.
 
+    Edges are either given as an edgelist, or as parallel columns of sources and targets.
+    Columns can be any objects supporting the buffer protocol, such as
+    :py:class:`array.array` or numpy arrays, and are handed to the backend using a single
+    call.
+
     :param edgelist: list of tuple (u,v)
     :param num_of_vertices: number of vertices in the graph. Vertices always start from 0
-      and increase continuously. If not explicitly given the edgelist will be traversed in
-      order to find out the number of vertices
+      and increase continuously. If not explicitly given the edges will be traversed by the
+      backend in order to find out the number of vertices
     :param directed: whether the graph will be directed or undirected
     :param incoming_edges_support: full, lazy constructed or no support for incoming edges
+    :param sources: the edge sources, used when edgelist is None
+    :param targets: the edge targets, used when edgelist is None
     :returns: a graph
     :rtype: :class:`~jgrapht.types.Graph`
     """
-    track_num_vertices = num_of_vertices is None
-
-    e_list = backend.jgrapht_list_create()
-
-    if track_num_vertices:
-        num_of_vertices = 0
-
-    for u, v, *w in edgelist:
-        backend.jgrapht_ii_list_edge_pair_add(e_list, u, v)
-        if track_num_vertices:
-            num_of_vertices = max(u, v, num_of_vertices)
-
-    if track_num_vertices:
-        num_of_vertices += 1
-
-    handle = backend.jgrapht_ii_graph_succinct_create(
-        directed, num_of_vertices, e_list, incoming_edges_support.value
+    sources, targets, _ = _edge_columns(edgelist, sources, targets, None, False)
+    count = _buffers_length(sources, targets)
+    if num_of_vertices is None and edgelist is not None and count == 0:
+        # an empty edgelist results in a graph with a single vertex
+        num_of_vertices = 1
+
+    handle = backend.jgrapht_ii_graph_succinct_create_from_arrays(
+        directed,
+        -1 if num_of_vertices is None else num_of_vertices,
+        count,
+        sources,
+        targets,
+        incoming_edges_support.value,
     )
-
-    backend.jgrapht_handles_destroy(e_list)
-
     return _JGraphTIntegerGraph(handle)
 
 
@@ -1,4 +1,12 @@
+import bz2
 import ctypes
+import errno
+import gzip
+import lzma
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
 
 from ._callbacks import _create_wrapped_callback
 
@@ -75,3 +83,201 @@ def _create_wrapped_notify_id_callback(callback, id_type=ctypes.c_int):
         return _create_wrapped_callback(callback, callback_ctype)
     else:
         return (0, None)
+
+
+# Size of the chunks in which file objects are copied for the importers
+_INPUT_CHUNK_SIZE = 1024 * 1024
+
+# Compression of files, by extension
+_COMPRESSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+
+
+def _import_zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Zstandard required")
+    return zstandard
+
+
+def _compression_of(file):
+    """Get the compression of a filename from its extension, or None."""
+    if not isinstance(file, (str, os.PathLike)):
+        return None
+    _, extension = os.path.splitext(os.fspath(file))
+    return _COMPRESSIONS.get(extension.lower())
+
+
+def _check_compression(compression):
+    if compression is not None and compression not in _COMPRESSIONS.values():
+        raise ValueError("Unknown compression {}".format(compression))
+
+
+def _open_file(filename, mode, compression=None):
+    """Open a file in binary mode. Compressed files are transparently decompressed
+    when reading and compressed when writing.
+
+    :param filename: the filename
+    :param mode: either "rb" or "wb"
+    :param compression: the compression to use. If None it is deduced from the
+      extension of the filename.
+    """
+    _check_compression(compression)
+    if compression is None:
+        compression = _compression_of(filename)
+    if compression is None:
+        return open(filename, mode)
+    if compression == "gzip":
+        return gzip.open(filename, mode)
+    if compression == "bz2":
+        return bz2.open(filename, mode)
+    if compression == "xz":
+        return lzma.open(filename, mode)
+    return _import_zstandard().open(filename, mode)
+
+
+def _compressed_stream(file, compression, mode):
+    """Wrap a binary file object with a decompressor when reading or a compressor
+    when writing. Closing the result does not close the file object."""
+    _check_compression(compression)
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=file, mode=mode)
+    if compression == "bz2":
+        return bz2.BZ2File(file, mode=mode)
+    if compression == "xz":
+        return lzma.LZMAFile(file, mode=mode)
+    zstandard = _import_zstandard()
+    if mode == "rb":
+        return zstandard.ZstdDecompressor().stream_reader(file, closefd=False)
+    return zstandard.ZstdCompressor().stream_writer(file, closefd=False)
+
+
+def _copy_to_binary(file, output):
+    """Copy a file object into a binary output in fixed-size chunks."""
+    while True:
+        chunk = file.read(_INPUT_CHUNK_SIZE)
+        if not chunk:
+            break
+        if isinstance(chunk, str):
+            chunk = chunk.encode(encoding="utf-8")
+        output.write(chunk)
+
+
+@contextmanager
+def _pipe_filename(file):
+    """Get the filename of a named pipe, which a background thread feeds with the
+    contents of a file object while the backend reads from it.
+
+    The importers of the backend release the GIL while reading, so that the thread
+    can keep the pipe filled. Nothing is written to disk.
+    """
+    directory = tempfile.mkdtemp(prefix="jgrapht-")
+    filename = os.path.join(directory, "input")
+    os.mkfifo(filename)
+    errors = []
+    stop = threading.Event()
+
+    def feed():
+        try:
+            # open without blocking, so that the thread can give up if the backend
+            # never opens the pipe
+            while True:
+                try:
+                    fd = os.open(filename, os.O_WRONLY | os.O_NONBLOCK)
+                    break
+                except OSError as e:
+                    if e.errno != errno.ENXIO or stop.wait(0.001):
+                        return
+            os.set_blocking(fd, True)
+            with open(fd, "wb") as output:
+                _copy_to_binary(file, output)
+        except BrokenPipeError:
+            # the backend stopped reading early
+            pass
+        except Exception as e:
+            errors.append(e)
+
+    thread = threading.Thread(target=feed, daemon=True)
+    thread.start()
+    try:
+        yield filename
+    finally:
+        stop.set()
+        thread.join()
+        os.remove(filename)
+        os.rmdir(directory)
+
+    if errors:
+        raise errors[0]
+
+
+@contextmanager
+def _temporary_filename(file):
+    """Get the filename of a temporary file with the contents of a file object. The
+    temporary file is removed when the context exits."""
+    fd, filename = tempfile.mkstemp(prefix="jgrapht-")
+    try:
+        with os.fdopen(fd, "wb") as output:
+            _copy_to_binary(file, output)
+        yield filename
+    finally:
+        os.remove(filename)
+
+
+@contextmanager
+def _input_filename(file):
+    """Get a filename which the importers of the backend can read from.
+
+    Plain filenames are used as is. Compressed files, recognized by their extension
+    (.gz, .bz2, .xz or .zst), and file objects, such as opened files or socket files,
+    are streamed through a named pipe in fixed-size chunks. Memory usage is therefore
+    bounded by the chunk size instead of the input size. On platforms without named
+    pipes the input is copied into a temporary file instead, which is removed when the
+    context exits.
+
+    :param file: a filename or a file object opened for reading
+    """
+    if not hasattr(file, "read"):
+        if _compression_of(file) is None:
+            yield file
+            return
+        with _open_file(file, "rb") as stream:
+            with _input_filename(stream) as filename:
+                yield filename
+        return
+
+    if hasattr(os, "mkfifo"):
+        with _pipe_filename(file) as filename:
+            yield filename
+    else:
+        with _temporary_filename(file) as filename:
+            yield filename
+
+
+# Size of the chunks in which the exporters write into file objects
+_OUTPUT_CHUNK_SIZE = 1024 * 1024
+
+
+@contextmanager
+def _output_stream(file, compression=None):
+    """Get a binary stream which the exporters can write into.
+
+    Filenames are opened for writing, compressed according to their extension unless
+    a compression is given. File objects are used as is and are not closed when the
+    context exits, so that the caller can keep writing.
+
+    :param file: a filename or a file object opened for writing in binary mode
+    :param compression: None, "gzip", "bz2", "xz" or "zstd"
+    """
+    _check_compression(compression)
+
+    if not hasattr(file, "write"):
+        with _open_file(file, "wb", compression) as output:
+            yield output
+        return
+
+    if compression is None:
+        yield file
+    else:
+        with _compressed_stream(file, compression, "wb") as output:
+            yield output
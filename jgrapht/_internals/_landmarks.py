@@ -0,0 +1,214 @@
+import math
+import random
+from array import array
+
+from .. import backend
+from ._int_graphs import _is_int_graph
+from ._paths import _JGraphTSingleSourcePaths
+from ._views import _EdgeReversedGraphView
+from ._anyhashableg import (
+    _is_anyhashable_graph,
+    _vertex_anyhashableg_to_g,
+    _vertex_g_to_anyhashableg,
+)
+
+
+class _ALTLandmarks:
+    """Landmarks of the ALT heuristic together with the precomputed distances from and
+    to each landmark.
+
+    Distances are kept in dense arrays indexed by vertex, one row per landmark, so that
+    the heuristic can be evaluated inside the backend. Any-hashable graphs are indexed
+    by the identifiers of their internal graph.
+    """
+
+    def __init__(self, graph, landmarks, size, from_distances, to_distances):
+        self._graph = graph
+        self._landmarks = landmarks
+        self._size = size
+        self._from_distances = from_distances
+        self._to_distances = to_distances
+
+    @property
+    def graph(self):
+        """The graph"""
+        return self._graph
+
+    @property
+    def landmarks(self):
+        """The landmark vertices"""
+        return [_vertex_g_to_anyhashableg(self._graph, l) for l in self._landmarks]
+
+    def __len__(self):
+        return len(self._landmarks)
+
+    def __repr__(self):
+        return "_ALTLandmarks(%r)" % self.landmarks
+
+
+def _dijkstra_distances(g, source, vertices, with_predecessors=False):
+    handle = backend.jgrapht_ix_sp_exec_dijkstra_get_singlesource_from_vertex(
+        g.handle, source
+    )
+    paths = _JGraphTSingleSourcePaths(handle, g, source)
+    return paths.get_distances(vertices, with_predecessors=with_predecessors)
+
+
+def _indexed(vertices, values, size, default):
+    """Scatter the values of a list of vertices into an array indexed by vertex."""
+    res = array("d", [default]) * size
+    for v, value in zip(vertices, values):
+        res[v] = value
+    return res
+
+
+def _lower_bound(landmark_distances, u, v):
+    """The ALT lower bound of the distance from u to v, using only the distances from the
+    landmarks computed so far."""
+    bound = 0.0
+    for from_landmark, to_landmark in landmark_distances:
+        if math.isfinite(from_landmark[u]) and math.isfinite(from_landmark[v]):
+            bound = max(bound, from_landmark[v] - from_landmark[u])
+        if math.isfinite(to_landmark[u]) and math.isfinite(to_landmark[v]):
+            bound = max(bound, to_landmark[u] - to_landmark[v])
+    return bound
+
+
+def _select_random(g, vertices, count, rng, distances):
+    return rng.sample(list(vertices), count)
+
+
+def _select_farthest(g, vertices, count, rng, distances):
+    """Pick the vertex farthest from a random vertex, then repeatedly pick the vertex
+    which is farthest from the landmarks picked so far. Unreachable vertices are the
+    farthest, which spreads the landmarks over all connected components."""
+    from_start = distances(rng.choice(vertices))[0]
+    landmarks = [max(vertices, key=lambda v: from_start[v])]
+    closest = array("d", distances(landmarks[0])[0])
+    while len(landmarks) < count:
+        chosen = set(landmarks)
+        candidates = [v for v in vertices if v not in chosen]
+        landmark = max(candidates, key=lambda v: closest[v])
+        landmarks.append(landmark)
+        from_landmark = distances(landmark)[0]
+        for v in vertices:
+            closest[v] = min(closest[v], from_landmark[v])
+    return landmarks
+
+
+def _select_avoid(g, vertices, count, rng, distances):
+    """The avoid strategy of Goldberg and Werneck.
+
+    Grow a shortest path tree from a random root. Each vertex is weighted by how much
+    the current landmarks underestimate its distance from the root. Subtrees which
+    already contain a landmark get no weight. Starting from the heaviest subtree,
+    follow the heaviest child down to a leaf and make the leaf a landmark.
+
+    The tree is built from the predecessors of every vertex, which walks every edge of
+    every shortest path from the root, once per landmark.
+    """
+    landmarks = []
+    landmark_distances = []
+    while len(landmarks) < count:
+        chosen = set(landmarks)
+        root = rng.choice([v for v in vertices if v not in chosen])
+        dist, pred = _dijkstra_distances(g, root, vertices, with_predecessors=True)
+
+        children = {}
+        for v, e in zip(vertices, pred):
+            if e >= 0:
+                children.setdefault(g.opposite(e, v), []).append(v)
+        # parents before children
+        order = [root]
+        for v in order:
+            order.extend(children.get(v, ()))
+
+        depth = dict(zip(vertices, dist))
+        size = {}
+        covered = set()
+        for v in reversed(order):
+            below = children.get(v, ())
+            if v in chosen or any(c in covered for c in below):
+                covered.add(v)
+                size[v] = 0.0
+            else:
+                size[v] = depth[v] - _lower_bound(landmark_distances, root, v)
+                size[v] += sum(size[c] for c in below)
+
+        leaf = max(order, key=size.get)
+        if leaf in covered:
+            # every subtree contains a landmark
+            leaf = root
+        else:
+            while children.get(leaf):
+                leaf = max(children[leaf], key=size.get)
+
+        landmarks.append(leaf)
+        landmark_distances.append(distances(leaf))
+    return landmarks
+
+
+_STRATEGIES = {
+    "random": _select_random,
+    "farthest": _select_farthest,
+    "avoid": _select_avoid,
+}
+
+
+def _precompute_alt_landmarks(graph, landmarks, strategy="farthest", seed=None):
+    """Select landmarks, if only their number is given, and compute the distances from
+    and to each landmark."""
+    if _is_anyhashable_graph(graph):
+        g = graph._graph
+    elif _is_int_graph(graph):
+        g = graph
+    else:
+        raise TypeError("Not supported graph type")
+
+    vertices = array("i", g.vertices)
+    size = max(vertices) + 1 if vertices else 0
+    reversed_g = _EdgeReversedGraphView(g) if g.type.directed else None
+
+    cache = {}
+
+    def distances(landmark):
+        """Distances from and to a landmark, indexed by vertex."""
+        if landmark not in cache:
+            inf = math.inf
+            from_landmark = _indexed(
+                vertices, _dijkstra_distances(g, landmark, vertices), size, inf
+            )
+            if reversed_g is None:
+                to_landmark = from_landmark
+            else:
+                to_landmark = _indexed(
+                    vertices,
+                    _dijkstra_distances(reversed_g, landmark, vertices),
+                    size,
+                    inf,
+                )
+            cache[landmark] = (from_landmark, to_landmark)
+        return cache[landmark]
+
+    if isinstance(landmarks, int) and not isinstance(landmarks, bool):
+        if strategy not in _STRATEGIES:
+            raise ValueError("Unknown landmark selection strategy {}".format(strategy))
+        if landmarks < 1 or landmarks > len(vertices):
+            raise ValueError(
+                "Number of landmarks must be between 1 and the number of vertices"
+            )
+        rng = random.Random(seed)
+        landmark_ids = _STRATEGIES[strategy](g, vertices, landmarks, rng, distances)
+    else:
+        landmark_ids = [_vertex_anyhashableg_to_g(graph, l) for l in landmarks]
+        if not landmark_ids:
+            raise ValueError("At least one landmark is required")
+
+    from_distances = array("d")
+    to_distances = array("d")
+    for l in landmark_ids:
+        from_landmark, to_landmark = distances(l)
+        from_distances.extend(from_landmark)
+        to_distances.extend(to_landmark)
+
+    return _ALTLandmarks(graph, landmark_ids, size, from_distances, to_distances)
@@ -8,6 +8,7 @@ from ..types import (
 from collections.abc import Set
 
 from ._wrappers import _HandleWrapper
+from ._arrays import _as_long_buffer, _as_double_buffer, _buffers_length, _zeros
 from ._collections import (
     _JGraphTLongIterator,
     _JGraphTLongSet,
@@ -74,6 +75,43 @@ class _JGraphTLongGraph(_HandleWrapper, Graph):
             self.set_edge_weight(edge, weight)
         return edge
 
+    def add_edges_from(self, edges=None, sources=None, targets=None, weights=None):
+        """Add edges to the graph.
+
+        Edges are either given as an iterable of tuples, or as parallel columns of
+        sources, targets and optional weights. Columns can be any objects supporting
+        the buffer protocol, such as :py:class:`array.array` or numpy arrays, and
+        are inserted using a single backend call. If any of the column edges cannot be
+        added, none of them is.
+
+        :param edges: any iterable of edges. Each edge is (u, v, weight, id) where possibly
+          weight and id are missing.
+        :param sources: the edge sources, used when edges is None
+        :param targets: the edge targets, used when edges is None
+        :param weights: optional edge weights, used when edges is None
+        :returns: list of added edge identifiers, or a buffer of added edge identifiers
+          if columns were given
+        """
+        if edges is not None:
+            if sources is not None or targets is not None or weights is not None:
+                raise ValueError("Provide either edges or sources and targets")
+            return super().add_edges_from(edges)
+
+        if sources is None or targets is None:
+            raise ValueError("Both sources and targets are required")
+
+        sources = _as_long_buffer(sources)
+        targets = _as_long_buffer(targets)
+        if weights is not None:
+            weights = _as_double_buffer(weights)
+        count = _buffers_length(sources, targets, weights)
+
+        result = _zeros("q", count)
+        backend.jgrapht_ll_graph_add_edges(
+            self._handle, count, sources, targets, weights, result
+        )
+        return result
+
     def remove_edge(self, e):
         if e is None:
             raise ValueError("Edge cannot be None")
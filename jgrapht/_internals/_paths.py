@@ -1,3 +1,6 @@
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
 from .. import backend
 from ..types import (
     GraphPath,
@@ -5,6 +8,7 @@ from ..types import (
     MultiObjectiveSingleSourcePaths,
     AllPairsPaths,
     ManyToManyPaths,
+    _PackedPaths,
 )
 from ._wrappers import (
     _HandleWrapper,
@@ -12,10 +16,132 @@ from ._wrappers import (
     _JGraphTLongIterator,
     _JGraphTObjectIterator,
 )
+from ._arrays import _as_int_buffer, _as_long_buffer, _import_numpy, _zeros
 from ._int_graphs import _is_int_graph
 from ._long_graphs import _is_long_graph
 
 
+def _distance_matrix(kind, handle, graph, sources, targets, with_paths):
+    """Fill the distance matrix of a block of sources and targets using a single backend
+    call. The paths, if requested, need two more calls, one to count their edges and
+    one to collect them.
+
+    :param kind: either "allpairs" or "manytomany"
+    """
+    np = _import_numpy()
+    if _is_long_graph(graph):
+        sources = _as_long_buffer(sources)
+        targets = _as_long_buffer(targets)
+        prefix, dtype = "lx", np.int64
+    elif _is_int_graph(graph):
+        sources = _as_int_buffer(sources)
+        targets = _as_int_buffer(targets)
+        prefix, dtype = "ix", np.int32
+    else:
+        raise TypeError("Not supported graph type")
+
+    alg_method_name = "jgrapht_{}_sp_{}_get_distances".format(prefix, kind)
+    alg_method = getattr(backend, alg_method_name)
+    args = [handle, len(sources), sources, len(targets), targets]
+
+    distances = np.empty((len(sources), len(targets)), dtype=np.float64)
+    if not with_paths:
+        alg_method(*args, distances, None, None)
+        return distances
+
+    offsets = np.empty(len(sources) * len(targets) + 1, dtype=np.int64)
+    alg_method(*args, distances, offsets, None)
+    edges = np.empty(int(offsets[-1]), dtype=dtype)
+    alg_method(*args, None, None, edges)
+    return distances, _PackedPaths(offsets, edges)
+
+
+# Pairs per thread below which a batch of contraction hierarchies queries is not split
+_CH_BATCH_MIN_PAIRS_PER_THREAD = 1024
+
+
+def _ch_batch_distances(ch, graph, sources, targets, radius):
+    """Compute the distances of a batch of source/target pairs using contraction
+    hierarchies. Large batches are split among as many threads as the parallelism of
+    the contraction hierarchies, since the backend call releases the GIL.
+    """
+    if _is_long_graph(graph):
+        sources = _as_long_buffer(sources)
+        targets = _as_long_buffer(targets)
+        prefix = "lx"
+    elif _is_int_graph(graph):
+        sources = _as_int_buffer(sources)
+        targets = _as_int_buffer(targets)
+        prefix = "ix"
+    else:
+        raise TypeError("Not supported graph type")
+
+    if len(sources) != len(targets):
+        raise ValueError("Sources and targets must have the same length")
+
+    alg_method_name = (
+        "jgrapht_{}_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances"
+    ).format(prefix)
+    alg_method = getattr(backend, alg_method_name)
+
+    count = len(sources)
+    distances = _zeros("d", count)
+    threads = min(ch.parallelism or 1, count // _CH_BATCH_MIN_PAIRS_PER_THREAD)
+    if threads <= 1:
+        alg_method(ch.handle, count, sources, targets, radius, distances)
+        return distances
+
+    # Each query of the backend creates its own bidirectional dijkstra, which only reads
+    # the shared hierarchy, and each thread attaches separately to the isolate. Thus
+    # concurrent queries on the same handle are safe, see test_ch_dijkstra_batch_threads.
+    sources = memoryview(sources)
+    targets = memoryview(targets)
+    view = memoryview(distances)
+    bounds = [count * i // threads for i in range(threads + 1)]
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        futures = [
+            pool.submit(
+                alg_method,
+                ch.handle,
+                end - start,
+                sources[start:end],
+                targets[start:end],
+                radius,
+                view[start:end],
+            )
+            for start, end in zip(bounds, bounds[1:])
+        ]
+        for future in futures:
+            future.result()
+    return distances
+
+
+class _LazyPaths(Sequence):
+    """The paths of a batch of queries. Each path is computed when first accessed."""
+
+    def __init__(self, get_path, count):
+        self._get_path = get_path
+        self._count = count
+        self._paths = {}
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if index < 0 or index >= self._count:
+            raise IndexError("Path index out of range")
+        if index not in self._paths:
+            self._paths[index] = self._get_path(index)
+        return self._paths[index]
+
+    def __repr__(self):
+        return "_LazyPaths(%r)" % self._count
+
+
 class _JGraphTGraphPath(_HandleWrapper, GraphPath):
     """A class representing a graph path. Works for both
     int and long graphs.
@@ -141,6 +267,35 @@ class _JGraphTSingleSourcePaths(_HandleWrapper, SingleSourcePaths):
             raise TypeError("Not supported graph type")
         return _JGraphTGraphPath(gp, self._graph) if gp is not None else None
 
+    def get_distances(self, target_vertices, with_predecessors=False):
+        """Get the distances to a sequence of target vertices using a single backend
+        call. See :py:meth:`.SingleSourcePaths.get_distances` for its cost.
+
+        :param target_vertices: the target vertices, a buffer or any iterable
+        :param with_predecessors: whether to also return the last edge of each path
+        :returns: an :py:class:`array.array` of doubles with the distance to each
+          target, infinity if unreachable. If with_predecessors is True, a tuple with the
+          distances and an :py:class:`array.array` with the last edge of each path, -1
+          for the source and unreachable vertices.
+        """
+        if _is_long_graph(self._graph):
+            vertices = _as_long_buffer(target_vertices)
+            typecode = "q"
+            alg_method = backend.jgrapht_lx_sp_singlesource_get_distances
+        elif _is_int_graph(self._graph):
+            vertices = _as_int_buffer(target_vertices)
+            typecode = "i"
+            alg_method = backend.jgrapht_ix_sp_singlesource_get_distances
+        else:
+            raise TypeError("Not supported graph type")
+
+        distances = _zeros("d", len(vertices))
+        predecessors = _zeros(typecode, len(vertices)) if with_predecessors else None
+        alg_method(self._handle, len(vertices), vertices, distances, predecessors)
+        if with_predecessors:
+            return distances, predecessors
+        return distances
+
     def __repr__(self):
         return "_JGraphTSingleSourcePaths(%r)" % self._handle
 
@@ -178,6 +333,26 @@ class _JGraphTAllPairsPaths(_HandleWrapper, AllPairsPaths):
             raise TypeError("Not supported graph type")
         return _JGraphTSingleSourcePaths(singlesource, self._graph, source_vertex)
 
+    def get_distance_matrix(
+        self, source_vertices=None, target_vertices=None, with_paths=False
+    ):
+        """Get the distances between all pairs of a block of source and target vertices
+        as a NumPy matrix, filled using a single backend call. See
+        :py:meth:`.AllPairsPaths.get_distance_matrix`.
+        """
+        if source_vertices is None:
+            source_vertices = self._graph.vertices
+        if target_vertices is None:
+            target_vertices = self._graph.vertices
+        return _distance_matrix(
+            "allpairs",
+            self._handle,
+            self._graph,
+            source_vertices,
+            target_vertices,
+            with_paths,
+        )
+
     def __repr__(self):
         return "_JGraphTAllPairsPaths(%r)" % self._handle
 
@@ -219,9 +394,15 @@ class _JGraphTMultiObjectiveSingleSourcePaths(
 class _JGraphTContractionHierarchies(_HandleWrapper):
     """Wrapper class around contraction hierarchies"""
 
-    def __init__(self, handle, graph, **kwargs):
+    def __init__(self, handle, graph, parallelism=None, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._graph = graph
+        self._parallelism = parallelism
+
+    @property
+    def parallelism(self):
+        """How many threads were used for the precomputation"""
+        return self._parallelism
 
     def __repr__(self):
         return "_JGraphTContractionHierarchies(%r)" % self._handle
@@ -230,9 +411,11 @@ class _JGraphTContractionHierarchies(_HandleWrapper):
 class _JGraphTContractionHierarchiesManyToMany(_HandleWrapper, ManyToManyPaths):
     """Many to many result with contraction hierarchies"""
 
-    def __init__(self, handle, graph, **kwargs):
+    def __init__(self, handle, graph, sources=None, targets=None, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._graph = graph
+        self._sources = sources
+        self._targets = targets
 
     def get_path(self, source_vertex, target_vertex):
         if _is_long_graph(self._graph):
@@ -247,5 +430,25 @@ class _JGraphTContractionHierarchiesManyToMany(_HandleWrapper, ManyToManyPaths):
             raise TypeError("Not supported graph type")
         return _JGraphTGraphPath(gp, self._graph) if gp is not None else None
 
+    def get_distance_matrix(
+        self, source_vertices=None, target_vertices=None, with_paths=False
+    ):
+        """Get the distances between all pairs of a block of source and target vertices
+        as a NumPy matrix, filled using a single backend call. See
+        :py:meth:`.ManyToManyPaths.get_distance_matrix`.
+        """
+        if source_vertices is None:
+            source_vertices = self._sources
+        if target_vertices is None:
+            target_vertices = self._targets
+        return _distance_matrix(
+            "manytomany",
+            self._handle,
+            self._graph,
+            source_vertices,
+            target_vertices,
+            with_paths,
+        )
+
     def __repr__(self):
         return "_JGraphTContractionHierarchiesManyToMany(%r)" % self._handle
@@ -160,17 +160,18 @@ def _wrap_vertex_set_iterator(graph, handle):
     return alg[0](*alg[1])
 
 
-def _wrap_vertex_iterator(graph, handle):
+def _wrap_vertex_iterator(graph, handle, chunk_size=None):
     """Given an vertex iterator in the JVM, build one in Python. The wrapper
     graph takes ownership and will delete the JVM resource when Python deletes
-    the instance."""
+    the instance. The chunk size is the maximum number of vertices fetched
+    using a single backend call, None for the default."""
     cases = {
         _AnyHashableGraph: (_AnyHashableGraphVertexIterator, [handle, graph]),
         _JGraphTLongGraph: (_JGraphTLongIterator, [handle]),
         _JGraphTIntegerGraph: (_JGraphTIntegerIterator, [handle]),
     }
     alg = cases[type(graph)]
-    return alg[0](*alg[1])
+    return alg[0](*alg[1], chunk_size=chunk_size)
 
 
 def _wrap_edge_iterator(graph, handle):
@@ -292,44 +293,44 @@ def _wrap_multi_objective_single_source_paths(graph, handle, source_vertex):
     return alg[0](*alg[1])
 
 
-def _wrap_contraction_hierarchies(graph, handle):
+def _wrap_contraction_hierarchies(graph, handle, parallelism=None):
     """Given contraction hierarchies in the JVM, build one in Python. The wrapper
     takes ownership and will delete the JVM resource when Python deletes
     the instance."""
     cases = {
         _AnyHashableGraph: (
             _JGraphTContractionHierarchies,
-            [handle, graph],
+            [handle, graph, parallelism],
         ),
         _JGraphTLongGraph: (
             _JGraphTContractionHierarchies,
-            [handle, graph],
+            [handle, graph, parallelism],
         ),
         _JGraphTIntegerGraph: (
             _JGraphTContractionHierarchies,
-            [handle, graph],
+            [handle, graph, parallelism],
         ),
     }
     alg = cases[type(graph)]
     return alg[0](*alg[1])
 
 
-def _wrap_manytomany_contraction_hierarchies(graph, handle):
+def _wrap_manytomany_contraction_hierarchies(graph, handle, sources=None, targets=None):
     """Given many-to-many contraction hierarchies in the JVM, build one in Python.
     The wrapper takes ownership and will delete the JVM resource when Python deletes
     the instance."""
     cases = {
         _AnyHashableGraph: (
             _AnyHashableGraphContractionHierarchiesManyToMany,
-            [handle, graph],
+            [handle, graph, sources, targets],
         ),
         _JGraphTLongGraph: (
             _JGraphTContractionHierarchiesManyToMany,
-            [handle, graph],
+            [handle, graph, sources, targets],
         ),
         _JGraphTIntegerGraph: (
             _JGraphTContractionHierarchiesManyToMany,
-            [handle, graph],
+            [handle, graph, sources, targets],
         ),
     }
     alg = cases[type(graph)]
@@ -2,9 +2,12 @@ from .. import backend
 from ..types import GraphType, GraphEvent, ListenableGraph
 from ._int_graphs import _JGraphTIntegerGraph
 from ._callbacks import _create_wrapped_callback
+from ._arrays import _as_int_buffer, _as_double_buffer, _as_mask_buffer
+from ._collections import _JGraphTIntegerSet
 
 import ctypes
 import copy
+from collections.abc import Mapping
 
 
 class _UnweightedGraphView(_JGraphTIntegerGraph):
@@ -142,8 +145,101 @@ class _MaskedSubgraphView(_JGraphTIntegerGraph):
         return "_MaskedSubgraphView(%r)" % self._handle
 
 
+class _BitmapMaskedSubgraphView(_JGraphTIntegerGraph):
+    """A masked subgraph view whose masks are kept in the backend.
+
+    The view is a native subgraph of the base graph. Applying a mask adds or removes
+    vertices and edges of the subgraph with a single backend call, without calling
+    back into Python.
+    """
+
+    def __init__(self, graph, vertex_mask, edge_mask=None):
+        vertex_set = _JGraphTIntegerSet(linked=False)
+        edge_set = _JGraphTIntegerSet(linked=False)
+        res = backend.jgrapht_xx_graph_as_subgraph(
+            graph.handle, vertex_set.handle, edge_set.handle
+        )
+
+        super().__init__(res)
+
+        self._type = graph.type.as_unmodifiable()
+
+        # Keep a reference to avoid gargage collection. This is important since the
+        # same references are maintained inside the JVM. If the graph gets garbaged
+        # collected here, the same will happen inside the JVM.
+        self._graph = graph
+
+        self.set_masks(vertex_mask, edge_mask)
+
+    def set_masks(self, vertex_mask, edge_mask=None):
+        """Apply new masks to the view.
+
+        The view is updated in place to the vertices and edges of the base graph
+        which are not masked. An edge with a masked endpoint vertex is masked as well.
+
+        :param vertex_mask: a boolean sequence or array indexed by vertex, a set of
+          masked vertices, an integer bitset or None
+        :param edge_mask: a boolean sequence or array indexed by edge, a set of
+          masked edges, an integer bitset or None
+        """
+        vertex_mask = _as_mask_buffer(vertex_mask)
+        edge_mask = _as_mask_buffer(edge_mask)
+        backend.jgrapht_ii_graph_subgraph_apply_masks(
+            self._handle,
+            self._graph.handle,
+            len(vertex_mask) if vertex_mask is not None else 0,
+            vertex_mask,
+            len(edge_mask) if edge_mask is not None else 0,
+            edge_mask,
+        )
+
+    @property
+    def type(self):
+        """Query the graph type.
+
+        :returns: The graph type.
+        """
+        return self._type
+
+    def add_vertex(self, vertex=None):
+        raise ValueError("this graph is unmodifiable")
+
+    def remove_vertex(self, v):
+        raise ValueError("this graph is unmodifiable")
+
+    def add_edge(self, u, v, weight=None, edge=None):
+        raise ValueError("this graph is unmodifiable")
+
+    def add_edges_from(self, edges=None, sources=None, targets=None, weights=None):
+        raise ValueError("this graph is unmodifiable")
+
+    def remove_edge(self, e):
+        raise ValueError("this graph is unmodifiable")
+
+    def set_edge_weight(self, e, weight):
+        raise ValueError("this graph is unmodifiable")
+
+    def __repr__(self):
+        return "_BitmapMaskedSubgraphView(%r)" % self._handle
+
+
 class _WeightedView(_JGraphTIntegerGraph):
-    def __init__(self, graph, edge_weight_cb, cache_weights, write_weights_through):
+    def __init__(
+        self, graph, edge_weight_cb, cache_weights, write_weights_through, weights=None
+    ):
+        if weights is not None:
+            # weights are copied once into the cache of the view
+            if write_weights_through:
+                raise ValueError(
+                    "Weights cannot be written through when given as an array"
+                )
+            if isinstance(weights, Mapping):
+                edges = _as_int_buffer(weights.keys())
+                weights = (edges, _as_double_buffer(weights.values()))
+            else:
+                weights = (None, _as_double_buffer(weights))
+            edge_weight_cb = None
+            cache_weights = True
 
         # Create callbacks and keep a reference
         self._edge_weight_cb_fptr, self._edge_weight_cb = _create_wrapped_callback(
@@ -158,6 +254,17 @@ class _WeightedView(_JGraphTIntegerGraph):
 
         super().__init__(res)
 
+        if weights is not None:
+            edges, weights = weights
+            if edges is not None:
+                backend.jgrapht_xi_graph_set_edge_weights(
+                    self._handle, len(edges), edges, weights
+                )
+            else:
+                backend.jgrapht_xi_graph_set_edge_weights_from_array(
+                    self._handle, len(weights), weights
+                )
+
         self._type = graph.type.as_weighted()
 
         # Keep a reference to avoid gargage collection. This is important since the
@@ -1,7 +1,28 @@
 from .. import backend
+from abc import abstractmethod
 from collections import namedtuple
 from collections.abc import Iterator
 
+from ._arrays import _zeros
+
+
+# Maximum number of elements which iterators fetch using a single backend call
+_iterator_chunk_size = 1024
+
+# Number of elements fetched by the first backend call of an iterator
+_ITERATOR_INITIAL_CHUNK_SIZE = 16
+
+
+def _get_iterator_chunk_size():
+    return _iterator_chunk_size
+
+
+def _set_iterator_chunk_size(chunk_size):
+    global _iterator_chunk_size
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive")
+    _iterator_chunk_size = chunk_size
+
 
 class _HandleWrapper:
     """A handle wrapper. Keeps a handle to a backend object and cleans up
@@ -37,98 +58,147 @@ class _JGraphTString(_HandleWrapper):
         # coming from the capi to a python string
         return backend.jgrapht_handles_get_ccharpointer(self._handle)
 
+    def write_to(self, stream, chunk_size):
+        """Write the string encoded in utf-8 into a binary stream, copying at most
+        chunk size bytes out of the backend at a time."""
+        length = backend.jgrapht_handles_get_ccharpointer_length(self._handle)
+        buffer = bytearray(min(chunk_size, length))
+        view = memoryview(buffer)
+        offset = 0
+        while offset < length:
+            size = min(chunk_size, length - offset)
+            backend.jgrapht_handles_copy_ccharpointer(self._handle, offset, size, buffer)
+            stream.write(view[:size])
+            offset += size
+
     def __repr__(self):
         return "_JGraphTString(%r)" % self._handle
 
 
-class _JGraphTIntegerIterator(_HandleWrapper, Iterator):
+class _JGraphTChunkedIterator(_HandleWrapper, Iterator):
+    """Base class for iterators which fetch elements from the backend in chunks.
+
+    The first chunk is small, in order to keep short iterations cheap, and
+    subsequent chunks grow up to the maximum chunk size.
+    """
+
+    def __init__(self, handle, chunk_size=None, **kwargs):
+        super().__init__(handle=handle, **kwargs)
+        if chunk_size is None:
+            chunk_size = _iterator_chunk_size
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be positive")
+        self._max_chunk_size = chunk_size
+        self._chunk_size = min(_ITERATOR_INITIAL_CHUNK_SIZE, chunk_size)
+        self._chunk = ()
+        self._pos = 0
+
+    def __next__(self):
+        if self._pos == len(self._chunk):
+            self._chunk = self._fetch(self._chunk_size)
+            self._chunk_size = min(2 * self._chunk_size, self._max_chunk_size)
+            self._pos = 0
+            if len(self._chunk) == 0:
+                raise StopIteration()
+        value = self._chunk[self._pos]
+        self._pos += 1
+        return value
+
+    @abstractmethod
+    def _fetch(self, size):
+        """Fetch at most size elements from the backend."""
+        pass
+
+
+class _JGraphTIntegerIterator(_JGraphTChunkedIterator):
     """Integer values iterator"""
 
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
 
-    def __next__(self):
-        res = backend.jgrapht_it_hasnext(self._handle)
-        if not res:
-            raise StopIteration()
-        return backend.jgrapht_it_next_int(self._handle)
+    def _fetch(self, size):
+        values = _zeros("i", size)
+        count = backend.jgrapht_it_next_int_chunk(self._handle, size, values)
+        del values[count:]
+        return values
 
     def __repr__(self):
         return "_JGraphTIntegerIterator(%r)" % self._handle
 
 
-class _JGraphTLongIterator(_HandleWrapper, Iterator):
+class _JGraphTLongIterator(_JGraphTChunkedIterator):
     """Long values iterator"""
 
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
 
-    def __next__(self):
-        res = backend.jgrapht_it_hasnext(self._handle)
-        if not res:
-            raise StopIteration()
-        return backend.jgrapht_it_next_long(self._handle)
+    def _fetch(self, size):
+        values = _zeros("q", size)
+        count = backend.jgrapht_it_next_long_chunk(self._handle, size, values)
+        del values[count:]
+        return values
 
     def __repr__(self):
         return "_JGraphTLongIterator(%r)" % self._handle
-        
 
-class _JGraphTDoubleIterator(_HandleWrapper, Iterator):
+
+class _JGraphTDoubleIterator(_JGraphTChunkedIterator):
     """Double values iterator"""
 
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
 
-    def __next__(self):
-        res = backend.jgrapht_it_hasnext(self._handle)
-        if not res:
-            raise StopIteration()
-        return backend.jgrapht_it_next_double(self._handle)
+    def _fetch(self, size):
+        values = _zeros("d", size)
+        count = backend.jgrapht_it_next_double_chunk(self._handle, size, values)
+        del values[count:]
+        return values
 
     def __repr__(self):
         return "_JGraphTDoubleIterator(%r)" % self._handle
 
 
-class _JGraphTEdgeIntegerTripleIterator(_HandleWrapper, Iterator):
+class _JGraphTEdgeIntegerTripleIterator(_JGraphTChunkedIterator):
     """An edge triple iterator"""
 
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._edge_triple_class = namedtuple("Edge", ["source", "target", "weight"])
 
-    def __next__(self):
-        res = backend.jgrapht_it_hasnext(self._handle)
-        if not res:
-            raise StopIteration()
-
-        # read edge triple
-        s, t, w = backend.jgrapht_it_next_int_edge_triple(self._handle)
-
-        # return a named tuple
-        return self._edge_triple_class(source=s, target=t, weight=w)
+    def _fetch(self, size):
+        sources = _zeros("i", size)
+        targets = _zeros("i", size)
+        weights = _zeros("d", size)
+        count = backend.jgrapht_it_next_int_edge_triple_chunk(
+            self._handle, size, sources, targets, weights
+        )
+        return [
+            self._edge_triple_class(source=s, target=t, weight=w)
+            for s, t, w in zip(sources[:count], targets[:count], weights[:count])
+        ]
 
     def __repr__(self):
         return "_JGraphTEdgeIntegerTripleIterator(%r)" % self._handle
 
 
-
-class _JGraphTEdgeLongTripleIterator(_HandleWrapper, Iterator):
+class _JGraphTEdgeLongTripleIterator(_JGraphTChunkedIterator):
     """An edge triple iterator"""
 
     def __init__(self, handle, **kwargs):
         super().__init__(handle=handle, **kwargs)
         self._edge_triple_class = namedtuple("Edge", ["source", "target", "weight"])
 
-    def __next__(self):
-        res = backend.jgrapht_it_hasnext(self._handle)
-        if not res:
-            raise StopIteration()
-
-        # read edge triple
-        s, t, w = backend.jgrapht_it_next_long_edge_triple(self._handle)
-
-        # return a named tuple
-        return self._edge_triple_class(source=s, target=t, weight=w)
+    def _fetch(self, size):
+        sources = _zeros("q", size)
+        targets = _zeros("q", size)
+        weights = _zeros("d", size)
+        count = backend.jgrapht_it_next_long_edge_triple_chunk(
+            self._handle, size, sources, targets, weights
+        )
+        return [
+            self._edge_triple_class(source=s, target=t, weight=w)
+            for s, t, w in zip(sources[:count], targets[:count], weights[:count])
+        ]
 
     def __repr__(self):
         return "_JGraphTEdgeLongTripleIterator(%r)" % self._handle
@@ -12,6 +12,9 @@ from .._internals._results import (
     _wrap_manytomany_contraction_hierarchies,
 )
 from .._internals._callbacks import _create_wrapped_callback
+from .._internals._arrays import _as_numpy, _as_numpy_objects
+from .._internals._landmarks import _ALTLandmarks, _precompute_alt_landmarks
+from .._internals._paths import _ch_batch_distances, _LazyPaths
 
 from .._internals._anyhashableg import (
     _is_anyhashable_graph,
@@ -32,6 +35,26 @@ def _sp_singlesource_alg(name, graph, source_vertex, *args):
     return _wrap_single_source_paths(graph, handle, source_vertex)
 
 
+def _sp_singlesource_distances(
+    name, graph, source_vertex, target_vertices, with_predecessors, as_numpy, *args
+):
+    paths = _sp_singlesource_alg(name, graph, source_vertex, *args)
+    if target_vertices is None:
+        target_vertices = graph.vertices
+    res = paths.get_distances(target_vertices, with_predecessors=with_predecessors)
+    if not as_numpy:
+        return res
+    if not with_predecessors:
+        return _as_numpy(res, "float64")
+
+    distances, predecessors = res
+    if _is_anyhashable_graph(graph):
+        predecessors = _as_numpy_objects(predecessors)
+    else:
+        predecessors = _as_numpy(predecessors, predecessors.typecode)
+    return _as_numpy(distances, "float64"), predecessors
+
+
 def _sp_between_alg(name, graph, source_vertex, target_vertex, *args):
     alg_method_name = "jgrapht_ix_sp_exec_" + name
     alg_method = getattr(_backend, alg_method_name)
@@ -112,6 +135,39 @@ def dijkstra(graph, source_vertex, target_vertex=None, use_bidirectional=True):
             )
 
 
+def dijkstra_distances(
+    graph,
+    source_vertex,
+    target_vertices=None,
+    with_predecessors=False,
+    as_numpy=False,
+):
+    r"""Dijkstra's algorithm to compute single-source shortest path distances.
+
+    Unlike :py:meth:`dijkstra`, which returns the paths, only the distances are computed and
+    returned as a dense array, filled using a single backend call. The backend still builds the
+    shortest path to each target, see :py:meth:`.SingleSourcePaths.get_distances` for the cost.
+
+    :param graph: the graph
+    :param source_vertex: the source vertex
+    :param target_vertices: the vertices to compute distances to. If None all vertices of the
+      graph, in the iteration order of :py:attr:`.Graph.vertices`
+    :param with_predecessors: whether to also return the last edge of each shortest path
+    :param as_numpy: if True return NumPy arrays instead of :py:class:`array.array`
+    :returns: an array with the distance to each target vertex, infinity if unreachable. If
+      with_predecessors is True, a tuple with the distances and an array with the last edge
+      of each path, -1 (None for any-hashable graphs) for the source and unreachable vertices
+    """
+    return _sp_singlesource_distances(
+        "dijkstra_get_singlesource_from_vertex",
+        graph,
+        source_vertex,
+        target_vertices,
+        with_predecessors,
+        as_numpy,
+    )
+
+
 def bellman_ford(graph, source_vertex):
     r"""Bellman-Ford algorithm to compute single-source shortest paths.
 
@@ -134,6 +190,39 @@ def bellman_ford(graph, source_vertex):
     )
 
 
+def bellman_ford_distances(
+    graph,
+    source_vertex,
+    target_vertices=None,
+    with_predecessors=False,
+    as_numpy=False,
+):
+    r"""Bellman-Ford algorithm to compute single-source shortest path distances.
+
+    Unlike :py:meth:`bellman_ford`, which returns the paths, only the distances are computed and
+    returned as a dense array, filled using a single backend call. The backend still builds the
+    shortest path to each target, see :py:meth:`.SingleSourcePaths.get_distances` for the cost.
+
+    :param graph: the graph
+    :param source_vertex: the source vertex
+    :param target_vertices: the vertices to compute distances to. If None all vertices of the
+      graph, in the iteration order of :py:attr:`.Graph.vertices`
+    :param with_predecessors: whether to also return the last edge of each shortest path
+    :param as_numpy: if True return NumPy arrays instead of :py:class:`array.array`
+    :returns: an array with the distance to each target vertex, infinity if unreachable. If
+      with_predecessors is True, a tuple with the distances and an array with the last edge
+      of each path, -1 (None for any-hashable graphs) for the source and unreachable vertices
+    """
+    return _sp_singlesource_distances(
+        "bellmanford_get_singlesource_from_vertex",
+        graph,
+        source_vertex,
+        target_vertices,
+        with_predecessors,
+        as_numpy,
+    )
+
+
 def bfs(graph, source_vertex):
     r"""The BFS as a shortest path algorithm. Even if the graph has weights,
     this algorithms treats the graph as unweighted.
@@ -149,6 +238,40 @@ def bfs(graph, source_vertex):
     )
 
 
+def bfs_distances(
+    graph,
+    source_vertex,
+    target_vertices=None,
+    with_predecessors=False,
+    as_numpy=False,
+):
+    r"""The BFS as a shortest path algorithm, computing only the distances. Even if the
+    graph has weights, this algorithms treats the graph as unweighted.
+
+    Unlike :py:meth:`bfs`, which returns the paths, only the distances are computed and
+    returned as a dense array, filled using a single backend call. The backend still builds the
+    shortest path to each target, see :py:meth:`.SingleSourcePaths.get_distances` for the cost.
+
+    :param graph: the graph
+    :param source_vertex: the source vertex
+    :param target_vertices: the vertices to compute distances to. If None all vertices of the
+      graph, in the iteration order of :py:attr:`.Graph.vertices`
+    :param with_predecessors: whether to also return the last edge of each shortest path
+    :param as_numpy: if True return NumPy arrays instead of :py:class:`array.array`
+    :returns: an array with the distance to each target vertex, infinity if unreachable. If
+      with_predecessors is True, a tuple with the distances and an array with the last edge
+      of each path, -1 (None for any-hashable graphs) for the source and unreachable vertices
+    """
+    return _sp_singlesource_distances(
+        "bfs_get_singlesource_from_vertex",
+        graph,
+        source_vertex,
+        target_vertices,
+        with_predecessors,
+        as_numpy,
+    )
+
+
 def johnson_allpairs(graph):
     r"""Johnson's all-pairs shortest-paths algorithm.
 
@@ -248,13 +371,31 @@ def a_star_with_alt_heuristic(
     vertices source and target, a good landmark appears "before" source or "after" target where
     before and after are relative to the "direction" from source to target.
 
+    The landmarks can also be precomputed once using :py:meth:`precompute_alt_landmarks` and
+    reused by many queries. In this case the distances to and from the landmarks are not
+    recomputed per query and the heuristic is evaluated inside the backend.
+
     :param graph: the graph
     :param source_vertex: the source vertex
     :param target_vertex: the target vertex.
-    :param landmarks: set of graph vertices to use for landmarks
+    :param landmarks: set of graph vertices to use for landmarks, or precomputed landmarks
     :param use_bidirectional: use a bidirectional search
     :returns: a :py:class:`.GraphPath`
     """
+    if isinstance(landmarks, _ALTLandmarks):
+        if landmarks.graph is not graph:
+            raise ValueError("Landmarks were precomputed for a different graph")
+        custom = [
+            len(landmarks._landmarks),
+            landmarks._size,
+            landmarks._from_distances,
+            landmarks._to_distances,
+        ]
+        if use_bidirectional:
+            name = "bidirectional_astar_alt_landmarks_get_path_between_vertices"
+        else:
+            name = "astar_alt_landmarks_get_path_between_vertices"
+        return _sp_between_alg(name, graph, source_vertex, target_vertex, *custom)
 
     landmarks_set = _build_vertex_set(graph, landmarks)
     custom = [landmarks_set.handle]
@@ -277,6 +418,48 @@ def a_star_with_alt_heuristic(
         )
 
 
+def precompute_alt_landmarks(graph, landmarks, strategy="farthest", seed=None):
+    r"""Precompute the landmarks of the ALT heuristic for the A* algorithm.
+
+    The distances from and to each landmark are computed once, using Dijkstra's algorithm,
+    and the result can be passed to :py:meth:`a_star_with_alt_heuristic` for any number of
+    queries on the same graph. The graph must not change afterwards.
+
+    Instead of the landmarks, their number can be given and the landmarks are selected
+    using one of the following strategies, described in the paper of Goldberg and Harrelson
+    and in the follow-up below.
+
+      * random -- uniformly at random,
+      * farthest -- starting from a random vertex, repeatedly pick the vertex farthest from the
+        landmarks picked so far,
+      * avoid -- repeatedly grow a shortest path tree from a random vertex and pick a leaf in the
+        subtree whose distances are the worst estimated by the landmarks picked so far.
+
+      * Andrew Goldberg and Renato Werneck. Computing Point-to-Point Shortest Paths from
+        External Memory. In Proceedings of the seventh Workshop on Algorithm Engineering
+        and Experiments (ALENEX' 05), 26--40, 2005.
+
+    Each landmark costs one single-source distance computation, two for directed graphs, whose
+    cost is described in :py:meth:`.SingleSourcePaths.get_distances`. The avoid strategy also
+    needs the predecessors of every vertex for each landmark, which walks every edge of every
+    shortest path from the root of the tree and is much slower on graphs with long shortest
+    paths, such as road networks.
+
+    Distances are stored in dense arrays indexed by vertex, which requires
+    :math:`\mathcal{O}(n)` space per landmark. Only graphs with integer vertices and
+    any-hashable graphs are supported.
+
+    :param graph: the graph
+    :param landmarks: either the landmark vertices or how many landmarks to select
+    :param strategy: how to select the landmarks when their number is given, one of "random",
+      "farthest" (the default) and "avoid"
+    :param seed: seed for the random number generator. If None a random seed is used
+    :returns: the precomputed landmarks
+    :raises ValueError: in case of an unknown strategy or an invalid number of landmarks
+    """
+    return _precompute_alt_landmarks(graph, landmarks, strategy=strategy, seed=seed)
+
+
 def yen_k_loopless(graph, source_vertex, target_vertex, k):
     r"""Yen's algorithm for k loopless shortest paths.
 
@@ -358,6 +541,51 @@ def delta_stepping(
         )
 
 
+def delta_stepping_distances(
+    graph,
+    source_vertex,
+    target_vertices=None,
+    delta=None,
+    parallelism=None,
+    with_predecessors=False,
+    as_numpy=False,
+):
+    r"""Delta stepping algorithm to compute single-source shortest path distances.
+
+    Unlike :py:meth:`delta_stepping`, which returns the paths, only the distances are computed and
+    returned as a dense array, filled using a single backend call. The backend still builds the
+    shortest path to each target, see :py:meth:`.SingleSourcePaths.get_distances` for the cost.
+
+    :param graph: the graph
+    :param source_vertex: the source vertex
+    :param target_vertices: the vertices to compute distances to. If None all vertices of the
+      graph, in the iteration order of :py:attr:`.Graph.vertices`
+    :param delta: the delta parameter. If None then it is automatically calculated, by traversing
+      the graph at least once.
+    :param parallelism: amount of parallelism to use. If None the cpu cores are used
+    :param with_predecessors: whether to also return the last edge of each shortest path
+    :param as_numpy: if True return NumPy arrays instead of :py:class:`array.array`
+    :returns: an array with the distance to each target vertex, infinity if unreachable. If
+      with_predecessors is True, a tuple with the distances and an array with the last edge
+      of each path, -1 (None for any-hashable graphs) for the source and unreachable vertices
+    """
+    if parallelism is None:
+        parallelism = multiprocessing.cpu_count()
+    if delta is None:
+        delta = 0.0
+
+    return _sp_singlesource_distances(
+        "delta_stepping_get_singlesource_from_vertex",
+        graph,
+        source_vertex,
+        target_vertices,
+        with_predecessors,
+        as_numpy,
+        delta,
+        parallelism,
+    )
+
+
 def martin_multiobjective(
     graph, edge_weight_cb, edge_weight_dimension, source_vertex, target_vertex=None
 ):
@@ -444,7 +672,7 @@ def precompute_contraction_hierarchies(graph, parallelism=None, seed=None):
     res = _backend.jgrapht_xx_sp_exec_contraction_hierarchy(
         graph.handle, parallelism, seed
     )
-    return _wrap_contraction_hierarchies(graph, res)
+    return _wrap_contraction_hierarchies(graph, res, parallelism)
 
 
 def contraction_hierarchies_many_to_many(graph, sources, targets, ch=None):
@@ -457,6 +685,9 @@ def contraction_hierarchies_many_to_many(graph, sources, targets, ch=None):
     :returns: a set of shortest paths
     :rtype: :py:class:`.ManyToManyPaths`
     """
+    # keep the order of the vertices for the distance matrix
+    sources = list(sources)
+    targets = list(targets)
     jgrapht_sources = _build_vertex_set(graph, sources)
     jgrapht_targets = _build_vertex_set(graph, targets)
 
@@ -466,7 +697,7 @@ def contraction_hierarchies_many_to_many(graph, sources, targets, ch=None):
     handle = _backend.jgrapht_xx_sp_exec_contraction_hierarchy_get_manytomany(
         ch.handle, jgrapht_sources.handle, jgrapht_targets.handle
     )
-    return _wrap_manytomany_contraction_hierarchies(graph, handle)
+    return _wrap_manytomany_contraction_hierarchies(graph, handle, sources, targets)
 
 
 def contraction_hierarchies_dijkstra(
@@ -499,3 +730,69 @@ def contraction_hierarchies_dijkstra(
     if handle is None:
         return None
     return _wrap_graphpath(graph, handle)
+
+
+def contraction_hierarchies_dijkstra_batch(
+    graph,
+    source_vertices,
+    target_vertices,
+    ch=None,
+    radius=None,
+    with_paths=False,
+    as_numpy=False,
+):
+    r"""Compute shortest path distances of a batch of pairs using contraction hierarchies.
+
+    Pair :math:`i` consists of ``source_vertices[i]`` and ``target_vertices[i]``. Unlike
+    :py:meth:`contraction_hierarchies_dijkstra`, which answers one pair per call and creates
+    a path, the distances of all pairs are computed using a single backend call. Large
+    batches are split among as many threads as the parallelism of the contraction
+    hierarchies.
+
+    :param graph: the graph
+    :param source_vertices: a sequence or buffer with the source of each pair
+    :param target_vertices: a sequence or buffer with the target of each pair
+    :param ch: the contraction hierarchy to use. If None it is computed from scratch.
+    :param radius: compute shortest paths of at most this length
+    :param with_paths: whether to also return the paths
+    :param as_numpy: if True return a NumPy array instead of :py:class:`array.array`
+    :returns: an array with the distance of each pair, infinity if there is no path. If
+      with_paths is True, a tuple with the distances and a sequence with the path of each
+      pair (None if there is no path), where each path is computed when first accessed
+    :raises ValueError: if the number of sources and targets differ
+    """
+    if radius is None:
+        radius = float.fromhex("0x1.fffffffffffffP+1023")
+
+    if ch is None:
+        ch = precompute_contraction_hierarchies(graph)
+
+    if _is_anyhashable_graph(graph):
+        source_vertices = list(source_vertices)
+        target_vertices = list(target_vertices)
+        distances = _ch_batch_distances(
+            ch,
+            graph._graph,
+            [_vertex_anyhashableg_to_g(graph, v) for v in source_vertices],
+            [_vertex_anyhashableg_to_g(graph, v) for v in target_vertices],
+            radius,
+        )
+    else:
+        distances = _ch_batch_distances(
+            ch, graph, source_vertices, target_vertices, radius
+        )
+
+    if as_numpy:
+        distances = _as_numpy(distances, "float64")
+    if not with_paths:
+        return distances
+
+    def get_path(i):
+        source, target = source_vertices[i], target_vertices[i]
+        if not _is_anyhashable_graph(graph):
+            source, target = int(source), int(target)
+        return contraction_hierarchies_dijkstra(
+            graph, source, target, ch=ch, radius=radius
+        )
+
+    return distances, _LazyPaths(get_path, len(distances))
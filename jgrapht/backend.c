@@ -1,5 +1,7 @@
 #include <stdlib.h>
 #include <stdio.h>
+#include <string.h>
+#include <math.h>
 
 #include <jgrapht_capi_types.h>
 #include <jgrapht_capi.h>
@@ -18,7 +20,8 @@ static THREAD_LOCAL graal_isolatethread_t *thread = NULL;
 
 // library init
 void jgrapht_init() {
-    // do we need to synchronize here, or does the GIL protect us?
+    // called only during module import while holding the GIL, all other threads
+    // attach lazily. See also LAZY_THREAD_ATTACH.
     if (isolate == NULL) { 
         // create isolate and attach thread
         if (graal_create_isolate(NULL, &isolate, &thread) != 0) {
@@ -137,6 +140,15 @@ int jgrapht_ll_attributes_store_put_string_attribute(void *store, long long int
     return jgrapht_capi_ll_attributes_store_put_string_attribute(thread, store, element, key, value);
 }
 
+int jgrapht_ii_attributes_store_put_string_attributes(void *store, char* key, int count, int* elements, long long int* offsets, unsigned char* values) {
+    int i, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count && status == STATUS_SUCCESS; i++) { 
+        status = jgrapht_capi_ii_attributes_store_put_string_attribute(thread, store, elements[i], key, (char *) values + offsets[i]);
+    }
+    return status;
+}
+
 int jgrapht_ii_attributes_store_remove_attribute(void *store, int element, char* key) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_ii_attributes_store_remove_attribute(thread, store, element, key);
@@ -162,6 +174,169 @@ int jgrapht_attributes_registry_unregister_attribute(void *registry, char* name,
     return jgrapht_capi_attributes_registry_unregister_attribute(thread, registry, name, category, type, default_value);
 }
 
+// attribute tables
+
+// Attributes reported by the importers are appended to an attribute table instead
+// of calling back into python. Strings are kept in a single pool, key i occupies
+// offsets[2i] to offsets[2i+1] and its value offsets[2i+1] to offsets[2i+2].
+typedef struct { 
+    int size;
+    int capacity;
+    int *ids;
+    long long *offsets;
+    char *strings;
+    long long strings_size;
+    long long strings_capacity;
+    int failed;
+} attribute_table_t;
+
+// the tables which the collectors of the current thread append to
+static THREAD_LOCAL attribute_table_t *vertex_attribute_table = NULL;
+static THREAD_LOCAL attribute_table_t *edge_attribute_table = NULL;
+
+static void attribute_table_append(attribute_table_t *table, int id, char *key, char *value) { 
+    size_t key_length = strlen(key), value_length = strlen(value);
+    long long required = table->strings_size + key_length + value_length;
+    int capacity;
+    long long strings_capacity;
+    void *p;
+
+    if (table->failed) { 
+        return;
+    }
+    if (table->size == table->capacity) { 
+        capacity = table->capacity > 0 ? 2 * table->capacity : 1024;
+        p = realloc(table->ids, capacity * sizeof(int));
+        if (p == NULL) { 
+            table->failed = 1;
+            return;
+        }
+        table->ids = p;
+        p = realloc(table->offsets, (2 * (size_t) capacity + 1) * sizeof(long long));
+        if (p == NULL) { 
+            table->failed = 1;
+            return;
+        }
+        table->offsets = p;
+        table->capacity = capacity;
+    }
+    if (required > table->strings_capacity) { 
+        strings_capacity = table->strings_capacity > 0 ? 2 * table->strings_capacity : 16384;
+        while (strings_capacity < required) { 
+            strings_capacity *= 2;
+        }
+        p = realloc(table->strings, strings_capacity);
+        if (p == NULL) { 
+            table->failed = 1;
+            return;
+        }
+        table->strings = p;
+        table->strings_capacity = strings_capacity;
+    }
+
+    table->ids[table->size] = id;
+    table->offsets[2 * table->size] = table->strings_size;
+    memcpy(table->strings + table->strings_size, key, key_length);
+    table->strings_size += key_length;
+    table->offsets[2 * table->size + 1] = table->strings_size;
+    memcpy(table->strings + table->strings_size, value, value_length);
+    table->strings_size += value_length;
+    table->size++;
+}
+
+static void collect_vertex_attribute(int id, char *key, char *value) { 
+    if (vertex_attribute_table != NULL) { 
+        attribute_table_append(vertex_attribute_table, id, key, value);
+    }
+}
+
+static void collect_edge_attribute(int id, char *key, char *value) { 
+    if (edge_attribute_table != NULL) { 
+        attribute_table_append(edge_attribute_table, id, key, value);
+    }
+}
+
+int jgrapht_attribute_table_create(void** res) { 
+    *res = calloc(1, sizeof(attribute_table_t));
+    if (*res == NULL) { 
+        return STATUS_ERROR;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jgrapht_attribute_table_unbind(void *table) { 
+    if (vertex_attribute_table == table) { 
+        vertex_attribute_table = NULL;
+    }
+    if (edge_attribute_table == table) { 
+        edge_attribute_table = NULL;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jgrapht_attribute_table_destroy(void *table) { 
+    attribute_table_t *t = table;
+    if (t == NULL) { 
+        return STATUS_SUCCESS;
+    }
+    jgrapht_attribute_table_unbind(t);
+    free(t->ids);
+    free(t->offsets);
+    free(t->strings);
+    free(t);
+    return STATUS_SUCCESS;
+}
+
+int jgrapht_attribute_table_bind(void *table, int edges, long long int* res) { 
+    if (edges) { 
+        edge_attribute_table = table;
+        *res = (long long int) (size_t) &collect_edge_attribute;
+    } else { 
+        vertex_attribute_table = table;
+        *res = (long long int) (size_t) &collect_vertex_attribute;
+    }
+    return STATUS_SUCCESS;
+}
+
+int jgrapht_attribute_table_size(void *table, int* size, long long int* strings_size, int* failed) { 
+    attribute_table_t *t = table;
+    *size = t->size;
+    *strings_size = t->strings_size;
+    *failed = t->failed;
+    return STATUS_SUCCESS;
+}
+
+// the offset of the k-th string of a table, where the last one ends the pool
+static long long attribute_table_offset(attribute_table_t *t, long long k) { 
+    return k == 2 * (long long) t->size ? t->strings_size : t->offsets[k];
+}
+
+int jgrapht_attribute_table_range_strings_size(void *table, int start, int count, long long int* res) { 
+    attribute_table_t *t = table;
+    if (start < 0 || count < 0 || count > t->size - start) { 
+        return STATUS_ILLEGAL_ARGUMENT;
+    }
+    *res = attribute_table_offset(t, 2 * (long long) (start + count)) - attribute_table_offset(t, 2 * (long long) start);
+    return STATUS_SUCCESS;
+}
+
+int jgrapht_attribute_table_get_range(void *table, int start, int count, int* ids, long long int* offsets, unsigned char* strings) { 
+    attribute_table_t *t = table;
+    long long base, k;
+    if (start < 0 || count < 0 || count > t->size - start) { 
+        return STATUS_ILLEGAL_ARGUMENT;
+    }
+    base = attribute_table_offset(t, 2 * (long long) start);
+    for (k = 0; k <= 2 * (long long) count; k++) { 
+        offsets[k] = attribute_table_offset(t, 2 * (long long) start + k) - base;
+    }
+    if (count > 0) { 
+        memcpy(ids, t->ids + start, count * sizeof(int));
+        memcpy(strings, t->strings + base, offsets[2 * (long long) count]);
+    }
+    return STATUS_SUCCESS;
+}
+
 // clique
 
 int jgrapht_xx_clique_exec_bron_kerbosch(void *g, long long int timeout, void** res) {
@@ -829,6 +1004,148 @@ int jgrapht_ii_graph_succinct_create(int directed, int num_vertices, void *edges
     return jgrapht_capi_ii_graph_succinct_create(thread, directed, num_vertices, edges, ies, res);
 }
 
+int jgrapht_ii_graph_sparse_create_from_csr(int directed, int weighted, int num_vertices, int count, int* indptr, int* indices, double* weights, incoming_edges_support_t ies, void** res) { 
+    int u, i, ignore, status = STATUS_SUCCESS;
+    void *edges;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_list_create(thread, &edges);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    for (u = 0; u < num_vertices && status == STATUS_SUCCESS; u++) { 
+        for (i = indptr[u] < 0 ? 0 : indptr[u]; i < indptr[u + 1] && i < count; i++) { 
+            // undirected graphs store each edge in both rows
+            if (!directed && indices[i] < u) { 
+                continue;
+            }
+            if (weights != NULL) { 
+                status = jgrapht_capi_ii_list_edge_triple_add(thread, edges, u, indices[i], weights[i], &ignore);
+            } else { 
+                status = jgrapht_capi_ii_list_edge_pair_add(thread, edges, u, indices[i], &ignore);
+            }
+            if (status != STATUS_SUCCESS) { 
+                break;
+            }
+        }
+    }
+    if (status == STATUS_SUCCESS) { 
+        status = jgrapht_capi_ii_graph_sparse_create(thread, directed, weighted, num_vertices, edges, ies, res);
+    }
+    jgrapht_capi_handles_destroy(thread, edges);
+    return status;
+}
+
+int jgrapht_ii_graph_sparse_create_from_arrays(int directed, int weighted, int num_vertices, int count, int* sources, int* targets, double* weights, incoming_edges_support_t ies, void** res) { 
+    int i, ignore, status = STATUS_SUCCESS;
+    void *edges;
+    LAZY_THREAD_ATTACH
+    // a negative number of vertices means that it should be computed from the edges
+    if (num_vertices < 0) { 
+        num_vertices = 0;
+        for (i = 0; i < count; i++) { 
+            if (sources[i] >= num_vertices) { 
+                num_vertices = sources[i] + 1;
+            }
+            if (targets[i] >= num_vertices) { 
+                num_vertices = targets[i] + 1;
+            }
+        }
+    }
+    status = jgrapht_capi_list_create(thread, &edges);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    for (i = 0; i < count && status == STATUS_SUCCESS; i++) { 
+        if (weights != NULL) { 
+            status = jgrapht_capi_ii_list_edge_triple_add(thread, edges, sources[i], targets[i], weights[i], &ignore);
+        } else { 
+            status = jgrapht_capi_ii_list_edge_pair_add(thread, edges, sources[i], targets[i], &ignore);
+        }
+    }
+    if (status == STATUS_SUCCESS) { 
+        status = jgrapht_capi_ii_graph_sparse_create(thread, directed, weighted, num_vertices, edges, ies, res);
+    }
+    jgrapht_capi_handles_destroy(thread, edges);
+    return status;
+}
+
+int jgrapht_ii_graph_succinct_create_from_arrays(int directed, int num_vertices, int count, int* sources, int* targets, incoming_edges_support_t ies, void** res) { 
+    int i, ignore, status = STATUS_SUCCESS;
+    void *edges;
+    LAZY_THREAD_ATTACH
+    // a negative number of vertices means that it should be computed from the edges
+    if (num_vertices < 0) { 
+        num_vertices = 0;
+        for (i = 0; i < count; i++) { 
+            if (sources[i] >= num_vertices) { 
+                num_vertices = sources[i] + 1;
+            }
+            if (targets[i] >= num_vertices) { 
+                num_vertices = targets[i] + 1;
+            }
+        }
+    }
+    status = jgrapht_capi_list_create(thread, &edges);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    for (i = 0; i < count && status == STATUS_SUCCESS; i++) { 
+        status = jgrapht_capi_ii_list_edge_pair_add(thread, edges, sources[i], targets[i], &ignore);
+    }
+    if (status == STATUS_SUCCESS) { 
+        status = jgrapht_capi_ii_graph_succinct_create(thread, directed, num_vertices, edges, ies, res);
+    }
+    jgrapht_capi_handles_destroy(thread, edges);
+    return status;
+}
+
+int jgrapht_ii_graph_to_csr(void *g, int num_vertices, int capacity, int* indptr, int* indices, int* edge_ids, double* weights, int* res) { 
+    int u, e, source, target, hasnext, count = 0, status = STATUS_SUCCESS;
+    void *it;
+    LAZY_THREAD_ATTACH
+    indptr[0] = 0;
+    for (u = 0; u < num_vertices; u++) { 
+        // fails if u is not a vertex of the graph
+        status = jgrapht_capi_ix_graph_vertex_create_out_eit(thread, g, u, &it);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        while (1) { 
+            status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+            if (status != STATUS_SUCCESS || !hasnext) { 
+                break;
+            }
+            if (count == capacity) { 
+                status = STATUS_INDEX_OUT_OF_BOUNDS;
+                break;
+            }
+            status = jgrapht_capi_it_next_int(thread, it, &e);
+            if (status == STATUS_SUCCESS) { 
+                status = jgrapht_capi_ii_graph_edge_source(thread, g, e, &source);
+            }
+            if (status == STATUS_SUCCESS) { 
+                status = jgrapht_capi_ii_graph_edge_target(thread, g, e, &target);
+            }
+            if (status == STATUS_SUCCESS) { 
+                status = jgrapht_capi_xi_graph_get_edge_weight(thread, g, e, weights + count);
+            }
+            if (status != STATUS_SUCCESS) { 
+                break;
+            }
+            indices[count] = source == u ? target : source;
+            edge_ids[count] = e;
+            count++;
+        }
+        jgrapht_capi_handles_destroy(thread, it);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        indptr[u + 1] = count;
+    }
+    *res = count;
+    return status;
+}
+
 // graph
 
 int jgrapht_ix_graph_vertices_count(void *g, int* res) { 
@@ -911,6 +1228,82 @@ int jgrapht_ll_graph_add_given_edge(void *g, long long int u, long long int v, l
     return jgrapht_capi_ll_graph_add_given_edge(thread, g, u, v, edge, res);
 }
 
+// add many edges using a single call from python, optionally setting their weights.
+// All endpoints are checked before inserting anything, and if an insertion still fails
+// the edges already added by the call are removed, leaving the graph unmodified.
+int jgrapht_ii_graph_add_edges(void *g, int count, int* sources, int* targets, double* weights, int* res) { 
+    int i, contained, removed, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_ix_graph_contains_vertex(thread, g, sources[i], &contained);
+        if (status == STATUS_SUCCESS && contained) { 
+            status = jgrapht_capi_ix_graph_contains_vertex(thread, g, targets[i], &contained);
+        }
+        if (status != STATUS_SUCCESS) { 
+            return status;
+        }
+        if (!contained) { 
+            return STATUS_ILLEGAL_ARGUMENT;
+        }
+    }
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_ii_graph_add_edge(thread, g, sources[i], targets[i], res + i);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (weights != NULL) { 
+            status = jgrapht_capi_xi_graph_set_edge_weight(thread, g, res[i], weights[i]);
+            if (status != STATUS_SUCCESS) { 
+                i++;
+                break;
+            }
+        }
+    }
+    if (status != STATUS_SUCCESS) { 
+        while (i-- > 0) { 
+            jgrapht_capi_xi_graph_remove_edge(thread, g, res[i], &removed);
+        }
+    }
+    return status;
+}
+
+int jgrapht_ll_graph_add_edges(void *g, long long int count, long long int* sources, long long int* targets, double* weights, long long int* res) { 
+    long long int i;
+    int contained, removed, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_lx_graph_contains_vertex(thread, g, sources[i], &contained);
+        if (status == STATUS_SUCCESS && contained) { 
+            status = jgrapht_capi_lx_graph_contains_vertex(thread, g, targets[i], &contained);
+        }
+        if (status != STATUS_SUCCESS) { 
+            return status;
+        }
+        if (!contained) { 
+            return STATUS_ILLEGAL_ARGUMENT;
+        }
+    }
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_ll_graph_add_edge(thread, g, sources[i], targets[i], res + i);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (weights != NULL) { 
+            status = jgrapht_capi_xl_graph_set_edge_weight(thread, g, res[i], weights[i]);
+            if (status != STATUS_SUCCESS) { 
+                i++;
+                break;
+            }
+        }
+    }
+    if (status != STATUS_SUCCESS) { 
+        while (i-- > 0) { 
+            jgrapht_capi_xl_graph_remove_edge(thread, g, res[i], &removed);
+        }
+    }
+    return status;
+}
+
 int jgrapht_xi_graph_remove_edge(void *g, int e, int* res) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_xi_graph_remove_edge(thread, g, e, res);
@@ -1128,6 +1521,43 @@ int jgrapht_xl_graph_as_weighted(void *g, void *weight_function, int cache_weigh
     return jgrapht_capi_xl_graph_as_weighted(thread, g, weight_function, cache_weights, write_weights_through, res);
 }
 
+int jgrapht_xi_graph_set_edge_weights(void *g, int count, int* edges, double* weights) { 
+    int i, status;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_xi_graph_set_edge_weight(thread, g, edges[i], weights[i]);
+        if (status != STATUS_SUCCESS) { 
+            return status;
+        }
+    }
+    return STATUS_SUCCESS;
+}
+
+int jgrapht_xi_graph_set_edge_weights_from_array(void *g, int size, double* weights) { 
+    int e, hasnext, status;
+    void *it;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_xx_graph_create_all_eit(thread, g, &it);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    while (1) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, it, &e);
+        if (status == STATUS_SUCCESS && e >= 0 && e < size) { 
+            status = jgrapht_capi_xi_graph_set_edge_weight(thread, g, e, weights[e]);
+        }
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+    }
+    jgrapht_capi_handles_destroy(thread, it);
+    return status;
+}
+
 int jgrapht_ii_graph_as_masked_subgraph(void *g, void *vertex_mask_function, void *edge_mask_function, void** res) {
     LAZY_THREAD_ATTACH
     return jgrapht_capi_ii_graph_as_masked_subgraph(thread, g, vertex_mask_function, edge_mask_function, res);
@@ -1143,6 +1573,87 @@ int jgrapht_xx_graph_as_subgraph(void *g, void *vertex_set, void *edge_set, void
     return jgrapht_capi_xx_graph_as_subgraph(thread, g, vertex_set, edge_set, res);
 }
 
+int jgrapht_ii_graph_subgraph_apply_masks(void *subgraph, void *g, int vertex_mask_size, unsigned char* vertex_mask, int edge_mask_size, unsigned char* edge_mask) { 
+    int v, e, source, target, masked, contained, present, hasnext, ignored, status;
+    void *it;
+    LAZY_THREAD_ATTACH
+    // vertices first, removing a vertex also removes its edges from the subgraph
+    status = jgrapht_capi_xx_graph_create_all_vit(thread, g, &it);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    while (1) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, it, &v);
+        if (status == STATUS_SUCCESS) { 
+            status = jgrapht_capi_ix_graph_contains_vertex(thread, subgraph, v, &contained);
+        }
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        masked = vertex_mask != NULL && v >= 0 && v < vertex_mask_size && vertex_mask[v];
+        if (masked && contained) { 
+            status = jgrapht_capi_ix_graph_remove_vertex(thread, subgraph, v, &ignored);
+        } else if (!masked && !contained) { 
+            status = jgrapht_capi_ix_graph_add_given_vertex(thread, subgraph, v, &ignored);
+        }
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+    }
+    jgrapht_capi_handles_destroy(thread, it);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+
+    // an edge is kept if it is not masked and both of its endpoints are kept
+    status = jgrapht_capi_xx_graph_create_all_eit(thread, g, &it);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    while (1) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, it, &e);
+        if (status == STATUS_SUCCESS) { 
+            status = jgrapht_capi_ii_graph_edge_source(thread, g, e, &source);
+        }
+        if (status == STATUS_SUCCESS) { 
+            status = jgrapht_capi_ii_graph_edge_target(thread, g, e, &target);
+        }
+        if (status == STATUS_SUCCESS) { 
+            status = jgrapht_capi_xi_graph_contains_edge(thread, subgraph, e, &contained);
+        }
+        masked = edge_mask != NULL && e >= 0 && e < edge_mask_size && edge_mask[e];
+        if (status == STATUS_SUCCESS && !masked) { 
+            status = jgrapht_capi_ix_graph_contains_vertex(thread, subgraph, source, &present);
+            masked = !present;
+        }
+        if (status == STATUS_SUCCESS && !masked) { 
+            status = jgrapht_capi_ix_graph_contains_vertex(thread, subgraph, target, &present);
+            masked = !present;
+        }
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (masked && contained) { 
+            status = jgrapht_capi_xi_graph_remove_edge(thread, subgraph, e, &ignored);
+        } else if (!masked && !contained) { 
+            status = jgrapht_capi_ii_graph_add_given_edge(thread, subgraph, source, target, e, &ignored);
+        }
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+    }
+    jgrapht_capi_handles_destroy(thread, it);
+    return status;
+}
+
 int jgrapht_xx_graph_as_graph_union(void *g1, void *g2, void *weight_combiner_function, void** res) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_xx_graph_as_graph_union(thread, g1, g2, weight_combiner_function, res);
@@ -1498,6 +2009,28 @@ int jgrapht_handles_get_ccharpointer(void *handle, char** res) {
     return jgrapht_capi_handles_get_ccharpointer(thread, handle, res);
 }
 
+int jgrapht_handles_get_ccharpointer_length(void *handle, long long int* res) { 
+    char *str;
+    int status;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_handles_get_ccharpointer(thread, handle, &str);
+    if (status == STATUS_SUCCESS) { 
+        *res = (long long int) strlen(str);
+    }
+    return status;
+}
+
+int jgrapht_handles_copy_ccharpointer(void *handle, long long int offset, int size, unsigned char* buffer) { 
+    char *str;
+    int status;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_handles_get_ccharpointer(thread, handle, &str);
+    if (status == STATUS_SUCCESS) { 
+        memcpy(buffer, str + offset, size);
+    }
+    return status;
+}
+
 int jgrapht_handles_get_edge_pair(void *handle, int* s, int* t) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_handles_get_edge_pair(thread, handle, s, t);
@@ -2068,6 +2601,98 @@ int jgrapht_it_hasnext(void *it, int* res) {
     return jgrapht_capi_it_hasnext(thread, it, res);
 }
 
+// iterators - fetch many elements using a single call
+
+int jgrapht_it_next_int_chunk(void *it, int size, int* values, int* res) { 
+    int count = 0, hasnext, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    while (count < size) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, it, values + count);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        count++;
+    }
+    *res = count;
+    return status;
+}
+
+int jgrapht_it_next_long_chunk(void *it, int size, long long* values, int* res) { 
+    int count = 0, hasnext, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    while (count < size) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_long(thread, it, values + count);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        count++;
+    }
+    *res = count;
+    return status;
+}
+
+int jgrapht_it_next_double_chunk(void *it, int size, double* values, int* res) { 
+    int count = 0, hasnext, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    while (count < size) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_double(thread, it, values + count);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        count++;
+    }
+    *res = count;
+    return status;
+}
+
+int jgrapht_it_next_int_edge_triple_chunk(void *it, int size, int* sources, int* targets, double* weights, int* res) { 
+    int count = 0, hasnext, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    while (count < size) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int_edge_triple(thread, it, sources + count, targets + count, weights + count);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        count++;
+    }
+    *res = count;
+    return status;
+}
+
+int jgrapht_it_next_long_edge_triple_chunk(void *it, int size, long long* sources, long long* targets, double* weights, int* res) { 
+    int count = 0, hasnext, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    while (count < size) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_long_edge_triple(thread, it, sources + count, targets + count, weights + count);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        count++;
+    }
+    *res = count;
+    return status;
+}
+
 // link prediction
 
 int jgrapht_ix_link_prediction_exec_adamic_adar_index(void *g, int u, int v, double* res) { 
@@ -2222,6 +2847,36 @@ int jgrapht_ll_list_edge_triple_add(void *list, long long int source, long long
     return jgrapht_capi_ll_list_edge_triple_add(thread, list, source, target, weight, res);
 }
 
+int jgrapht_ii_list_edge_triple_num_vertices(void *list, int* res) { 
+    int source, target, hasnext, num_vertices = 0, status;
+    double weight;
+    void *it;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_list_it_create(thread, list, &it);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    while (1) { 
+        status = jgrapht_capi_it_hasnext(thread, it, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int_edge_triple(thread, it, &source, &target, &weight);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (source >= num_vertices) { 
+            num_vertices = source + 1;
+        }
+        if (target >= num_vertices) { 
+            num_vertices = target + 1;
+        }
+    }
+    jgrapht_capi_handles_destroy(thread, it);
+    *res = num_vertices;
+    return status;
+}
+
 int jgrapht_list_int_remove(void *list, int e) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_list_int_remove(thread, list, e);
@@ -2336,6 +2991,15 @@ int jgrapht_map_int_string_put(void *map, int key, char* value) {
     return jgrapht_capi_map_int_string_put(thread, map, key, value);
 }
 
+int jgrapht_map_int_string_put_all(void *map, int count, int* keys, long long int* offsets, unsigned char* values) { 
+    int i, status = STATUS_SUCCESS;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count && status == STATUS_SUCCESS; i++) { 
+        status = jgrapht_capi_map_int_string_put(thread, map, keys[i], (char *) values + offsets[i]);
+    }
+    return status;
+}
+
 int jgrapht_map_long_double_put(void *map, long long int key, double value) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_map_long_double_put(thread, map, key, value);
@@ -2426,6 +3090,152 @@ int jgrapht_map_clear(void *map) {
     return jgrapht_capi_map_clear(thread, map);
 }
 
+// map - export into buffers, keys are always widened to 64-bit
+
+int jgrapht_map_int_double_to_arrays(void *map, int size, long long int* keys, double* values) { 
+    void *kit, *vit;
+    int i, hasnext, status;
+    int key;
+    double value;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_map_keys_it_create(thread, map, &kit);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    status = jgrapht_capi_map_values_it_create(thread, map, &vit);
+    if (status != STATUS_SUCCESS) { 
+        jgrapht_capi_handles_destroy(thread, kit);
+        return status;
+    }
+    for (i = 0; i < size; i++) { 
+        status = jgrapht_capi_it_hasnext(thread, kit, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, kit, &key);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_double(thread, vit, &value);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        keys[i] = key;
+        values[i] = value;
+    }
+    jgrapht_capi_handles_destroy(thread, kit);
+    jgrapht_capi_handles_destroy(thread, vit);
+    return status;
+}
+
+int jgrapht_map_int_int_to_arrays(void *map, int size, long long int* keys, int* values) { 
+    void *kit, *vit;
+    int i, hasnext, status;
+    int key;
+    int value;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_map_keys_it_create(thread, map, &kit);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    status = jgrapht_capi_map_values_it_create(thread, map, &vit);
+    if (status != STATUS_SUCCESS) { 
+        jgrapht_capi_handles_destroy(thread, kit);
+        return status;
+    }
+    for (i = 0; i < size; i++) { 
+        status = jgrapht_capi_it_hasnext(thread, kit, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, kit, &key);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, vit, &value);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        keys[i] = key;
+        values[i] = value;
+    }
+    jgrapht_capi_handles_destroy(thread, kit);
+    jgrapht_capi_handles_destroy(thread, vit);
+    return status;
+}
+
+int jgrapht_map_long_double_to_arrays(void *map, int size, long long int* keys, double* values) { 
+    void *kit, *vit;
+    int i, hasnext, status;
+    long long key;
+    double value;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_map_keys_it_create(thread, map, &kit);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    status = jgrapht_capi_map_values_it_create(thread, map, &vit);
+    if (status != STATUS_SUCCESS) { 
+        jgrapht_capi_handles_destroy(thread, kit);
+        return status;
+    }
+    for (i = 0; i < size; i++) { 
+        status = jgrapht_capi_it_hasnext(thread, kit, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_long(thread, kit, &key);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_double(thread, vit, &value);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        keys[i] = key;
+        values[i] = value;
+    }
+    jgrapht_capi_handles_destroy(thread, kit);
+    jgrapht_capi_handles_destroy(thread, vit);
+    return status;
+}
+
+int jgrapht_map_long_int_to_arrays(void *map, int size, long long int* keys, int* values) { 
+    void *kit, *vit;
+    int i, hasnext, status;
+    long long key;
+    int value;
+    LAZY_THREAD_ATTACH
+    status = jgrapht_capi_map_keys_it_create(thread, map, &kit);
+    if (status != STATUS_SUCCESS) { 
+        return status;
+    }
+    status = jgrapht_capi_map_values_it_create(thread, map, &vit);
+    if (status != STATUS_SUCCESS) { 
+        jgrapht_capi_handles_destroy(thread, kit);
+        return status;
+    }
+    for (i = 0; i < size; i++) { 
+        status = jgrapht_capi_it_hasnext(thread, kit, &hasnext);
+        if (status != STATUS_SUCCESS || !hasnext) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_long(thread, kit, &key);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        status = jgrapht_capi_it_next_int(thread, vit, &value);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        keys[i] = key;
+        values[i] = value;
+    }
+    jgrapht_capi_handles_destroy(thread, kit);
+    jgrapht_capi_handles_destroy(thread, vit);
+    return status;
+}
+
 // matching
 
 int jgrapht_xx_matching_exec_greedy_general_max_card(void *g, double* weight_res, void** res) { 
@@ -2765,6 +3575,220 @@ int jgrapht_lx_sp_singlesource_get_path_to_vertex(void *singlesource, long long
     return jgrapht_capi_lx_sp_singlesource_get_path_to_vertex(thread, singlesource, target, res);
 }
 
+// sp - distances and last edges of the paths to a list of vertices. Unreachable
+// vertices get an infinite distance and the source and unreachable vertices a -1
+// predecessor edge.
+
+int jgrapht_ix_sp_singlesource_get_distances(void *singlesource, int count, int* vertices, double* distances, int* predecessors) { 
+    void *path, *eit;
+    int i, hasnext, status = STATUS_SUCCESS;
+    int start, end, edge, last;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_ix_sp_singlesource_get_path_to_vertex(thread, singlesource, vertices[i], &path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (path == NULL) { 
+            distances[i] = INFINITY;
+            if (predecessors != NULL) { 
+                predecessors[i] = -1;
+            }
+            continue;
+        }
+        status = jgrapht_capi_ix_handles_get_graphpath(thread, path, distances + i, &start, &end, &eit);
+        if (status != STATUS_SUCCESS) { 
+            jgrapht_capi_handles_destroy(thread, path);
+            break;
+        }
+        if (predecessors != NULL) { 
+            last = -1;
+            while (1) { 
+                status = jgrapht_capi_it_hasnext(thread, eit, &hasnext);
+                if (status != STATUS_SUCCESS || !hasnext) { 
+                    break;
+                }
+                status = jgrapht_capi_it_next_int(thread, eit, &edge);
+                if (status != STATUS_SUCCESS) { 
+                    break;
+                }
+                last = edge;
+            }
+            predecessors[i] = last;
+        }
+        jgrapht_capi_handles_destroy(thread, eit);
+        jgrapht_capi_handles_destroy(thread, path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+    }
+    return status;
+}
+
+int jgrapht_lx_sp_singlesource_get_distances(void *singlesource, int count, long long int* vertices, double* distances, long long int* predecessors) { 
+    void *path, *eit;
+    int i, hasnext, status = STATUS_SUCCESS;
+    long long int start, end, edge, last;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_lx_sp_singlesource_get_path_to_vertex(thread, singlesource, vertices[i], &path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (path == NULL) { 
+            distances[i] = INFINITY;
+            if (predecessors != NULL) { 
+                predecessors[i] = -1;
+            }
+            continue;
+        }
+        status = jgrapht_capi_lx_handles_get_graphpath(thread, path, distances + i, &start, &end, &eit);
+        if (status != STATUS_SUCCESS) { 
+            jgrapht_capi_handles_destroy(thread, path);
+            break;
+        }
+        if (predecessors != NULL) { 
+            last = -1;
+            while (1) { 
+                status = jgrapht_capi_it_hasnext(thread, eit, &hasnext);
+                if (status != STATUS_SUCCESS || !hasnext) { 
+                    break;
+                }
+                status = jgrapht_capi_it_next_long(thread, eit, &edge);
+                if (status != STATUS_SUCCESS) { 
+                    break;
+                }
+                last = edge;
+            }
+            predecessors[i] = last;
+        }
+        jgrapht_capi_handles_destroy(thread, eit);
+        jgrapht_capi_handles_destroy(thread, path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+    }
+    return status;
+}
+
+// sp - distances of all pairs of a sources x targets block, in row-major order. Missing
+// paths get an infinite distance. If offsets are given they receive the running total
+// of the number of edges of the paths, and if edges are given, the edges of all paths
+// one after the other. Edges cannot be collected before their total is known.
+
+typedef int (*ix_path_between_t)(graal_isolatethread_t *, void *, int, int, void **);
+typedef int (*lx_path_between_t)(graal_isolatethread_t *, void *, long long int, long long int, void **);
+
+static int sp_ix_paths_to_matrix(ix_path_between_t get_path, void *paths, int num_sources, int* sources, int num_targets, int* targets, double* distances, long long int* offsets, int* edges) { 
+    void *path, *eit;
+    int i, j, hasnext, status = STATUS_SUCCESS;
+    long long int k, count = 0;
+    double weight;
+    int start, end, edge;
+    if (offsets != NULL) { 
+        offsets[0] = 0;
+    }
+    for (i = 0; i < num_sources && status == STATUS_SUCCESS; i++) { 
+        for (j = 0; j < num_targets; j++) { 
+            k = (long long int) i * num_targets + j;
+            status = get_path(thread, paths, sources[i], targets[j], &path);
+            if (status != STATUS_SUCCESS) { 
+                break;
+            }
+            if (path == NULL) { 
+                weight = INFINITY;
+            } else { 
+                status = jgrapht_capi_ix_handles_get_graphpath(thread, path, &weight, &start, &end, &eit);
+                if (status != STATUS_SUCCESS) { 
+                    jgrapht_capi_handles_destroy(thread, path);
+                    break;
+                }
+                while (offsets != NULL || edges != NULL) { 
+                    status = jgrapht_capi_it_hasnext(thread, eit, &hasnext);
+                    if (status != STATUS_SUCCESS || !hasnext) { 
+                        break;
+                    }
+                    status = jgrapht_capi_it_next_int(thread, eit, &edge);
+                    if (status != STATUS_SUCCESS) { 
+                        break;
+                    }
+                    if (edges != NULL) { 
+                        edges[count] = edge;
+                    }
+                    count++;
+                }
+                jgrapht_capi_handles_destroy(thread, eit);
+                jgrapht_capi_handles_destroy(thread, path);
+                if (status != STATUS_SUCCESS) { 
+                    break;
+                }
+            }
+            if (distances != NULL) { 
+                distances[k] = weight;
+            }
+            if (offsets != NULL) { 
+                offsets[k + 1] = count;
+            }
+        }
+    }
+    return status;
+}
+
+static int sp_lx_paths_to_matrix(lx_path_between_t get_path, void *paths, int num_sources, long long int* sources, int num_targets, long long int* targets, double* distances, long long int* offsets, long long int* edges) { 
+    void *path, *eit;
+    int i, j, hasnext, status = STATUS_SUCCESS;
+    long long int k, count = 0;
+    double weight;
+    long long int start, end, edge;
+    if (offsets != NULL) { 
+        offsets[0] = 0;
+    }
+    for (i = 0; i < num_sources && status == STATUS_SUCCESS; i++) { 
+        for (j = 0; j < num_targets; j++) { 
+            k = (long long int) i * num_targets + j;
+            status = get_path(thread, paths, sources[i], targets[j], &path);
+            if (status != STATUS_SUCCESS) { 
+                break;
+            }
+            if (path == NULL) { 
+                weight = INFINITY;
+            } else { 
+                status = jgrapht_capi_lx_handles_get_graphpath(thread, path, &weight, &start, &end, &eit);
+                if (status != STATUS_SUCCESS) { 
+                    jgrapht_capi_handles_destroy(thread, path);
+                    break;
+                }
+                while (offsets != NULL || edges != NULL) { 
+                    status = jgrapht_capi_it_hasnext(thread, eit, &hasnext);
+                    if (status != STATUS_SUCCESS || !hasnext) { 
+                        break;
+                    }
+                    status = jgrapht_capi_it_next_long(thread, eit, &edge);
+                    if (status != STATUS_SUCCESS) { 
+                        break;
+                    }
+                    if (edges != NULL) { 
+                        edges[count] = edge;
+                    }
+                    count++;
+                }
+                jgrapht_capi_handles_destroy(thread, eit);
+                jgrapht_capi_handles_destroy(thread, path);
+                if (status != STATUS_SUCCESS) { 
+                    break;
+                }
+            }
+            if (distances != NULL) { 
+                distances[k] = weight;
+            }
+            if (offsets != NULL) { 
+                offsets[k + 1] = count;
+            }
+        }
+    }
+    return status;
+}
+
 int jgrapht_ix_sp_allpairs_get_path_between_vertices(void *allpairs, int source, int target, void** res) {
     LAZY_THREAD_ATTACH
     return jgrapht_capi_ix_sp_allpairs_get_path_between_vertices(thread, allpairs, source, target, res);
@@ -2785,6 +3809,16 @@ int jgrapht_lx_sp_allpairs_get_singlesource_from_vertex(void *allpairs, long lon
     return jgrapht_capi_lx_sp_allpairs_get_singlesource_from_vertex(thread, allpairs, source, res);
 }
 
+int jgrapht_ix_sp_allpairs_get_distances(void *allpairs, int num_sources, int* sources, int num_targets, int* targets, double* distances, long long int* offsets, int* edges) { 
+    LAZY_THREAD_ATTACH
+    return sp_ix_paths_to_matrix(jgrapht_capi_ix_sp_allpairs_get_path_between_vertices, allpairs, num_sources, sources, num_targets, targets, distances, offsets, edges);
+}
+
+int jgrapht_lx_sp_allpairs_get_distances(void *allpairs, int num_sources, long long int* sources, int num_targets, long long int* targets, double* distances, long long int* offsets, long long int* edges) { 
+    LAZY_THREAD_ATTACH
+    return sp_lx_paths_to_matrix(jgrapht_capi_lx_sp_allpairs_get_path_between_vertices, allpairs, num_sources, sources, num_targets, targets, distances, offsets, edges);
+}
+
 int jgrapht_ix_sp_exec_astar_get_path_between_vertices(void *g, int source, int target, void *heuristic, void** res) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_ix_sp_exec_astar_get_path_between_vertices(thread, g, source, target, heuristic, res);
@@ -2825,6 +3859,66 @@ int jgrapht_lx_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertic
     return jgrapht_capi_lx_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices(thread, g, source, target, landmarks_set, res);
 }
 
+// sp - A* with precomputed landmark distances. The heuristic callback of the capi
+// carries no user data, thus the distances of the running query are kept per thread.
+
+typedef struct { 
+    int count;
+    long long int size;
+    double *from_landmarks;
+    double *to_landmarks;
+} alt_landmarks_t;
+
+static THREAD_LOCAL alt_landmarks_t *alt_landmarks = NULL;
+
+static double alt_heuristic(long long int u, long long int t) { 
+    int l;
+    long long int size = alt_landmarks->size;
+    double estimate = 0.0, d;
+    double *from, *to;
+    if (u < 0 || t < 0 || u >= size || t >= size) { 
+        return 0.0;
+    }
+    for (l = 0; l < alt_landmarks->count; l++) { 
+        from = alt_landmarks->from_landmarks + l * size;
+        to = alt_landmarks->to_landmarks + l * size;
+        // infinite distances give no bound
+        if (!isinf(from[t]) && !isinf(from[u])) { 
+            d = from[t] - from[u];
+            if (d > estimate) { 
+                estimate = d;
+            }
+        }
+        if (!isinf(to[u]) && !isinf(to[t])) { 
+            d = to[u] - to[t];
+            if (d > estimate) { 
+                estimate = d;
+            }
+        }
+    }
+    return estimate;
+}
+
+int jgrapht_ix_sp_exec_astar_alt_landmarks_get_path_between_vertices(void *g, int source, int target, int count, long long int size, double* from_landmarks, double* to_landmarks, void** res) { 
+    alt_landmarks_t landmarks = { count, size, from_landmarks, to_landmarks };
+    int status;
+    LAZY_THREAD_ATTACH
+    alt_landmarks = &landmarks;
+    status = jgrapht_capi_ix_sp_exec_astar_get_path_between_vertices(thread, g, source, target, (void *) alt_heuristic, res);
+    alt_landmarks = NULL;
+    return status;
+}
+
+int jgrapht_ix_sp_exec_bidirectional_astar_alt_landmarks_get_path_between_vertices(void *g, int source, int target, int count, long long int size, double* from_landmarks, double* to_landmarks, void** res) { 
+    alt_landmarks_t landmarks = { count, size, from_landmarks, to_landmarks };
+    int status;
+    LAZY_THREAD_ATTACH
+    alt_landmarks = &landmarks;
+    status = jgrapht_capi_ix_sp_exec_bidirectional_astar_get_path_between_vertices(thread, g, source, target, (void *) alt_heuristic, res);
+    alt_landmarks = NULL;
+    return status;
+}
+
 int jgrapht_ix_sp_exec_yen_get_k_loopless_paths_between_vertices(void *g, int source, int target, int k, void**res) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_ix_sp_exec_yen_get_k_loopless_paths_between_vertices(thread, g, source, target, k, res);
@@ -2909,6 +4003,16 @@ int jgrapht_lx_sp_manytomany_get_path_between_vertices(void *mm, long long int s
     return jgrapht_capi_lx_sp_manytomany_get_path_between_vertices(thread, mm, source, target, res);
 }
 
+int jgrapht_ix_sp_manytomany_get_distances(void *mm, int num_sources, int* sources, int num_targets, int* targets, double* distances, long long int* offsets, int* edges) { 
+    LAZY_THREAD_ATTACH
+    return sp_ix_paths_to_matrix(jgrapht_capi_ix_sp_manytomany_get_path_between_vertices, mm, num_sources, sources, num_targets, targets, distances, offsets, edges);
+}
+
+int jgrapht_lx_sp_manytomany_get_distances(void *mm, int num_sources, long long int* sources, int num_targets, long long int* targets, double* distances, long long int* offsets, long long int* edges) { 
+    LAZY_THREAD_ATTACH
+    return sp_lx_paths_to_matrix(jgrapht_capi_lx_sp_manytomany_get_path_between_vertices, mm, num_sources, sources, num_targets, targets, distances, offsets, edges);
+}
+
 int jgrapht_xx_sp_exec_contraction_hierarchy(void *g, int parallelism, long long int seed, void** res) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_xx_sp_exec_contraction_hierarchy(thread, g, parallelism, seed, res);
@@ -2929,6 +4033,64 @@ int jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_bet
     return jgrapht_capi_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(thread, ch, source, target, radius, res);
 }
 
+// sp - distances of a batch of source/target pairs using contraction hierarchies. Missing
+// paths, including the ones longer than the radius, get an infinite distance.
+
+int jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances(void *ch, int count, int* sources, int* targets, double radius, double* distances) { 
+    void *path, *eit;
+    int i, start, end, status = STATUS_SUCCESS;
+    double weight;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(thread, ch, sources[i], targets[i], radius, &path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (path == NULL) { 
+            distances[i] = INFINITY;
+            continue;
+        }
+        status = jgrapht_capi_ix_handles_get_graphpath(thread, path, &weight, &start, &end, &eit);
+        if (status == STATUS_SUCCESS) { 
+            jgrapht_capi_handles_destroy(thread, eit);
+        }
+        jgrapht_capi_handles_destroy(thread, path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        distances[i] = weight;
+    }
+    return status;
+}
+
+int jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances(void *ch, int count, long long int* sources, long long int* targets, double radius, double* distances) { 
+    void *path, *eit;
+    int i, status = STATUS_SUCCESS;
+    long long int start, end;
+    double weight;
+    LAZY_THREAD_ATTACH
+    for (i = 0; i < count; i++) { 
+        status = jgrapht_capi_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(thread, ch, sources[i], targets[i], radius, &path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        if (path == NULL) { 
+            distances[i] = INFINITY;
+            continue;
+        }
+        status = jgrapht_capi_lx_handles_get_graphpath(thread, path, &weight, &start, &end, &eit);
+        if (status == STATUS_SUCCESS) { 
+            jgrapht_capi_handles_destroy(thread, eit);
+        }
+        jgrapht_capi_handles_destroy(thread, path);
+        if (status != STATUS_SUCCESS) { 
+            break;
+        }
+        distances[i] = weight;
+    }
+    return status;
+}
+
 int jgrapht_xx_sp_exec_transit_node_routing(void *g, int parallelism, void** res) { 
     LAZY_THREAD_ATTACH
     return jgrapht_capi_xx_sp_exec_transit_node_routing(thread, g, parallelism, res);
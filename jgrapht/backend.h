@@ -58,6 +58,8 @@ int jgrapht_ii_attributes_store_put_string_attribute(void *, int, char*, char*);
 
 int jgrapht_ll_attributes_store_put_string_attribute(void *, long long int, char*, char*);
 
+int jgrapht_ii_attributes_store_put_string_attributes(void *, char*, int, int*, long long int*, unsigned char*);
+
 int jgrapht_ii_attributes_store_remove_attribute(void *, int, char*);
 
 int jgrapht_ll_attributes_store_remove_attribute(void *, long long int, char*);
@@ -68,6 +70,22 @@ int jgrapht_attributes_registry_register_attribute(void *, char*, char*, char*,
 
 int jgrapht_attributes_registry_unregister_attribute(void *, char*, char*, char*, char*);
 
+// attribute tables
+
+int jgrapht_attribute_table_create(void**);
+
+int jgrapht_attribute_table_destroy(void *);
+
+int jgrapht_attribute_table_bind(void *, int, long long int*);
+
+int jgrapht_attribute_table_unbind(void *);
+
+int jgrapht_attribute_table_size(void *, int*, long long int*, int*);
+
+int jgrapht_attribute_table_range_strings_size(void *, int, int, long long int*);
+
+int jgrapht_attribute_table_get_range(void *, int, int, int*, long long int*, unsigned char*);
+
 // clique
 
 int jgrapht_xx_clique_exec_bron_kerbosch(void *, long long int, void**);
@@ -245,6 +263,10 @@ int jgrapht_ii_graph_create(int, int, int, int, void*, void*, void**);
 int jgrapht_ll_graph_create(int, int, int, int, void*, void*, void**);
 int jgrapht_ii_graph_sparse_create(int, int, int, void *, incoming_edges_support_t, void**);
 int jgrapht_ii_graph_succinct_create(int, int, void *, incoming_edges_support_t, void**);
+int jgrapht_ii_graph_sparse_create_from_csr(int, int, int, int, int*, int*, double*, incoming_edges_support_t, void**);
+int jgrapht_ii_graph_sparse_create_from_arrays(int, int, int, int, int*, int*, double*, incoming_edges_support_t, void**);
+int jgrapht_ii_graph_succinct_create_from_arrays(int, int, int, int*, int*, incoming_edges_support_t, void**);
+int jgrapht_ii_graph_to_csr(void *, int, int, int*, int*, int*, double*, int*);
 
 // graph
 
@@ -264,6 +286,8 @@ int jgrapht_ii_graph_add_edge(void *, int, int, int*);
 int jgrapht_ll_graph_add_edge(void *, long long int, long long int, long long*);
 int jgrapht_ii_graph_add_given_edge(void *, int, int, int, int*);
 int jgrapht_ll_graph_add_given_edge(void *, long long int, long long int, long long int, int*);
+int jgrapht_ii_graph_add_edges(void *, int, int*, int*, double*, int*);
+int jgrapht_ll_graph_add_edges(void *, long long int, long long int*, long long int*, double*, long long int*);
 int jgrapht_xi_graph_remove_edge(void *, int, int*);
 int jgrapht_xl_graph_remove_edge(void *, long long int, int*);
 int jgrapht_xi_graph_contains_edge(void *, int, int*);
@@ -310,9 +334,12 @@ int jgrapht_xx_graph_as_unweighted(void *, void**);
 int jgrapht_xx_graph_as_edgereversed(void *, void**);
 int jgrapht_xi_graph_as_weighted(void *, void *, int, int, void**);
 int jgrapht_xl_graph_as_weighted(void *, void *, int, int, void**);
+int jgrapht_xi_graph_set_edge_weights(void *, int, int*, double*);
+int jgrapht_xi_graph_set_edge_weights_from_array(void *, int, double*);
 int jgrapht_ii_graph_as_masked_subgraph(void *, void *, void *, void**);
 int jgrapht_ll_graph_as_masked_subgraph(void *, void *, void *, void**);
 int jgrapht_xx_graph_as_subgraph(void *, void *, void *, void**);
+int jgrapht_ii_graph_subgraph_apply_masks(void *, void *, int, unsigned char*, int, unsigned char*);
 int jgrapht_xx_graph_as_graph_union(void *, void *, void *, void**);
 
 // dag
@@ -397,6 +424,8 @@ int jgrapht_xl_graph_attrs_edge_size(void *, long long int, int*);
 
 int jgrapht_handles_destroy(void *);
 int jgrapht_handles_get_ccharpointer(void *, char**);
+int jgrapht_handles_get_ccharpointer_length(void *, long long int*);
+int jgrapht_handles_copy_ccharpointer(void *, long long int, int, unsigned char*);
 int jgrapht_handles_get_edge_pair(void *, int*, int*);
 int jgrapht_handles_get_long_edge_pair(void *, long long*, long long*);
 int jgrapht_handles_get_edge_triple(void *, int*, int*, double*);
@@ -522,6 +551,11 @@ int jgrapht_it_next_long_edge_triple(void *, long long *, long long *, double*);
 int jgrapht_it_next_str_edge_triple(void *, char **, char **, double*);
 int jgrapht_it_next_object(void *, void**);
 int jgrapht_it_hasnext(void *, int*);
+int jgrapht_it_next_int_chunk(void *, int, int*, int*);
+int jgrapht_it_next_long_chunk(void *, int, long long*, int*);
+int jgrapht_it_next_double_chunk(void *, int, double*, int*);
+int jgrapht_it_next_int_edge_triple_chunk(void *, int, int*, int*, double*, int*);
+int jgrapht_it_next_long_edge_triple_chunk(void *, int, long long*, long long*, double*, int*);
 
 // link prediction
 
@@ -558,6 +592,7 @@ int jgrapht_ii_list_edge_pair_add(void *, int, int, int*);
 int jgrapht_ll_list_edge_pair_add(void *, long long int, long long int, int*);
 int jgrapht_ii_list_edge_triple_add(void *, int, int, double, int*);
 int jgrapht_ll_list_edge_triple_add(void *, long long int, long long int, double, int*);
+int jgrapht_ii_list_edge_triple_num_vertices(void *, int*);
 int jgrapht_list_int_remove(void *, int);
 int jgrapht_list_long_remove(void *, long long int);
 int jgrapht_list_double_remove(void *, double);
@@ -586,6 +621,7 @@ int jgrapht_map_values_it_create(void *, void**);
 int jgrapht_map_int_double_put(void *, int, double);
 int jgrapht_map_int_int_put(void *, int, int);
 int jgrapht_map_int_string_put(void *, int, char*);
+int jgrapht_map_int_string_put_all(void *, int, int*, long long int*, unsigned char*);
 int jgrapht_map_long_double_put(void *, long long int, double);
 int jgrapht_map_long_int_put(void *, long long int, int);
 int jgrapht_map_long_string_put(void *, long long int, char*);
@@ -604,6 +640,10 @@ int jgrapht_map_long_double_remove(void *, long long int, double*);
 int jgrapht_map_long_int_remove(void *, long long int, int*);
 int jgrapht_map_long_string_remove(void *, long long int, void**);
 int jgrapht_map_clear(void *);
+int jgrapht_map_int_double_to_arrays(void *, int, long long int*, double*);
+int jgrapht_map_int_int_to_arrays(void *, int, long long int*, int*);
+int jgrapht_map_long_double_to_arrays(void *, int, long long int*, double*);
+int jgrapht_map_long_int_to_arrays(void *, int, long long int*, int*);
 
 // matching
 
@@ -690,10 +730,14 @@ int jgrapht_xx_sp_exec_johnson_get_allpairs(void *, void**);
 int jgrapht_xx_sp_exec_floydwarshall_get_allpairs(void *, void**);
 int jgrapht_ix_sp_singlesource_get_path_to_vertex(void *, int, void**);
 int jgrapht_lx_sp_singlesource_get_path_to_vertex(void *, long long int, void**);
+int jgrapht_ix_sp_singlesource_get_distances(void *, int, int*, double*, int*);
+int jgrapht_lx_sp_singlesource_get_distances(void *, int, long long int*, double*, long long int*);
 int jgrapht_ix_sp_allpairs_get_path_between_vertices(void *, int, int, void**);
 int jgrapht_lx_sp_allpairs_get_path_between_vertices(void *, long long int, long long int, void**);
 int jgrapht_ix_sp_allpairs_get_singlesource_from_vertex(void *, int, void**);
 int jgrapht_lx_sp_allpairs_get_singlesource_from_vertex(void *, long long int, void**);
+int jgrapht_ix_sp_allpairs_get_distances(void *, int, int*, int, int*, double*, long long int*, int*);
+int jgrapht_lx_sp_allpairs_get_distances(void *, int, long long int*, int, long long int*, double*, long long int*, long long int*);
 int jgrapht_ix_sp_exec_astar_get_path_between_vertices(void *, int, int, void *, void**);
 int jgrapht_lx_sp_exec_astar_get_path_between_vertices(void *, long long int, long long int, void *, void**);
 int jgrapht_ix_sp_exec_bidirectional_astar_get_path_between_vertices(void *, int, int, void *, void**);
@@ -702,6 +746,8 @@ int jgrapht_ix_sp_exec_astar_alt_heuristic_get_path_between_vertices(void *, int
 int jgrapht_lx_sp_exec_astar_alt_heuristic_get_path_between_vertices(void *, long long int, long long int, void *, void**);
 int jgrapht_ix_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices(void *, int, int, void *, void**);
 int jgrapht_lx_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices(void *, long long int, long long int, void *, void**);
+int jgrapht_ix_sp_exec_astar_alt_landmarks_get_path_between_vertices(void *, int, int, int, long long int, double*, double*, void**);
+int jgrapht_ix_sp_exec_bidirectional_astar_alt_landmarks_get_path_between_vertices(void *, int, int, int, long long int, double*, double*, void**);
 int jgrapht_ix_sp_exec_yen_get_k_loopless_paths_between_vertices(void *, int, int, int, void**);
 int jgrapht_lx_sp_exec_yen_get_k_loopless_paths_between_vertices(void *, long long int, long long int, int, void**);
 int jgrapht_ix_sp_exec_eppstein_get_k_paths_between_vertices(void *, int, int, int, void**);
@@ -724,10 +770,14 @@ int jgrapht_lx_multisp_multiobjectivesinglesource_get_paths_to_vertex(void *, lo
 
 int jgrapht_ix_sp_manytomany_get_path_between_vertices(void *, int, int, void**);
 int jgrapht_lx_sp_manytomany_get_path_between_vertices(void *, long long int, long long int, void**);
+int jgrapht_ix_sp_manytomany_get_distances(void *, int, int*, int, int*, double*, long long int*, int*);
+int jgrapht_lx_sp_manytomany_get_distances(void *, int, long long int*, int, long long int*, double*, long long int*, long long int*);
 int jgrapht_xx_sp_exec_contraction_hierarchy(void *, int, long long int, void**);
 int jgrapht_xx_sp_exec_contraction_hierarchy_get_manytomany(void *, void *, void *, void**);
 int jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(void *, int, int, double, void**);
 int jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(void *, long long int, long long int, double, void**);
+int jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances(void *, int, int*, int*, double, double*);
+int jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances(void *, int, long long int*, long long int*, double, double*);
 int jgrapht_xx_sp_exec_transit_node_routing(void *, int, void**);
 int jgrapht_ix_sp_exec_transit_node_routing_get_path_between_vertices(void *, int, int, void**);
 int jgrapht_lx_sp_exec_transit_node_routing_get_path_between_vertices(void *, long long int, long long int, void**);
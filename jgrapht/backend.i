@@ -43,6 +43,62 @@
     }
 }
 
+// access objects supporting the buffer protocol (array.array, numpy arrays)
+// as c-arrays. The buffer is held until the backend call returns.
+%{
+static int jgrapht_buffer_acquire(PyObject *obj, Py_buffer *view, Py_ssize_t itemsize, int floating, int writable) {
+    int flags = PyBUF_FORMAT | PyBUF_C_CONTIGUOUS;
+    const char *format;
+
+    if (writable) {
+        flags |= PyBUF_WRITABLE;
+    }
+    if (PyObject_GetBuffer(obj, view, flags) != 0) {
+        return -1;
+    }
+    format = view->format != NULL ? view->format : "B";
+    if (*format == '@' || *format == '=') {
+        format++;
+    }
+    // wider integers must be signed, so that large unsigned values cannot wrap
+    if (view->itemsize != itemsize || *format == '\0' || format[1] != '\0'
+        || strchr(floating ? "fd" : (itemsize == 1 ? "?bB" : "hilqn"), *format) == NULL) {
+        PyBuffer_Release(view);
+        PyErr_SetString(PyExc_TypeError, "buffer has an incompatible item type");
+        return -1;
+    }
+    return 0;
+}
+%}
+
+%define %buffer_typemaps(TYPE, NAME, FLOATING, WRITABLE)
+%typemap(in) TYPE *NAME (Py_buffer view, int acquired = 0) {
+    if ($input != Py_None) {
+        if (jgrapht_buffer_acquire($input, &view, sizeof(TYPE), FLOATING, WRITABLE) != 0) {
+            SWIG_fail;
+        }
+        acquired = 1;
+        $1 = (TYPE *) view.buf;
+    } else {
+        $1 = (TYPE *) 0;
+    }
+}
+%typemap(freearg) TYPE *NAME {
+    if (acquired$argnum) {
+        PyBuffer_Release(&view$argnum);
+    }
+}
+%enddef
+
+%buffer_typemaps(unsigned char, BYTE_BUFFER, 0, 0)
+%buffer_typemaps(int, INT_BUFFER, 0, 0)
+%buffer_typemaps(long long int, LONG_BUFFER, 0, 0)
+%buffer_typemaps(double, DOUBLE_BUFFER, 1, 0)
+%buffer_typemaps(unsigned char, BYTE_BUFFER_OUTPUT, 0, 1)
+%buffer_typemaps(int, INT_BUFFER_OUTPUT, 0, 1)
+%buffer_typemaps(long long int, LONG_BUFFER_OUTPUT, 0, 1)
+%buffer_typemaps(double, DOUBLE_BUFFER_OUTPUT, 1, 1)
+
 enum status_t { 
     STATUS_SUCCESS = 0,
     STATUS_ERROR,
@@ -177,6 +233,378 @@ int raise_exception_on_error(int result) {
     }
 }
 
+// release the GIL while executing long running backend calls, such as algorithms,
+// importers, exporters and graph construction. Other python threads can make progress
+// meanwhile. Each thread is attached to the isolate lazily, see LAZY_THREAD_ATTACH.
+// Callbacks into python (ctypes) reacquire the GIL by themselves.
+%define %releasegil(NAME)
+%exception NAME {
+    Py_BEGIN_ALLOW_THREADS
+    $action
+    Py_END_ALLOW_THREADS
+    if (raise_exception_on_error(result)) { 
+        SWIG_fail;
+    }
+}
+%enddef
+
+%releasegil(jgrapht_xx_clique_exec_bron_kerbosch)
+%releasegil(jgrapht_xx_clique_exec_bron_kerbosch_pivot)
+%releasegil(jgrapht_xx_clique_exec_bron_kerbosch_pivot_degeneracy_ordering)
+%releasegil(jgrapht_xx_clique_exec_chordal_max_clique)
+%releasegil(jgrapht_xx_clustering_exec_k_spanning_tree)
+%releasegil(jgrapht_xx_clustering_exec_label_propagation)
+%releasegil(jgrapht_xx_clustering_exec_girvan_newman)
+%releasegil(jgrapht_xx_coloring_exec_greedy)
+%releasegil(jgrapht_xx_coloring_exec_greedy_smallestdegreelast)
+%releasegil(jgrapht_xx_coloring_exec_backtracking_brown)
+%releasegil(jgrapht_xx_coloring_exec_greedy_largestdegreefirst)
+%releasegil(jgrapht_xx_coloring_exec_greedy_random)
+%releasegil(jgrapht_xx_coloring_exec_greedy_random_with_seed)
+%releasegil(jgrapht_xx_coloring_exec_greedy_dsatur)
+%releasegil(jgrapht_xx_coloring_exec_color_refinement)
+%releasegil(jgrapht_xx_coloring_exec_chordal_minimum_coloring)
+%releasegil(jgrapht_xx_connectivity_strong_exec_kosaraju)
+%releasegil(jgrapht_xx_connectivity_strong_exec_gabow)
+%releasegil(jgrapht_xx_connectivity_weak_exec_bfs)
+%releasegil(jgrapht_xx_cut_mincut_exec_stoer_wagner)
+%releasegil(jgrapht_xx_cut_gomoryhu_exec_gusfield)
+%releasegil(jgrapht_xx_cut_oddmincutset_exec_padberg_rao)
+%releasegil(jgrapht_xx_cycles_eulerian_exec_hierholzer)
+%releasegil(jgrapht_xx_cycles_chinese_postman_exec_edmonds_johnson)
+%releasegil(jgrapht_xx_cycles_simple_enumeration_exec_tarjan)
+%releasegil(jgrapht_xx_cycles_simple_enumeration_exec_tiernan)
+%releasegil(jgrapht_xx_cycles_simple_enumeration_exec_szwarcfiter_lauer)
+%releasegil(jgrapht_xx_cycles_simple_enumeration_exec_johnson)
+%releasegil(jgrapht_xx_cycles_simple_enumeration_exec_hawick_james)
+%releasegil(jgrapht_xx_cycles_fundamental_basis_exec_queue_bfs)
+%releasegil(jgrapht_xx_cycles_fundamental_basis_exec_stack_bfs)
+%releasegil(jgrapht_xx_cycles_fundamental_basis_exec_paton)
+%releasegil(jgrapht_xx_cycles_mean_exec_howard)
+%releasegil(jgrapht_xx_drawing_exec_random_layout_2d)
+%releasegil(jgrapht_ix_drawing_exec_circular_layout_2d)
+%releasegil(jgrapht_lx_drawing_exec_circular_layout_2d)
+%releasegil(jgrapht_xx_drawing_exec_fr_layout_2d)
+%releasegil(jgrapht_xx_drawing_exec_indexed_fr_layout_2d)
+%releasegil(jgrapht_xx_drawing_exec_rescale_layout_2d)
+%releasegil(jgrapht_ix_drawing_exec_two_layered_bipartite_layout_2d)
+%releasegil(jgrapht_lx_drawing_exec_two_layered_bipartite_layout_2d)
+%releasegil(jgrapht_ix_drawing_exec_barycenter_greedy_two_layered_bipartite_layout_2d)
+%releasegil(jgrapht_lx_drawing_exec_barycenter_greedy_two_layered_bipartite_layout_2d)
+%releasegil(jgrapht_ix_drawing_exec_median_greedy_two_layered_bipartite_layout_2d)
+%releasegil(jgrapht_lx_drawing_exec_median_greedy_two_layered_bipartite_layout_2d)
+%releasegil(jgrapht_ix_export_file_dimacs)
+%releasegil(jgrapht_lx_export_file_dimacs)
+%releasegil(jgrapht_ix_export_string_dimacs)
+%releasegil(jgrapht_lx_export_string_dimacs)
+%releasegil(jgrapht_xx_export_file_gml)
+%releasegil(jgrapht_xx_export_string_gml)
+%releasegil(jgrapht_xx_export_file_json)
+%releasegil(jgrapht_xx_export_string_json)
+%releasegil(jgrapht_xx_export_file_lemon)
+%releasegil(jgrapht_xx_export_string_lemon)
+%releasegil(jgrapht_xx_export_file_csv)
+%releasegil(jgrapht_xx_export_string_csv)
+%releasegil(jgrapht_xx_export_file_gexf)
+%releasegil(jgrapht_xx_export_string_gexf)
+%releasegil(jgrapht_xx_export_file_dot)
+%releasegil(jgrapht_xx_export_string_dot)
+%releasegil(jgrapht_xx_export_file_graph6)
+%releasegil(jgrapht_xx_export_string_graph6)
+%releasegil(jgrapht_xx_export_file_sparse6)
+%releasegil(jgrapht_xx_export_string_sparse6)
+%releasegil(jgrapht_xx_export_file_graphml)
+%releasegil(jgrapht_xx_export_string_graphml)
+%releasegil(jgrapht_ix_maxflow_exec_push_relabel)
+%releasegil(jgrapht_lx_maxflow_exec_push_relabel)
+%releasegil(jgrapht_ix_maxflow_exec_dinic)
+%releasegil(jgrapht_lx_maxflow_exec_dinic)
+%releasegil(jgrapht_ix_maxflow_exec_edmonds_karp)
+%releasegil(jgrapht_lx_maxflow_exec_edmonds_karp)
+%releasegil(jgrapht_ix_maxflow_exec_boykov_kolmogorov)
+%releasegil(jgrapht_lx_maxflow_exec_boykov_kolmogorov)
+%releasegil(jgrapht_ii_mincostflow_exec_capacity_scaling)
+%releasegil(jgrapht_ll_mincostflow_exec_capacity_scaling)
+%releasegil(jgrapht_xx_equivalentflowtree_exec_gusfield)
+%releasegil(jgrapht_xx_generate_barabasi_albert)
+%releasegil(jgrapht_xx_generate_barabasi_albert_forest)
+%releasegil(jgrapht_xx_generate_complete)
+%releasegil(jgrapht_xx_generate_bipartite_complete)
+%releasegil(jgrapht_xx_generate_empty)
+%releasegil(jgrapht_xx_generate_gnm_random)
+%releasegil(jgrapht_xx_generate_gnp_random)
+%releasegil(jgrapht_xx_generate_ring)
+%releasegil(jgrapht_xx_generate_scalefree)
+%releasegil(jgrapht_xx_generate_watts_strogatz)
+%releasegil(jgrapht_xx_generate_kleinberg_smallworld)
+%releasegil(jgrapht_xx_generate_complement)
+%releasegil(jgrapht_xx_generate_generalized_petersen)
+%releasegil(jgrapht_xx_generate_grid)
+%releasegil(jgrapht_xx_generate_hypercube)
+%releasegil(jgrapht_xx_generate_linear)
+%releasegil(jgrapht_xx_generate_random_regular)
+%releasegil(jgrapht_xx_generate_star)
+%releasegil(jgrapht_xx_generate_wheel)
+%releasegil(jgrapht_xx_generate_windmill)
+%releasegil(jgrapht_xx_generate_linearized_chord_diagram)
+%releasegil(jgrapht_ii_graph_sparse_create)
+%releasegil(jgrapht_ii_graph_succinct_create)
+%releasegil(jgrapht_ii_graph_sparse_create_from_csr)
+%releasegil(jgrapht_ii_graph_sparse_create_from_arrays)
+%releasegil(jgrapht_ii_graph_succinct_create_from_arrays)
+%releasegil(jgrapht_ii_graph_to_csr)
+%releasegil(jgrapht_ii_list_edge_triple_num_vertices)
+%releasegil(jgrapht_xi_graph_set_edge_weights)
+%releasegil(jgrapht_xi_graph_set_edge_weights_from_array)
+%releasegil(jgrapht_ii_graph_subgraph_apply_masks)
+%releasegil(jgrapht_ii_graph_add_edges)
+%releasegil(jgrapht_ll_graph_add_edges)
+%releasegil(jgrapht_xx_graph_metrics_diameter)
+%releasegil(jgrapht_xx_graph_metrics_radius)
+%releasegil(jgrapht_xx_graph_metrics_girth)
+%releasegil(jgrapht_xx_graph_metrics_triangles)
+%releasegil(jgrapht_xx_graph_metrics_measure_graph)
+%releasegil(jgrapht_xx_graph_test_is_empty)
+%releasegil(jgrapht_xx_graph_test_is_simple)
+%releasegil(jgrapht_xx_graph_test_has_selfloops)
+%releasegil(jgrapht_xx_graph_test_has_multipleedges)
+%releasegil(jgrapht_xx_graph_test_is_complete)
+%releasegil(jgrapht_xx_graph_test_is_weakly_connected)
+%releasegil(jgrapht_xx_graph_test_is_strongly_connected)
+%releasegil(jgrapht_xx_graph_test_is_tree)
+%releasegil(jgrapht_xx_graph_test_is_forest)
+%releasegil(jgrapht_xx_graph_test_is_overfull)
+%releasegil(jgrapht_xx_graph_test_is_split)
+%releasegil(jgrapht_xx_graph_test_is_bipartite)
+%releasegil(jgrapht_xx_graph_test_is_cubic)
+%releasegil(jgrapht_xx_graph_test_is_eulerian)
+%releasegil(jgrapht_xx_graph_test_is_chordal)
+%releasegil(jgrapht_xx_graph_test_is_weakly_chordal)
+%releasegil(jgrapht_xx_graph_test_has_ore)
+%releasegil(jgrapht_xx_graph_test_is_trianglefree)
+%releasegil(jgrapht_xx_graph_test_is_perfect)
+%releasegil(jgrapht_xx_graph_test_is_planar)
+%releasegil(jgrapht_xx_graph_test_is_kuratowski_subdivision)
+%releasegil(jgrapht_xx_graph_test_is_k33_subdivision)
+%releasegil(jgrapht_xx_graph_test_is_k5_subdivision)
+%releasegil(jgrapht_ii_import_file_dimacs)
+%releasegil(jgrapht_ll_import_file_dimacs)
+%releasegil(jgrapht_ii_import_string_dimacs)
+%releasegil(jgrapht_ll_import_string_dimacs)
+%releasegil(jgrapht_ii_import_file_gml)
+%releasegil(jgrapht_ll_import_file_gml)
+%releasegil(jgrapht_ii_import_string_gml)
+%releasegil(jgrapht_ll_import_string_gml)
+%releasegil(jgrapht_ii_import_file_json)
+%releasegil(jgrapht_ll_import_file_json)
+%releasegil(jgrapht_ii_import_string_json)
+%releasegil(jgrapht_ll_import_string_json)
+%releasegil(jgrapht_ii_import_file_csv)
+%releasegil(jgrapht_ll_import_file_csv)
+%releasegil(jgrapht_ii_import_string_csv)
+%releasegil(jgrapht_ll_import_string_csv)
+%releasegil(jgrapht_ii_import_file_gexf)
+%releasegil(jgrapht_ll_import_file_gexf)
+%releasegil(jgrapht_ii_import_string_gexf)
+%releasegil(jgrapht_ll_import_string_gexf)
+%releasegil(jgrapht_ii_import_file_graphml_simple)
+%releasegil(jgrapht_ll_import_file_graphml_simple)
+%releasegil(jgrapht_ii_import_string_graphml_simple)
+%releasegil(jgrapht_ll_import_string_graphml_simple)
+%releasegil(jgrapht_ii_import_file_graphml)
+%releasegil(jgrapht_ll_import_file_graphml)
+%releasegil(jgrapht_ii_import_string_graphml)
+%releasegil(jgrapht_ll_import_string_graphml)
+%releasegil(jgrapht_ii_import_file_dot)
+%releasegil(jgrapht_ll_import_file_dot)
+%releasegil(jgrapht_ii_import_string_dot)
+%releasegil(jgrapht_ll_import_string_dot)
+%releasegil(jgrapht_ii_import_file_graph6sparse6)
+%releasegil(jgrapht_ll_import_file_graph6sparse6)
+%releasegil(jgrapht_ii_import_string_graph6sparse6)
+%releasegil(jgrapht_ll_import_string_graph6sparse6)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_dimacs)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_dimacs)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_dimacs)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_dimacs)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_dimacs)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_dimacs)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_gml)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_gml)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_gml)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_gml)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_gml)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_gml)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_json)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_json)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_json)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_json)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_csv)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_csv)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_csv)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_csv)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_csv)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_csv)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_gexf)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_gexf)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_gexf)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_gexf)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_gexf)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_gexf)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_graphml_simple)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_graphml_simple)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_graphml_simple)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_graphml_simple)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_graphml_simple)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_graphml_simple)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_graphml)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_graphml)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_graphml)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_graphml)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_graphml)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_graphml)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_dot)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_dot)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_dot)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_dot)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_dot)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_dot)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_file_graph6sparse6)
+%releasegil(jgrapht_xx_import_edgelist_noattrs_string_graph6sparse6)
+%releasegil(jgrapht_ii_import_edgelist_attrs_file_graph6sparse6)
+%releasegil(jgrapht_ll_import_edgelist_attrs_file_graph6sparse6)
+%releasegil(jgrapht_ii_import_edgelist_attrs_string_graph6sparse6)
+%releasegil(jgrapht_ll_import_edgelist_attrs_string_graph6sparse6)
+%releasegil(jgrapht_xx_independent_set_exec_chordal_max_independent_set)
+%releasegil(jgrapht_xx_isomorphism_exec_vf2)
+%releasegil(jgrapht_xx_isomorphism_exec_vf2_subgraph)
+%releasegil(jgrapht_ix_link_prediction_exec_adamic_adar_index)
+%releasegil(jgrapht_lx_link_prediction_exec_adamic_adar_index)
+%releasegil(jgrapht_ix_link_prediction_exec_common_neighbors)
+%releasegil(jgrapht_lx_link_prediction_exec_common_neighbors)
+%releasegil(jgrapht_ix_link_prediction_exec_hub_depressed_index)
+%releasegil(jgrapht_lx_link_prediction_exec_hub_depressed_index)
+%releasegil(jgrapht_ix_link_prediction_exec_hub_promoted_index)
+%releasegil(jgrapht_lx_link_prediction_exec_hub_promoted_index)
+%releasegil(jgrapht_ix_link_prediction_exec_jaccard_coefficient)
+%releasegil(jgrapht_lx_link_prediction_exec_jaccard_coefficient)
+%releasegil(jgrapht_ix_link_prediction_exec_leicht_holme_newman_index)
+%releasegil(jgrapht_lx_link_prediction_exec_leicht_holme_newman_index)
+%releasegil(jgrapht_ix_link_prediction_exec_preferential_attachment)
+%releasegil(jgrapht_lx_link_prediction_exec_preferential_attachment)
+%releasegil(jgrapht_ix_link_prediction_exec_resource_allocation_index)
+%releasegil(jgrapht_lx_link_prediction_exec_resource_allocation_index)
+%releasegil(jgrapht_ix_link_prediction_exec_salton_index)
+%releasegil(jgrapht_lx_link_prediction_exec_salton_index)
+%releasegil(jgrapht_ix_link_prediction_exec_sorensen_index)
+%releasegil(jgrapht_lx_link_prediction_exec_sorensen_index)
+%releasegil(jgrapht_xx_matching_exec_greedy_general_max_card)
+%releasegil(jgrapht_xx_matching_exec_custom_greedy_general_max_card)
+%releasegil(jgrapht_xx_matching_exec_edmonds_general_max_card_dense)
+%releasegil(jgrapht_xx_matching_exec_edmonds_general_max_card_sparse)
+%releasegil(jgrapht_xx_matching_exec_greedy_general_max_weight)
+%releasegil(jgrapht_xx_matching_exec_custom_greedy_general_max_weight)
+%releasegil(jgrapht_xx_matching_exec_pathgrowing_max_weight)
+%releasegil(jgrapht_xx_matching_exec_blossom5_general_max_weight)
+%releasegil(jgrapht_xx_matching_exec_blossom5_general_min_weight)
+%releasegil(jgrapht_xx_matching_exec_blossom5_general_perfect_max_weight)
+%releasegil(jgrapht_xx_matching_exec_blossom5_general_perfect_min_weight)
+%releasegil(jgrapht_xx_matching_exec_bipartite_max_card)
+%releasegil(jgrapht_xx_matching_exec_bipartite_perfect_min_weight)
+%releasegil(jgrapht_xx_matching_exec_bipartite_max_weight)
+%releasegil(jgrapht_xx_mst_exec_kruskal)
+%releasegil(jgrapht_xx_mst_exec_prim)
+%releasegil(jgrapht_xx_mst_exec_boruvka)
+%releasegil(jgrapht_xx_partition_exec_bipartite)
+%releasegil(jgrapht_xx_planarity_exec_boyer_myrvold)
+%releasegil(jgrapht_xx_scoring_exec_eigenvector_centrality)
+%releasegil(jgrapht_xx_scoring_exec_custom_eigenvector_centrality)
+%releasegil(jgrapht_xx_scoring_exec_katz_centrality)
+%releasegil(jgrapht_ix_scoring_exec_custom_katz_centrality)
+%releasegil(jgrapht_lx_scoring_exec_custom_katz_centrality)
+%releasegil(jgrapht_xx_scoring_exec_betweenness_centrality)
+%releasegil(jgrapht_xx_scoring_exec_custom_betweenness_centrality)
+%releasegil(jgrapht_xx_scoring_exec_edge_betweenness_centrality)
+%releasegil(jgrapht_xx_scoring_exec_closeness_centrality)
+%releasegil(jgrapht_xx_scoring_exec_custom_closeness_centrality)
+%releasegil(jgrapht_xx_scoring_exec_harmonic_centrality)
+%releasegil(jgrapht_xx_scoring_exec_custom_harmonic_centrality)
+%releasegil(jgrapht_xx_scoring_exec_pagerank)
+%releasegil(jgrapht_xx_scoring_exec_custom_pagerank)
+%releasegil(jgrapht_xx_scoring_exec_coreness)
+%releasegil(jgrapht_xx_scoring_exec_clustering_coefficient)
+%releasegil(jgrapht_ix_sp_exec_dijkstra_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_dijkstra_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_bidirectional_dijkstra_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_bidirectional_dijkstra_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_dijkstra_get_singlesource_from_vertex)
+%releasegil(jgrapht_lx_sp_exec_dijkstra_get_singlesource_from_vertex)
+%releasegil(jgrapht_ix_sp_exec_bellmanford_get_singlesource_from_vertex)
+%releasegil(jgrapht_lx_sp_exec_bellmanford_get_singlesource_from_vertex)
+%releasegil(jgrapht_ix_sp_exec_bfs_get_singlesource_from_vertex)
+%releasegil(jgrapht_lx_sp_exec_bfs_get_singlesource_from_vertex)
+%releasegil(jgrapht_ix_sp_singlesource_get_distances)
+%releasegil(jgrapht_lx_sp_singlesource_get_distances)
+%releasegil(jgrapht_xx_sp_exec_johnson_get_allpairs)
+%releasegil(jgrapht_xx_sp_exec_floydwarshall_get_allpairs)
+%releasegil(jgrapht_ix_sp_allpairs_get_distances)
+%releasegil(jgrapht_lx_sp_allpairs_get_distances)
+%releasegil(jgrapht_ix_sp_exec_astar_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_astar_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_bidirectional_astar_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_bidirectional_astar_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_astar_alt_heuristic_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_astar_alt_heuristic_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_astar_alt_landmarks_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_bidirectional_astar_alt_landmarks_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_yen_get_k_loopless_paths_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_yen_get_k_loopless_paths_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_eppstein_get_k_paths_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_eppstein_get_k_paths_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_delta_stepping_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_delta_stepping_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_delta_stepping_get_singlesource_from_vertex)
+%releasegil(jgrapht_lx_sp_exec_delta_stepping_get_singlesource_from_vertex)
+%releasegil(jgrapht_ii_multisp_exec_martin_get_multiobjectivesinglesource_from_vertex)
+%releasegil(jgrapht_ll_multisp_exec_martin_get_multiobjectivesinglesource_from_vertex)
+%releasegil(jgrapht_ii_multisp_exec_martin_get_paths_between_vertices)
+%releasegil(jgrapht_ll_multisp_exec_martin_get_paths_between_vertices)
+%releasegil(jgrapht_xx_sp_exec_contraction_hierarchy)
+%releasegil(jgrapht_xx_sp_exec_contraction_hierarchy_get_manytomany)
+%releasegil(jgrapht_ix_sp_manytomany_get_distances)
+%releasegil(jgrapht_lx_sp_manytomany_get_distances)
+%releasegil(jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances)
+%releasegil(jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances)
+%releasegil(jgrapht_xx_sp_exec_transit_node_routing)
+%releasegil(jgrapht_ix_sp_exec_transit_node_routing_get_path_between_vertices)
+%releasegil(jgrapht_lx_sp_exec_transit_node_routing_get_path_between_vertices)
+%releasegil(jgrapht_ix_sp_exec_transit_node_routing_get_singlesource_from_vertex)
+%releasegil(jgrapht_lx_sp_exec_transit_node_routing_get_singlesource_from_vertex)
+%releasegil(jgrapht_xx_spanner_exec_greedy_multiplicative)
+%releasegil(jgrapht_xx_tour_tsp_random)
+%releasegil(jgrapht_xx_tour_tsp_greedy_heuristic)
+%releasegil(jgrapht_xx_tour_tsp_nearest_insertion_heuristic)
+%releasegil(jgrapht_xx_tour_tsp_nearest_neighbor_heuristic)
+%releasegil(jgrapht_xx_tour_metric_tsp_christofides)
+%releasegil(jgrapht_xx_tour_metric_tsp_two_approx)
+%releasegil(jgrapht_xx_tour_tsp_held_karp)
+%releasegil(jgrapht_xx_tour_hamiltonian_palmer)
+%releasegil(jgrapht_xx_tour_tsp_two_opt_heuristic)
+%releasegil(jgrapht_xx_tour_tsp_two_opt_heuristic_improve)
+%releasegil(jgrapht_xx_vertexcover_exec_greedy)
+%releasegil(jgrapht_xx_vertexcover_exec_greedy_weighted)
+%releasegil(jgrapht_xx_vertexcover_exec_clarkson)
+%releasegil(jgrapht_xx_vertexcover_exec_clarkson_weighted)
+%releasegil(jgrapht_xx_vertexcover_exec_edgebased)
+%releasegil(jgrapht_xx_vertexcover_exec_baryehudaeven)
+%releasegil(jgrapht_xx_vertexcover_exec_baryehudaeven_weighted)
+%releasegil(jgrapht_xx_vertexcover_exec_exact)
+%releasegil(jgrapht_xx_vertexcover_exec_exact_weighted)
+
 // ignore the integer return code
 // we already handled this using the exception 
 %typemap(out) int  "$result = SWIG_Py_Void();";
@@ -236,6 +664,8 @@ int jgrapht_ii_attributes_store_put_string_attribute(void *, int, char* BYTEARRA
 
 int jgrapht_ll_attributes_store_put_string_attribute(void *, long long int, char* BYTEARRAY, char* BYTEARRAY);
 
+int jgrapht_ii_attributes_store_put_string_attributes(void *, char* BYTEARRAY, int, int *INT_BUFFER, long long int *LONG_BUFFER, unsigned char *BYTE_BUFFER);
+
 int jgrapht_ii_attributes_store_remove_attribute(void *, int, char* BYTEARRAY);
 
 int jgrapht_ll_attributes_store_remove_attribute(void *, long long int, char* BYTEARRAY);
@@ -246,6 +676,22 @@ int jgrapht_attributes_registry_register_attribute(void *, char* BYTEARRAY, char
 
 int jgrapht_attributes_registry_unregister_attribute(void *, char* BYTEARRAY, char* BYTEARRAY, char* BYTEARRAY, char* BYTEARRAY);
 
+// attribute tables
+
+int jgrapht_attribute_table_create(void** OUTPUT);
+
+int jgrapht_attribute_table_destroy(void *);
+
+int jgrapht_attribute_table_bind(void *, int, long long int* OUTPUT);
+
+int jgrapht_attribute_table_unbind(void *);
+
+int jgrapht_attribute_table_size(void *, int* OUTPUT, long long int* OUTPUT, int* OUTPUT);
+
+int jgrapht_attribute_table_range_strings_size(void *, int, int, long long int* OUTPUT);
+
+int jgrapht_attribute_table_get_range(void *, int, int, int *INT_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT, unsigned char *BYTE_BUFFER_OUTPUT);
+
 // clique
 
 int jgrapht_xx_clique_exec_bron_kerbosch(void *, long long int, void** OUTPUT);
@@ -421,6 +867,10 @@ int jgrapht_ii_graph_create(int, int, int, int, void* LONG_TO_FPTR, void* LONG_T
 int jgrapht_ll_graph_create(int, int, int, int, void* LONG_TO_FPTR, void* LONG_TO_FPTR, void **OUTPUT);
 int jgrapht_ii_graph_sparse_create(int, int, int, void *, incoming_edges_support_t, void** OUTPUT);
 int jgrapht_ii_graph_succinct_create(int, int, void *, incoming_edges_support_t, void** OUTPUT);
+int jgrapht_ii_graph_sparse_create_from_csr(int, int, int, int, int *INT_BUFFER, int *INT_BUFFER, double *DOUBLE_BUFFER, incoming_edges_support_t, void** OUTPUT);
+int jgrapht_ii_graph_sparse_create_from_arrays(int, int, int, int, int *INT_BUFFER, int *INT_BUFFER, double *DOUBLE_BUFFER, incoming_edges_support_t, void** OUTPUT);
+int jgrapht_ii_graph_succinct_create_from_arrays(int, int, int, int *INT_BUFFER, int *INT_BUFFER, incoming_edges_support_t, void** OUTPUT);
+int jgrapht_ii_graph_to_csr(void *, int, int, int *INT_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT, double *DOUBLE_BUFFER_OUTPUT, int* OUTPUT);
 
 // graph
 
@@ -440,6 +890,8 @@ int jgrapht_ii_graph_add_edge(void *, int, int, int* OUTPUT);
 int jgrapht_ll_graph_add_edge(void *, long long int, long long int, long long* OUTPUT);
 int jgrapht_ii_graph_add_given_edge(void *, int, int, int, int* OUTPUT);
 int jgrapht_ll_graph_add_given_edge(void *, long long int, long long int, long long int, int* OUTPUT);
+int jgrapht_ii_graph_add_edges(void *, int, int *INT_BUFFER, int *INT_BUFFER, double *DOUBLE_BUFFER, int *INT_BUFFER_OUTPUT);
+int jgrapht_ll_graph_add_edges(void *, long long int, long long int *LONG_BUFFER, long long int *LONG_BUFFER, double *DOUBLE_BUFFER, long long int *LONG_BUFFER_OUTPUT);
 int jgrapht_xi_graph_remove_edge(void *, int, int* OUTPUT);
 int jgrapht_xl_graph_remove_edge(void *, long long int, int* OUTPUT);
 int jgrapht_xi_graph_contains_edge(void *, int, int* OUTPUT);
@@ -486,9 +938,12 @@ int jgrapht_xx_graph_as_unweighted(void *, void** OUTPUT);
 int jgrapht_xx_graph_as_edgereversed(void *, void** OUTPUT);
 int jgrapht_xi_graph_as_weighted(void *, void *LONG_TO_FPTR, int, int, void** OUTPUT);
 int jgrapht_xl_graph_as_weighted(void *, void *LONG_TO_FPTR, int, int, void** OUTPUT);
+int jgrapht_xi_graph_set_edge_weights(void *, int, int *INT_BUFFER, double *DOUBLE_BUFFER);
+int jgrapht_xi_graph_set_edge_weights_from_array(void *, int, double *DOUBLE_BUFFER);
 int jgrapht_ii_graph_as_masked_subgraph(void *, void *LONG_TO_FPTR, void *LONG_TO_FPTR, void** OUTPUT);
 int jgrapht_ll_graph_as_masked_subgraph(void *, void *LONG_TO_FPTR, void *LONG_TO_FPTR, void** OUTPUT);
 int jgrapht_xx_graph_as_subgraph(void *, void *, void *, void** OUTPUT);
+int jgrapht_ii_graph_subgraph_apply_masks(void *, void *, int, unsigned char *BYTE_BUFFER, int, unsigned char *BYTE_BUFFER);
 int jgrapht_xx_graph_as_graph_union(void *, void *, void *LONG_TO_FPTR, void** OUTPUT);
 
 //  dag
@@ -574,6 +1029,8 @@ int jgrapht_xl_graph_attrs_edge_size(void *, long long int, int* OUTPUT);
 
 int jgrapht_handles_destroy(void *);
 int jgrapht_handles_get_ccharpointer(void *, char** OUTPUT);
+int jgrapht_handles_get_ccharpointer_length(void *, long long int* OUTPUT);
+int jgrapht_handles_copy_ccharpointer(void *, long long int, int, unsigned char *BYTE_BUFFER_OUTPUT);
 int jgrapht_handles_get_edge_pair(void *, int* OUTPUT, int* OUTPUT);
 int jgrapht_handles_get_long_edge_pair(void *, long long* OUTPUT, long long* OUTPUT);
 int jgrapht_handles_get_edge_triple(void *, int* OUTPUT, int* OUTPUT, double* OUTPUT);
@@ -699,6 +1156,11 @@ int jgrapht_it_next_long_edge_triple(void *, long long *OUTPUT, long long *OUTPU
 int jgrapht_it_next_str_edge_triple(void *, char **OUTPUT, char **OUTPUT, double* OUTPUT);
 int jgrapht_it_next_object(void *, void** OUTPUT);
 int jgrapht_it_hasnext(void *, int* OUTPUT);
+int jgrapht_it_next_int_chunk(void *, int, int *INT_BUFFER_OUTPUT, int* OUTPUT);
+int jgrapht_it_next_long_chunk(void *, int, long long int *LONG_BUFFER_OUTPUT, int* OUTPUT);
+int jgrapht_it_next_double_chunk(void *, int, double *DOUBLE_BUFFER_OUTPUT, int* OUTPUT);
+int jgrapht_it_next_int_edge_triple_chunk(void *, int, int *INT_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT, double *DOUBLE_BUFFER_OUTPUT, int* OUTPUT);
+int jgrapht_it_next_long_edge_triple_chunk(void *, int, long long int *LONG_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT, double *DOUBLE_BUFFER_OUTPUT, int* OUTPUT);
 
 // link prediction
 
@@ -735,6 +1197,7 @@ int jgrapht_ii_list_edge_pair_add(void *, int, int, int* OUTPUT);
 int jgrapht_ll_list_edge_pair_add(void *, long long int, long long int, int* OUTPUT);
 int jgrapht_ii_list_edge_triple_add(void *, int, int, double, int* OUTPUT);
 int jgrapht_ll_list_edge_triple_add(void *, long long int, long long int, double, int* OUTPUT);
+int jgrapht_ii_list_edge_triple_num_vertices(void *, int* OUTPUT);
 int jgrapht_list_int_remove(void *, int);
 int jgrapht_list_long_remove(void *, long long int);
 int jgrapht_list_double_remove(void *, double);
@@ -763,6 +1226,7 @@ int jgrapht_map_values_it_create(void *, void** OUTPUT);
 int jgrapht_map_int_double_put(void *, int, double);
 int jgrapht_map_int_int_put(void *, int, int);
 int jgrapht_map_int_string_put(void *, int, char* BYTEARRAY);
+int jgrapht_map_int_string_put_all(void *, int, int *INT_BUFFER, long long int *LONG_BUFFER, unsigned char *BYTE_BUFFER);
 int jgrapht_map_long_double_put(void *, long long int, double);
 int jgrapht_map_long_int_put(void *, long long int, int);
 int jgrapht_map_long_string_put(void *, long long int, char* BYTEARRAY);
@@ -781,6 +1245,10 @@ int jgrapht_map_long_double_remove(void *, long long int, double* OUTPUT);
 int jgrapht_map_long_int_remove(void *, long long int, int* OUTPUT);
 int jgrapht_map_long_string_remove(void *, long long int, void** OUTPUT);
 int jgrapht_map_clear(void *);
+int jgrapht_map_int_double_to_arrays(void *, int, long long int *LONG_BUFFER_OUTPUT, double *DOUBLE_BUFFER_OUTPUT);
+int jgrapht_map_int_int_to_arrays(void *, int, long long int *LONG_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT);
+int jgrapht_map_long_double_to_arrays(void *, int, long long int *LONG_BUFFER_OUTPUT, double *DOUBLE_BUFFER_OUTPUT);
+int jgrapht_map_long_int_to_arrays(void *, int, long long int *LONG_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT);
 
 // matching
 
@@ -867,10 +1335,14 @@ int jgrapht_xx_sp_exec_johnson_get_allpairs(void *, void** OUTPUT);
 int jgrapht_xx_sp_exec_floydwarshall_get_allpairs(void *, void** OUTPUT);
 int jgrapht_ix_sp_singlesource_get_path_to_vertex(void *, int, void** OUTPUT);
 int jgrapht_lx_sp_singlesource_get_path_to_vertex(void *, long long int, void** OUTPUT);
+int jgrapht_ix_sp_singlesource_get_distances(void *, int, int *INT_BUFFER, double *DOUBLE_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT);
+int jgrapht_lx_sp_singlesource_get_distances(void *, int, long long int *LONG_BUFFER, double *DOUBLE_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT);
 int jgrapht_ix_sp_allpairs_get_path_between_vertices(void *, int, int, void** OUTPUT);
 int jgrapht_lx_sp_allpairs_get_path_between_vertices(void *, long long int, long long int, void** OUTPUT);
 int jgrapht_ix_sp_allpairs_get_singlesource_from_vertex(void *, int, void** OUTPUT);
 int jgrapht_lx_sp_allpairs_get_singlesource_from_vertex(void *, long long int, void** OUTPUT);
+int jgrapht_ix_sp_allpairs_get_distances(void *, int, int *INT_BUFFER, int, int *INT_BUFFER, double *DOUBLE_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT);
+int jgrapht_lx_sp_allpairs_get_distances(void *, int, long long int *LONG_BUFFER, int, long long int *LONG_BUFFER, double *DOUBLE_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT);
 int jgrapht_ix_sp_exec_astar_get_path_between_vertices(void *, int, int, void *LONG_TO_FPTR, void** OUTPUT);
 int jgrapht_lx_sp_exec_astar_get_path_between_vertices(void *, long long int, long long int, void *LONG_TO_FPTR, void** OUTPUT);
 int jgrapht_ix_sp_exec_bidirectional_astar_get_path_between_vertices(void *, int, int, void *LONG_TO_FPTR, void** OUTPUT);
@@ -879,6 +1351,8 @@ int jgrapht_ix_sp_exec_astar_alt_heuristic_get_path_between_vertices(void *, int
 int jgrapht_lx_sp_exec_astar_alt_heuristic_get_path_between_vertices(void *, long long int, long long int, void *, void** OUTPUT);
 int jgrapht_ix_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices(void *, int, int, void *, void** OUTPUT);
 int jgrapht_lx_sp_exec_bidirectional_astar_alt_heuristic_get_path_between_vertices(void *, long long int, long long int, void *, void** OUTPUT);
+int jgrapht_ix_sp_exec_astar_alt_landmarks_get_path_between_vertices(void *, int, int, int, long long int, double *DOUBLE_BUFFER, double *DOUBLE_BUFFER, void** OUTPUT);
+int jgrapht_ix_sp_exec_bidirectional_astar_alt_landmarks_get_path_between_vertices(void *, int, int, int, long long int, double *DOUBLE_BUFFER, double *DOUBLE_BUFFER, void** OUTPUT);
 int jgrapht_ix_sp_exec_yen_get_k_loopless_paths_between_vertices(void *, int, int, int, void** OUTPUT);
 int jgrapht_lx_sp_exec_yen_get_k_loopless_paths_between_vertices(void *, long long int, long long int, int, void** OUTPUT);
 int jgrapht_ix_sp_exec_eppstein_get_k_paths_between_vertices(void *, int, int, int, void** OUTPUT);
@@ -901,10 +1375,14 @@ int jgrapht_lx_multisp_multiobjectivesinglesource_get_paths_to_vertex(void *, lo
 
 int jgrapht_ix_sp_manytomany_get_path_between_vertices(void *, int, int, void** OUTPUT);
 int jgrapht_lx_sp_manytomany_get_path_between_vertices(void *, long long int, long long int, void** OUTPUT);
+int jgrapht_ix_sp_manytomany_get_distances(void *, int, int *INT_BUFFER, int, int *INT_BUFFER, double *DOUBLE_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT, int *INT_BUFFER_OUTPUT);
+int jgrapht_lx_sp_manytomany_get_distances(void *, int, long long int *LONG_BUFFER, int, long long int *LONG_BUFFER, double *DOUBLE_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT, long long int *LONG_BUFFER_OUTPUT);
 int jgrapht_xx_sp_exec_contraction_hierarchy(void *, int, long long int, void** OUTPUT);
 int jgrapht_xx_sp_exec_contraction_hierarchy_get_manytomany(void *, void *, void *, void** OUTPUT);
 int jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(void *, int, int, double, void** OUTPUT);
 int jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_path_between_vertices(void *, long long int, long long int, double, void** OUTPUT);
+int jgrapht_ix_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances(void *, int, int *INT_BUFFER, int *INT_BUFFER, double, double *DOUBLE_BUFFER_OUTPUT);
+int jgrapht_lx_sp_exec_contraction_hierarchy_bidirectional_dijkstra_get_distances(void *, int, long long int *LONG_BUFFER, long long int *LONG_BUFFER, double, double *DOUBLE_BUFFER_OUTPUT);
 int jgrapht_xx_sp_exec_transit_node_routing(void *, int, void** OUTPUT);
 int jgrapht_ix_sp_exec_transit_node_routing_get_path_between_vertices(void *, int, int, void**  OUTPUT);
 int jgrapht_lx_sp_exec_transit_node_routing_get_path_between_vertices(void *, long long int, long long int, void**  OUTPUT);
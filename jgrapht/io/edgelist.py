@@ -1,4 +1,13 @@
+import multiprocessing
+import os
+import re
+from array import array
+from collections import deque, namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+
 from .. import backend as _backend
+from ..types import IncomingEdgesSupport
 
 from .._internals._collections import _JGraphTEdgeStrTripleList
 from .._internals._ioutils import (
@@ -6,7 +15,12 @@ from .._internals._ioutils import (
     _create_wrapped_import_integer_id_callback,
     _create_wrapped_attribute_callback,
     _create_wrapped_strid_attribute_callback,
+    _input_filename,
+    _open_file,
 )
+from .._internals._arrays import _import_numpy
+from .._internals._int_graphs import _create_sparse_int_graph
+from .._internals._graph6 import _decode_graph6sparse6_lines
 
 
 def _import_edgelist_with_string_ids(name, with_attrs, filename_or_string, *args):
@@ -20,9 +34,14 @@ def _import_edgelist_with_string_ids(name, with_attrs, filename_or_string, *args
     alg_method_name = "jgrapht_{}_import_edgelist_{}_{}".format(alg_method_type, alg_method_attrs, name)
     alg_method = getattr(_backend, alg_method_name)
 
-    filename_or_string_as_bytearray = bytearray(filename_or_string, encoding="utf-8")
+    if not name.startswith("file_"):
+        filename_or_string_as_bytearray = bytearray(filename_or_string, encoding="utf-8")
+        res = alg_method(filename_or_string_as_bytearray, *args)
+        return _JGraphTEdgeStrTripleList(res)
 
-    res = alg_method(filename_or_string_as_bytearray, *args)
+    with _input_filename(filename_or_string) as filename:
+        filename_as_bytearray = bytearray(filename, encoding="utf-8")
+        res = alg_method(filename_as_bytearray, *args)
     return _JGraphTEdgeStrTripleList(res)
 
 
@@ -65,7 +84,7 @@ def read_edgelist_dimacs(filename, vertex_attribute_cb=None, edge_attribute_cb=N
               For the edges the identifier is an integer denoting the rank of the particular
               edge in the returned edge list.
 
-    :param filename: filename to read from
+    :param filename: filename to read from (or a file object opened for reading)
     :param vertex_attribute_cb: Callback function for vertex attributes
     :param edge_attribute_cb: Callback function for edge attributes    
     :returns: an edge list. This is an iterable which returns iterators of named
@@ -218,7 +237,7 @@ def read_edgelist_gml(
               For the edges the identifier is an integer denoting the rank of the particular
               edge in the returned edge list.
 
-    :param filename: Filename to read from
+    :param filename: Filename to read from (or a file object opened for reading)
     :param vertex_attribute_cb: Callback function for vertex attributes
     :param edge_attribute_cb: Callback function for edge attributes
     :returns: an edge list. This is an iterable which returns iterators of named
@@ -372,7 +391,7 @@ def read_edgelist_json(filename, vertex_attribute_cb=None, edge_attribute_cb=Non
               For the edges the identifier is an integer denoting the rank of the particular
               edge in the returned edge list.
 
-    :param filename: Filename to read from
+    :param filename: Filename to read from (or a file object opened for reading)
     :param vertex_attribute_cb: Callback function for vertex attributes
     :param edge_attribute_cb: Callback function for edge attributes
     :returns: an edge list. This is an iterable which returns iterators of named
@@ -480,7 +499,7 @@ def read_edgelist_csv(
     The importer supports various different formats which can be adjusted using the format parameter.
     The supported formats are the same CSV formats used by Gephi. The importer respects rfc4180. 
 
-    :param filename: the filename to read from
+    :param filename: the filename to read from (or a file object opened for reading)
     :param format: format to use. One of "edgelist", "adjacencylist" and "matrix"    
     :param import_edge_weights: whether to import edge weights
     :param matrix_format_node_id: only for the matrix format, whether to import node identifiers
@@ -586,7 +605,7 @@ def read_edgelist_gexf(
               For the edges the identifier is an integer denoting the rank of the particular
               edge in the returned edge list.
 
-    :param filename: the input file to read from
+    :param filename: the input file to read from (or a file object opened for reading)
     :param validate_schema: whether to validate the XML schema    
     :param vertex_attribute_cb: callback function for vertex attributes
     :param edge_attribute_cb: callback function for edge attributes
@@ -716,7 +735,7 @@ def read_edgelist_dot(
               For the edges the identifier is an integer denoting the rank of the particular
               edge in the returned edge list.
 
-    :param filename: Filename to read from
+    :param filename: Filename to read from (or a file object opened for reading)
     :param vertex_attribute_cb: Callback function for vertex attributes
     :param edge_attribute_cb: Callback function for edge attributes
     :returns: an edge list. This is an iterable which returns iterators of named
@@ -799,7 +818,7 @@ def read_edgelist_graph6sparse6(
               For the edges the identifier is an integer denoting the rank of the particular
               edge in the returned edge list.
 
-    :param filename: filename to read from
+    :param filename: filename to read from (or a file object opened for reading)
     :param vertex_attribute_cb: callback function for vertex attributes
     :param edge_attribute_cb: callback function for edge attributes
     :returns: an edge list. This is an iterable which returns iterators of named
@@ -949,7 +968,7 @@ def read_edgelist_graphml(
     .. note:: The parameter simple affect the capabilities of the importer. It trades functionality
               for parsing speed. 
 
-    :param filename: the input file to read from
+    :param filename: the input file to read from (or a file object opened for reading)
     :param validate_schema: whether to validate the XML schema    
     :param vertex_attribute_cb: callback function for vertex attributes
     :param edge_attribute_cb: callback function for edge attributes
@@ -1100,3 +1119,375 @@ def parse_edgelist_graphml(
             "string_graphml", with_attrs, input_string, *args
         )
 
+
+# Number of bytes of the input parsed by each backend call of the batch readers
+_BATCH_READER_CHUNK_SIZE = 4 * 1024 * 1024
+
+# Default number of edges per batch of the batch readers
+_DEFAULT_BATCH_SIZE = 65536
+
+
+def _read_line_chunks(file, quoted=False):
+    """Split an input into strings of whole lines, about as large as the chunk size.
+
+    If quoted is True, lines are not split inside double quotes, as in rfc4180.
+    """
+    if not hasattr(file, "read"):
+        with _open_file(file, "rb") as f:
+            yield from _read_line_chunks(f, quoted=quoted)
+        return
+
+    pending = b""
+    while True:
+        data = file.read(_BATCH_READER_CHUNK_SIZE)
+        if isinstance(data, str):
+            data = data.encode(encoding="utf-8")
+        if not data:
+            break
+        data = pending + data
+        cut = data.rfind(b"\n")
+        while quoted and cut >= 0 and data.count(b'"', 0, cut) % 2 == 1:
+            cut = data.rfind(b"\n", 0, cut)
+        if cut < 0:
+            pending = data
+            continue
+        pending = data[cut + 1 :]
+        yield data[: cut + 1].decode(encoding="utf-8")
+    if pending:
+        yield pending.decode(encoding="utf-8")
+
+
+def _edgelist_batches(edgelists, batch_size, as_numpy):
+    """Regroup the edges of a sequence of edgelists into batches of a fixed size."""
+    if batch_size < 1:
+        raise ValueError("Batch size must be positive")
+    if as_numpy:
+        np = _import_numpy()
+        dtype = [("source", object), ("target", object), ("weight", np.float64)]
+
+        def to_batch(edges):
+            return np.rec.fromrecords(edges, dtype=dtype)
+
+    else:
+
+        def to_batch(edges):
+            return edges
+
+    def batches():
+        batch = []
+        for edgelist in edgelists:
+            for edge in edgelist:
+                batch.append(edge)
+                if len(batch) == batch_size:
+                    yield to_batch(batch)
+                    batch = []
+        if batch:
+            yield to_batch(batch)
+
+    return batches()
+
+
+def read_edgelist_csv_batches(
+    filename,
+    batch_size=_DEFAULT_BATCH_SIZE,
+    format="adjacencylist",
+    import_edge_weights=False,
+    as_numpy=False,
+):
+    """Read an edgelist from a file in CSV format in batches.
+
+    This is a streaming variant of :py:meth:`read_edgelist_csv`. The input is parsed piece by
+    piece and the edges are returned in batches while the rest of the input is not yet parsed.
+    Only the edges of the current piece are kept in memory, which allows to filter or remap
+    edges, or to start building a graph, without holding the whole edge list.
+
+    The matrix format is not supported, as its rows cannot be parsed independently.
+
+    :param filename: the filename to read from (or a file object opened for reading)
+    :param batch_size: the number of edges in each batch, the last batch may be smaller
+    :param format: format to use. One of "edgelist" and "adjacencylist"
+    :param import_edge_weights: whether to import edge weights
+    :param as_numpy: if True each batch is a NumPy record array with fields source, target
+      and weight. Otherwise each batch is a list of named tuples(source, target, weight)
+    :returns: a generator of batches of edges
+    :raises IOError: in case of an import error
+    :raises ValueError: in case of the matrix format
+    """
+    if format == "matrix":
+        raise ValueError("The matrix format cannot be read in batches")
+
+    edgelists = (
+        parse_edgelist_csv(
+            chunk, format=format, import_edge_weights=import_edge_weights
+        )
+        for chunk in _read_line_chunks(filename, quoted=True)
+    )
+    return _edgelist_batches(edgelists, batch_size, as_numpy)
+
+
+def read_edgelist_dimacs_batches(
+    filename, batch_size=_DEFAULT_BATCH_SIZE, as_numpy=False
+):
+    """Read an edgelist from a file in DIMACS format in batches.
+
+    This is a streaming variant of :py:meth:`read_edgelist_dimacs`. The input is parsed piece by
+    piece and the edges are returned in batches while the rest of the input is not yet parsed.
+    Only the edges of the current piece are kept in memory, which allows to filter or remap
+    edges, or to start building a graph, without holding the whole edge list.
+
+    :param filename: the filename to read from (or a file object opened for reading)
+    :param batch_size: the number of edges in each batch, the last batch may be smaller
+    :param as_numpy: if True each batch is a NumPy record array with fields source, target
+      and weight. Otherwise each batch is a list of named tuples(source, target, weight)
+    :returns: a generator of batches of edges
+    :raises IOError: in case of an import error
+    """
+
+    def edgelists():
+        # the problem line is repeated in front of every piece
+        problem_line = None
+        pending = ""
+        for chunk in _read_line_chunks(filename):
+            if problem_line is None:
+                match = re.search(r"^p\s.*$", chunk, re.MULTILINE)
+                if match is None:
+                    pending += chunk
+                    continue
+                problem_line = match.group(0) + "\n"
+                chunk = pending + chunk
+                pending = ""
+            else:
+                chunk = problem_line + chunk
+            yield parse_edgelist_dimacs(chunk)
+        if pending:
+            yield parse_edgelist_dimacs(pending)
+
+    return _edgelist_batches(edgelists(), batch_size, as_numpy)
+
+
+_Edge = namedtuple("Edge", ["source", "target", "weight"])
+
+
+def _create_process_pool(max_workers):
+    """Create a process pool whose workers are started fresh instead of forked. Forking
+    would copy the backend isolate of this process, together with the state of its
+    threads, into each worker."""
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _read_edgelist_csv_shard(filename, format, import_edge_weights):
+    """Read a single shard as columns of sources, targets and weights. Runs inside the
+    workers of the pool, thus the result must be picklable."""
+    sources, targets, weights = [], [], []
+    edgelist = read_edgelist_csv(
+        filename, format=format, import_edge_weights=import_edge_weights
+    )
+    for s, t, w in edgelist:
+        sources.append(s)
+        targets.append(t)
+        weights.append(w)
+    return sources, targets, weights
+
+
+def read_edgelist_csv_shards(
+    filenames,
+    format="adjacencylist",
+    import_edge_weights=False,
+    executor="thread",
+    max_workers=None,
+    create_graph=False,
+    directed=True,
+    incoming_edges_support=IncomingEdgesSupport.LAZY_INCOMING_EDGES,
+):
+    """Read an edgelist which is split into multiple files in CSV format.
+
+    The files (shards) are parsed concurrently on a pool of workers, while the results are
+    always merged in the order of the files. The backend releases the GIL while parsing,
+    thus a thread pool parses the shards in parallel. A process pool additionally converts
+    the edges to python objects in parallel, at the cost of transferring them between
+    processes. Its workers are spawned instead of forked and each starts its own backend.
+    A given process pool executor should be created the same way.
+
+    The result is either the merged edgelist, or a sparse graph created by
+    :py:meth:`jgrapht.create_sparse_graph`. In the latter case the vertices read are numbered
+    from zero in order of first appearance, going through the shards in the order given.
+    The numbering is therefore the same in every run, independently of the order in which
+    the workers finish.
+
+    The matrix format is not supported, as a matrix cannot be split into multiple files.
+
+    :param filenames: the filenames to read from. A thread pool also accepts file objects
+      opened for reading
+    :param format: format to use. One of "edgelist" and "adjacencylist"
+    :param import_edge_weights: whether to import edge weights
+    :param executor: either "thread", "process" or an instance of
+      :py:class:`concurrent.futures.Executor` to use
+    :param max_workers: maximum number of workers, if a new pool is created
+    :param create_graph: whether to create a sparse graph instead of returning the edgelist
+    :param directed: if creating a graph, whether the graph is directed
+    :param incoming_edges_support: if creating a graph, full support, lazily constructed or no
+      support for incoming edges
+    :returns: either an edge list, which is a list of named tuples(source, target, weight), or
+      a tuple with a sparse graph and the list of vertex identifiers read, indexed by the graph
+      vertices. The graph is weighted only if edge weights are imported.
+    :raises IOError: in case of an import error
+    :raises ValueError: in case of the matrix format or an unknown executor
+    """
+    if format == "matrix":
+        raise ValueError("The matrix format cannot be read from multiple files")
+
+    if executor == "thread":
+        pool = ThreadPoolExecutor(max_workers=max_workers)
+    elif executor == "process":
+        pool = _create_process_pool(max_workers)
+    elif isinstance(executor, Executor):
+        pool = None
+    else:
+        raise ValueError("Unknown executor {}".format(executor))
+
+    filenames = list(filenames)
+    try:
+        shards = (pool or executor).map(
+            _read_edgelist_csv_shard,
+            filenames,
+            repeat(format, len(filenames)),
+            repeat(import_edge_weights, len(filenames)),
+        )
+
+        if not create_graph:
+            edgelist = []
+            for sources, targets, weights in shards:
+                edgelist.extend(map(_Edge, sources, targets, weights))
+            return edgelist
+
+        vertex_ids = {}
+        sources_ids = array("i")
+        targets_ids = array("i")
+        all_weights = array("d")
+        for sources, targets, weights in shards:
+            for s, t in zip(sources, targets):
+                sources_ids.append(vertex_ids.setdefault(s, len(vertex_ids)))
+                targets_ids.append(vertex_ids.setdefault(t, len(vertex_ids)))
+            if import_edge_weights:
+                all_weights.extend(weights)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    graph = _create_sparse_int_graph(
+        num_of_vertices=len(vertex_ids),
+        directed=directed,
+        weighted=import_edge_weights,
+        incoming_edges_support=incoming_edges_support,
+        sources=sources_ids,
+        targets=targets_ids,
+        weights=all_weights if import_edge_weights else None,
+    )
+    return graph, list(vertex_ids)
+
+
+# Number of graph6/sparse6 records decoded by each task of a pool
+_GRAPH6_RECORDS_PER_TASK = 1024
+
+
+def _graph6sparse6_line_batches(file, size):
+    """Split an input into lists of non-empty lines, as bytes."""
+    if not hasattr(file, "read"):
+        with _open_file(file, "rb") as f:
+            yield from _graph6sparse6_line_batches(f, size)
+        return
+
+    batch = []
+    for line in file:
+        if isinstance(line, str):
+            line = line.encode(encoding="ascii")
+        line = line.strip()
+        if not line:
+            continue
+        batch.append(line)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _map_in_order(pool, fn, iterable, max_pending):
+    """Like map of an executor, but with a bounded number of pending tasks instead of
+    consuming the whole input up front."""
+    pending = deque()
+    for item in iterable:
+        pending.append(pool.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def read_edgelist_graph6sparse6_records(
+    filename, create_graphs=False, executor=None, max_workers=None
+):
+    """Read a collection of graphs in graph6 or sparse6 format, one graph per line.
+
+    See https://users.cecs.anu.edu.au/~bdm/data/formats.txt for a description of the formats.
+    Graph collections, such as the ones produced by nauty, usually contain millions of small
+    graphs. Instead of a backend import per graph, the records are decoded directly into
+    edge columns, which are either returned as is or handed to the backend in a single call
+    per graph in order to create a sparse graph.
+
+    Decoding can optionally be distributed to a pool of processes. The records are
+    always returned in the order of the input.
+
+    .. note:: Digraph6 and incremental sparse6 records are not supported.
+
+    :param filename: the filename to read from (or a file object opened for reading)
+    :param create_graphs: if True each record is returned as an undirected unweighted sparse
+      graph, with vertices :math:`0` up to :math:`n-1`. Otherwise each record is a named
+      tuple (num_of_vertices, sources, targets), where sources and targets are integer
+      arrays with the endpoints of the edges.
+    :param executor: None in order to decode in the calling thread, "process" in order to
+      decode using a new process pool, or an instance of
+      :py:class:`concurrent.futures.Executor` to use
+    :param max_workers: maximum number of workers, if a new pool is created
+    :returns: a generator of records or graphs
+    :raises ValueError: in case of an invalid record or an unknown executor
+    """
+    if executor not in (None, "process") and not isinstance(executor, Executor):
+        raise ValueError("Unknown executor {}".format(executor))
+
+    def records():
+        batches = _graph6sparse6_line_batches(filename, _GRAPH6_RECORDS_PER_TASK)
+        if executor is None:
+            for batch in batches:
+                yield from _decode_graph6sparse6_lines(batch)
+            return
+
+        if executor == "process":
+            pool = _create_process_pool(max_workers)
+        else:
+            pool = executor
+        try:
+            max_pending = 2 * (max_workers or os.cpu_count() or 1)
+            for decoded in _map_in_order(
+                pool, _decode_graph6sparse6_lines, batches, max_pending
+            ):
+                yield from decoded
+        finally:
+            if pool is not executor:
+                pool.shutdown()
+
+    if not create_graphs:
+        return records()
+
+    return (
+        _create_sparse_int_graph(
+            num_of_vertices=record.num_of_vertices,
+            directed=False,
+            weighted=False,
+            sources=record.sources,
+            targets=record.targets,
+        )
+        for record in records()
+    )
@@ -7,9 +7,20 @@ from .._internals._attributes import (
     _JGraphTAttributesRegistry,
 )
 from .._internals._anyhashableg import _is_anyhashable_graph
+from .._internals._ioutils import _compression_of, _output_stream, _OUTPUT_CHUNK_SIZE
+from .._internals._binary import _write_binary
 
 
-def _export_to_file(name, graph, filename, *args):
+def _export_to_file(name, graph, filename, *args, compression=None):
+    if (
+        compression is not None
+        or hasattr(filename, "write")
+        or _compression_of(filename) is not None
+    ):
+        with _output_stream(filename, compression=compression) as stream:
+            _export_to_stream(name, graph, stream, *args)
+        return
+
     if name == "dimacs":
         alg_method_name = "jgrapht_ix_export_file_" + name
     else:
@@ -18,6 +29,18 @@ def _export_to_file(name, graph, filename, *args):
     alg_method(graph.handle, filename, *args)
 
 
+def _export_to_stream(name, graph, stream, *args):
+    if name == "dimacs":
+        alg_method_name = "jgrapht_ix_export_string_" + name
+    else:
+        alg_method_name = "jgrapht_xx_export_string_" + name
+    alg_method = getattr(_backend, alg_method_name)
+    handle = alg_method(graph.handle, *args)
+    # The result is copied into the stream in chunks, without ever
+    # creating a python string of the whole output
+    _JGraphTString(handle).write_to(stream, _OUTPUT_CHUNK_SIZE)
+
+
 def _export_to_string(name, graph, *args):
     if name == "dimacs":
         alg_method_name = "jgrapht_ix_export_string_" + name
@@ -38,66 +61,90 @@ def _vertex_id_store(graph, check_valid_id=None, export_vertex_id_cb=None):
     :param export_vertex_id_cb: a function which converts from a graph vertex to
       an identifier to be written to file.
     """
-    vertex_id_store = None
     if _is_anyhashable_graph(graph):
         # special case, read identifiers from any-hashable graph
-        vertex_id_store = _JGraphTIntegerStringMap()
-
-        if export_vertex_id_cb is not None:
-            for k, v in graph._vertex_id_to_hash.items():
-                vid = export_vertex_id_cb(v)
-                if check_valid_id is not None:
-                    check_valid_id(vid)
-                vertex_id_store[k] = str(vid)
-        else:
-            for k, v in graph._vertex_id_to_hash.items():
-                if check_valid_id is not None:
-                    check_valid_id(v)
-                vertex_id_store[k] = str(v)
+        items = graph._vertex_id_to_hash.items()
+    elif export_vertex_id_cb is not None:
+        items = ((v, v) for v in graph.vertices)
     else:
-        if export_vertex_id_cb is not None:
-            vertex_id_store = _JGraphTIntegerStringMap()
-            for v in graph.vertices:
-                vid = export_vertex_id_cb(v)
-                if check_valid_id is not None:
-                    check_valid_id(vid)
-                vertex_id_store[v] = str(vid)
+        return None
+
+    keys = []
+    values = []
+    for k, v in items:
+        vid = export_vertex_id_cb(v) if export_vertex_id_cb is not None else v
+        if check_valid_id is not None:
+            check_valid_id(vid)
+        keys.append(k)
+        values.append(str(vid))
+
+    vertex_id_store = _JGraphTIntegerStringMap()
+    vertex_id_store.put_all(keys, values)
     return vertex_id_store
 
 
+def _attributes_store(
+    attributes_dict, hash_to_id=None, storage=None, columns=None, id_to_hash=None
+):
+    """Create an attribute store inside the capi backend, which is filled using a
+    single backend call per attribute key.
+
+    For any-hashable graphs the attributes of the graph are given by the per-element
+    storage and the attribute columns. The attributes dictionary overrides them and
+    is keyed by the graph elements, which are translated using the hash to id map.
+    """
+    if storage is None and attributes_dict is None:
+        return None
+
+    # attribute key to the element identifiers and values
+    grouped = {}
+
+    def add(element_id, key, value):
+        ids, values = grouped.setdefault(key, ([], []))
+        ids.append(element_id)
+        values.append(str(value))
+
+    if storage is not None:
+        for element, attrs in storage.items():
+            element_id = hash_to_id[element]
+            for key, value in attrs.items():
+                add(element_id, key, value)
+        for key, column in columns.items():
+            for element_id in id_to_hash:
+                add(element_id, key, column[element_id])
+
+    if attributes_dict is not None:
+        for element, attrs in attributes_dict.items():
+            if hash_to_id is None:
+                element_id = element
+            else:
+                element_id = hash_to_id.get(element)
+                if element_id is None:
+                    # ignore
+                    continue
+            for key, value in attrs.items():
+                add(element_id, key, value)
+
+    attribute_store = _JGraphTAttributeStore()
+    for key, (ids, values) in grouped.items():
+        attribute_store.put_all(key, ids, values)
+    return attribute_store
+
+
 def _vertex_attributes_store(graph, attributes_dict):
     """Combine the attributes from an any-hashable graph and a per-vertex attributes
     dictionary and create an equivalent structure in the capi. This can then be
     used in order to export a graph with attributes.
     """
-    attribute_store = None
     if _is_anyhashable_graph(graph):
-        # any-hashable graph
-        attribute_store = _JGraphTAttributeStore()
-        for v in graph.vertices:
-            for key, value in graph.vertex_attrs[v].items():
-                attribute_store.put(graph._vertex_hash_to_id[v], key, str(value))
-        if attributes_dict is not None:
-            for v, attr_dict in attributes_dict.items():
-                for key, value in attr_dict.items():
-                    try:
-                        attribute_store.put(
-                            graph._vertex_hash_to_id[v], key, str(value)
-                        )
-                    except KeyError:
-                        # ignore
-                        pass
-    else:
-        # default graph
-        if attributes_dict is not None:
-            if attribute_store is None:
-                attribute_store = _JGraphTAttributeStore()
-
-            for v, attr_dict in attributes_dict.items():
-                for key, value in attr_dict.items():
-                    attribute_store.put(v, key, str(value))
-
-    return attribute_store
+        return _attributes_store(
+            attributes_dict,
+            hash_to_id=graph._vertex_hash_to_id,
+            storage=graph._vertex_hash_to_attrs,
+            columns=graph._vertex_attr_columns,
+            id_to_hash=graph._vertex_id_to_hash,
+        )
+    return _attributes_store(attributes_dict)
 
 
 def _edge_id_store(graph):
@@ -108,8 +155,8 @@ def _edge_id_store(graph):
     if _is_anyhashable_graph(graph):
         # special case, read identifiers from an any-hashable graph
         edge_id_store = _JGraphTIntegerStringMap()
-        for k, v in graph._edge_id_to_hash.items():
-            edge_id_store[k] = str(v)
+        id_to_hash = graph._edge_id_to_hash
+        edge_id_store.put_all(list(id_to_hash), [str(e) for e in id_to_hash.values()])
     return edge_id_store
 
 
@@ -118,32 +165,15 @@ def _edge_attributes_store(graph, attributes_dict):
     dictionary and create an equivalent structure in the capi. This can then be
     used in order to export a graph with attributes.
     """
-    attribute_store = None
     if _is_anyhashable_graph(graph):
-        # any-hashable graph
-        attribute_store = _JGraphTAttributeStore()
-        for e in graph.edges:
-            for key, value in graph.edge_attrs[e].items():
-                attribute_store.put(graph._edge_hash_to_id[e], key, str(value))
-        if attributes_dict is not None:
-            for e, attr_dict in attributes_dict.items():
-                for key, value in attr_dict.items():
-                    try:
-                        attribute_store.put(graph._edge_hash_to_id[e], key, str(value))
-                    except KeyError:
-                        # just ignore
-                        pass
-    else:
-        # default graph
-        if attributes_dict is not None:
-            if attribute_store is None:
-                attribute_store = _JGraphTAttributeStore()
-
-            for e, attr_dict in attributes_dict.items():
-                for key, value in attr_dict.items():
-                    attribute_store.put(e, key, str(value))
-
-    return attribute_store
+        return _attributes_store(
+            attributes_dict,
+            hash_to_id=graph._edge_hash_to_id,
+            storage=graph._edge_hash_to_attrs,
+            columns=graph._edge_attr_columns,
+            id_to_hash=graph._edge_id_to_hash,
+        )
+    return _attributes_store(attributes_dict)
 
 
 DIMACS_FORMATS = dict(
@@ -161,6 +191,7 @@ def write_dimacs(
     format="maxclique",
     export_edge_weights=False,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Export a graph using the DIMACS format.
 
@@ -195,12 +226,14 @@ def write_dimacs(
       e <edge source 1> <edge target 1> <edge_weight>
 
     :param graph: the graph
-    :param filename: the filename
+    :param filename: the filename (or a file object opened for writing in binary mode)
     :param format: a string with the format to use. Valid are `maxclique`, `shortestpath`
                    and `coloring`.
     :param export_edge_weights: whether to also export edge weights
     :param export_vertex_id_cb: function which converts from vertex to positive integer identifiers to be written 
       to the output
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     """
     format = DIMACS_FORMATS.get(format, _backend.DIMACS_FORMAT_MAX_CLIQUE)
 
@@ -216,7 +249,7 @@ def write_dimacs(
         export_edge_weights,
         vertex_id_store.handle if vertex_id_store is not None else None,
     ]
-    return _export_to_file("dimacs", graph, filename, *custom)
+    return _export_to_file("dimacs", graph, filename, *custom, compression=compression)
 
 
 def generate_dimacs(
@@ -284,16 +317,19 @@ def write_lemon(
     export_edge_weights=False,
     escape_strings=False,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Exports a graph into Lemon graph format (LGF). This is the custom graph format
     used in the `Lemon <https://lemon.cs.elte.hu/trac/lemon>`_ graph library.
 
     :param graph: the graph
-    :param filename: the filename
+    :param filename: the filename (or a file object opened for writing in binary mode)
     :param export_edge_weights: whether to also export edge weights
     :param escape_strings: whether to escape all strings as Java strings
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output    
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error        
     """
     vertex_id_store = _vertex_id_store(graph, export_vertex_id_cb=export_vertex_id_cb)
@@ -302,7 +338,7 @@ def write_lemon(
         escape_strings,
         vertex_id_store.handle if vertex_id_store is not None else None,
     ]
-    return _export_to_file("lemon", graph, filename, *custom)
+    return _export_to_file("lemon", graph, filename, *custom, compression=compression)
 
 
 def generate_lemon(
@@ -338,6 +374,7 @@ def write_gml(
     per_vertex_attrs_dict=None,
     per_edge_attrs_dict=None,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Export a graph in GML format (Graph Modelling Language).
 
@@ -374,7 +411,7 @@ def write_gml(
       custom attributes are merged with the attributes of any-hashable graphs.
 
     :param graph: the graph
-    :param filename: the filename
+    :param filename: the filename (or a file object opened for writing in binary mode)
     :param export_edge_weights: whether to export edge weights
     :param export_vertex_labels: whether to export a vertex attribute called "label". Even if 
       such an attribute is not provided explicitly, it will be autogenerated.
@@ -384,6 +421,8 @@ def write_gml(
     :param per_edge_attrs_dict: per edge attribute dicts
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output    
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error 
     """
     vertex_attribute_store = _vertex_attributes_store(graph, per_vertex_attrs_dict)
@@ -408,7 +447,7 @@ def write_gml(
         vertex_id_store.handle if vertex_id_store is not None else None,
     ]
 
-    return _export_to_file("gml", graph, filename, *custom)
+    return _export_to_file("gml", graph, filename, *custom, compression=compression)
 
 
 def generate_gml(
@@ -498,6 +537,7 @@ def write_json(
     per_vertex_attrs_dict=None,
     per_edge_attrs_dict=None,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Exports a graph using `JSON <https://tools.ietf.org/html/rfc8259>`_.
 
@@ -515,11 +555,13 @@ def write_json(
       custom attributes are merged with the attributes of any-hashable graphs.
 
     :param graph: The graph to export
-    :param filename: Filename to write
+    :param filename: Filename to write (or a file object opened for writing in binary mode)
     :param per_vertex_attrs_dict: per vertex attribute dicts
     :param per_edge_attrs_dict: per edge attribute dicts
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output        
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error 
     """
     vertex_attribute_store = _vertex_attributes_store(graph, per_vertex_attrs_dict)
@@ -532,7 +574,7 @@ def write_json(
         vertex_id_store.handle if vertex_id_store is not None else None,
     ]
 
-    return _export_to_file("json", graph, filename, *custom)
+    return _export_to_file("json", graph, filename, *custom, compression=compression)
 
 
 def generate_json(
@@ -594,6 +636,7 @@ def write_csv(
     matrix_format_nodeid=False,
     matrix_format_zero_when_no_edge=True,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Export a graph using the CSV format.
 
@@ -601,7 +644,7 @@ def write_csv(
     The supported formats are the same CSV formats used by Gephi. The exporter respects rfc4180.
 
     :param graph: the graph
-    :param filename: the filename
+    :param filename: the filename (or a file object opened for writing in binary mode)
     :param format: a string with the format to use. Valid are `maxclique`, `shortestpath`
                    and `coloring`.
     :param export_edge_weights: whether to export edge weights
@@ -610,6 +653,8 @@ def write_csv(
            zero for missing edges
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output               
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: in case of an export error
     """
     format = CSV_FORMATS.get(format, _backend.CSV_FORMAT_ADJACENCY_LIST)
@@ -621,7 +666,7 @@ def write_csv(
         matrix_format_zero_when_no_edge,
         vertex_id_store.handle if vertex_id_store is not None else None,
     ]
-    return _export_to_file("csv", graph, filename, *custom)
+    return _export_to_file("csv", graph, filename, *custom, compression=compression)
 
 
 def generate_csv(
@@ -672,6 +717,7 @@ def write_gexf(
     export_edge_types=False,
     export_meta=False,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Exports a graph to a GEXF file.
 
@@ -714,7 +760,7 @@ def write_gexf(
               must be either `node` or `edge`.
 
     :param graph: The graph to export
-    :param filename: Filename to write
+    :param filename: Filename to write (or a file object opened for writing in binary mode)
     :param attrs: a list of tuples (name, category, type, default_value)
     :param per_vertex_attrs_dict: per vertex attribute dicts
     :param per_edge_attrs_dict: per edge attribute dicts
@@ -724,6 +770,8 @@ def write_gexf(
     :param export_meta: whether to export meta tag
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output        
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error         
     """
     attrs_registry = _JGraphTAttributesRegistry()
@@ -747,7 +795,7 @@ def write_gexf(
         export_meta,
     ]
 
-    return _export_to_file("gexf", graph, filename, *custom)
+    return _export_to_file("gexf", graph, filename, *custom, compression=compression)
 
 
 def generate_gexf(
@@ -844,6 +892,7 @@ def write_dot(
     per_vertex_attrs_dict=None,
     per_edge_attrs_dict=None,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Exports a graph to DOT format.
 
@@ -853,11 +902,13 @@ def write_dot(
       custom attributes are merged with the attributes of any-hashable graphs.
 
     :param graph: The graph to export
-    :param filename: Filename to write
+    :param filename: Filename to write (or a file object opened for writing in binary mode)
     :param per_vertex_attrs_dict: per vertex attribute dicts
     :param per_edge_attrs_dict: per edge attribute dicts
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output        
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error         
     """
     vertex_attribute_store = _vertex_attributes_store(graph, per_vertex_attrs_dict)
@@ -870,7 +921,7 @@ def write_dot(
         vertex_id_store.handle if vertex_id_store is not None else None,
     ]
 
-    return _export_to_file("dot", graph, filename, *custom)
+    return _export_to_file("dot", graph, filename, *custom, compression=compression)
 
 
 def generate_dot(
@@ -907,16 +958,18 @@ def generate_dot(
     return _export_to_string("dot", graph, *custom)
 
 
-def write_graph6(graph, filename):
+def write_graph6(graph, filename, compression=None):
     """Exports a graph to graph6 format.
 
     See https://users.cecs.anu.edu.au/~bdm/data/formats.txt for a description of the format.
 
     :param graph: The graph to export
-    :param filename: Filename to write
+    :param filename: Filename to write (or a file object opened for writing in binary mode)
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error         
     """
-    return _export_to_file("graph6", graph, filename)
+    return _export_to_file("graph6", graph, filename, compression=compression)
 
 
 def generate_graph6(graph):
@@ -931,17 +984,19 @@ def generate_graph6(graph):
     return _export_to_string("graph6", graph)
 
 
-def write_sparse6(graph, filename):
+def write_sparse6(graph, filename, compression=None):
     """Exports a graph to sparse6 format.
 
     See https://users.cecs.anu.edu.au/~bdm/data/formats.txt for a description of the format.
 
     :param graph: The graph to export
-    :param filename: Filename to write
+    :param filename: Filename to write (or a file object opened for writing in binary mode)
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error         
     """
 
-    return _export_to_file("sparse6", graph, filename)
+    return _export_to_file("sparse6", graph, filename, compression=compression)
 
 
 def generate_sparse6(graph):
@@ -966,6 +1021,7 @@ def write_graphml(
     export_vertex_labels=False,
     export_edge_labels=False,
     export_vertex_id_cb=None,
+    compression=None,
 ):
     """Exports a graph to a GraphML file.
 
@@ -977,7 +1033,7 @@ def write_graphml(
               must be either `graph`, `node` or `edge`.
 
     :param graph: The graph to export
-    :param filename: Filename to write
+    :param filename: Filename to write (or a file object opened for writing in binary mode)
     :param attrs: a list of tuples (name, category, type, default_value)
     :param per_vertex_attrs_dict: per vertex attribute dicts
     :param per_edge_attrs_dict: per edge attribute dicts
@@ -986,6 +1042,8 @@ def write_graphml(
     :param export_edge_labels: whether to export edge labels
     :param export_vertex_id_cb: function which converts from vertex to identifier to be written 
       to the output        
+    :param compression: None, "gzip", "bz2", "xz" or "zstd". If None the compression
+      is deduced from the extension of the filename
     :raises IOError: In case of an export error         
     """
     attrs_registry = _JGraphTAttributesRegistry()
@@ -1006,7 +1064,7 @@ def write_graphml(
         export_edge_labels,
     ]
 
-    return _export_to_file("graphml", graph, filename, *custom)
+    return _export_to_file("graphml", graph, filename, *custom, compression=compression)
 
 
 def generate_graphml(
@@ -1059,3 +1117,24 @@ def generate_graphml(
     ]
 
     return _export_to_string("graphml", graph, *custom)
+
+
+def write_binary(graph, filename):
+    """Exports a graph to a binary snapshot.
+
+    The snapshot stores the graph type together with the graph in CSR (compressed-sparse-rows)
+    format, that is the index pointer, the opposite endpoint and the weight of each edge, as
+    raw little-endian arrays. It can be loaded back using
+    :py:meth:`jgrapht.io.importers.read_binary` by memory-mapping the file, without any parsing.
+
+    The vertices of default graphs are renumbered to :math:`0` up to :math:`n-1` in increasing
+    order of their identifiers, which keeps them unchanged if there are no gaps. The edges are
+    numbered in CSR order when reading the snapshot back. For any-hashable graphs the vertices, the edges
+    and their attributes are stored as well. Attribute columns are stored as raw arrays, while
+    vertices, edges and all other attributes are pickled.
+
+    :param graph: The graph to export
+    :param filename: Filename to write
+    :raises ValueError: if the graph cannot be exported as a snapshot
+    """
+    return _write_binary(graph, filename)
@@ -1,4 +1,6 @@
 from .._internals._anyhashableg import _is_anyhashable_graph
+from .._internals._ioutils import _input_filename
+from .._internals._binary import _read_binary
 
 from .._internals._importers import (
     _parse_graph_dimacs,
@@ -59,19 +61,20 @@ def read_dimacs(graph, filename, import_id_cb=None):
               as the graph vertex.              
 
     :param graph: the graph to read into
-    :param filename: filename to read from
+    :param filename: filename to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :raises IOError: In case of an import error 
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_dimacs(
-            graph, filename, import_id_cb=import_id_cb, input_is_filename=True
-        )
-    else:
-        _parse_graph_dimacs(
-            graph, filename, import_id_cb=import_id_cb, input_is_filename=True,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_dimacs(
+                graph, filename, import_id_cb=import_id_cb, input_is_filename=True
+            )
+        else:
+            _parse_graph_dimacs(
+                graph, filename, import_id_cb=import_id_cb, input_is_filename=True,
+            )
 
 
 def parse_dimacs(graph, input_string, import_id_cb=None):
@@ -198,10 +201,11 @@ def read_gml(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: The graph to read into
-    :param filename: Filename to read from
+    :param filename: Filename to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :param vertex_attribute_cb: Callback function for vertex attributes when reading graphs with integer
@@ -210,18 +214,19 @@ def read_gml(
       edges.
     :raises IOError: In case of an import error 
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_gml(
-            graph, filename, import_id_cb=import_id_cb, input_is_filename=True
-        )
-    else:
-        _parse_graph_gml(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            vertex_attribute_cb=vertex_attribute_cb,
-            input_is_filename=True,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_gml(
+                graph, filename, import_id_cb=import_id_cb, input_is_filename=True
+            )
+        else:
+            _parse_graph_gml(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                vertex_attribute_cb=vertex_attribute_cb,
+                input_is_filename=True,
+            )
 
 
 def parse_gml(
@@ -294,7 +299,8 @@ def parse_gml(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: The graph to read into
     :param input_string: Input string to read from 
@@ -367,7 +373,8 @@ def read_json(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: The graph to read into
     :param input_string: The input string to read from
@@ -379,19 +386,20 @@ def read_json(
       edges.
     :raises IOError: In case of an import error    
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_json(
-            graph, filename, import_id_cb=import_id_cb, input_is_filename=True
-        )
-    else:
-        _parse_graph_json(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            vertex_attribute_cb=vertex_attribute_cb,
-            edge_attribute_cb=edge_attribute_cb,
-            input_is_filename=True,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_json(
+                graph, filename, import_id_cb=import_id_cb, input_is_filename=True
+            )
+        else:
+            _parse_graph_json(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                vertex_attribute_cb=vertex_attribute_cb,
+                edge_attribute_cb=edge_attribute_cb,
+                input_is_filename=True,
+            )
 
 
 def parse_json(
@@ -444,7 +452,8 @@ def parse_json(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: The graph to read into
     :param input_string: The input string to read from
@@ -491,7 +500,7 @@ def read_csv(
               as the graph vertex.
 
     :param graph: the graph to read into
-    :param filename: the filename to read from
+    :param filename: the filename to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :param format: format to use. One of "edgelist", "adjacencylist" and "matrix"    
@@ -500,28 +509,29 @@ def read_csv(
     :param matrix_format_zero_when_noedge: only for the matrix format, whether the input contains zero for missing edges
     :raises IOError: in case of an import error    
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_csv(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            format=format,
-            import_edge_weights=import_edge_weights,
-            matrix_format_node_id=matrix_format_node_id,
-            matrix_format_zero_when_noedge=matrix_format_zero_when_noedge,
-            input_is_filename=True,
-        )
-    else:
-        _parse_graph_csv(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            format=format,
-            import_edge_weights=import_edge_weights,
-            matrix_format_node_id=matrix_format_node_id,
-            matrix_format_zero_when_noedge=matrix_format_zero_when_noedge,
-            input_is_filename=True,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_csv(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                format=format,
+                import_edge_weights=import_edge_weights,
+                matrix_format_node_id=matrix_format_node_id,
+                matrix_format_zero_when_noedge=matrix_format_zero_when_noedge,
+                input_is_filename=True,
+            )
+        else:
+            _parse_graph_csv(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                format=format,
+                import_edge_weights=import_edge_weights,
+                matrix_format_node_id=matrix_format_node_id,
+                matrix_format_zero_when_noedge=matrix_format_zero_when_noedge,
+                input_is_filename=True,
+            )
 
 
 def parse_csv(
@@ -644,10 +654,11 @@ def read_gexf(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: the graph to read into
-    :param filename: the input file to read from
+    :param filename: the input file to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :param validate_schema: whether to validate the XML schema    
@@ -657,24 +668,25 @@ def read_gexf(
       edges.    
     :raises IOError: in case of an import error    
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_gexf(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            input_is_filename=True,
-            validate_schema=validate_schema,
-        )
-    else:
-        _parse_graph_gexf(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            vertex_attribute_cb=vertex_attribute_cb,
-            edge_attribute_cb=edge_attribute_cb,
-            input_is_filename=True,
-            validate_schema=validate_schema,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_gexf(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                input_is_filename=True,
+                validate_schema=validate_schema,
+            )
+        else:
+            _parse_graph_gexf(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                vertex_attribute_cb=vertex_attribute_cb,
+                edge_attribute_cb=edge_attribute_cb,
+                input_is_filename=True,
+                validate_schema=validate_schema,
+            )
 
 
 def parse_gexf(
@@ -744,7 +756,8 @@ def parse_gexf(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: the graph to read into
     :param input_string: the input string to read from
@@ -807,10 +820,11 @@ def read_dot(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: The graph to read into
-    :param filename: Filename to read from
+    :param filename: Filename to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :param vertex_attribute_cb: Callback function for vertex attributes when reading graphs with integer
@@ -819,19 +833,20 @@ def read_dot(
       edges.
     :raises IOError: In case of an import error 
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_dot(
-            graph, filename, import_id_cb=import_id_cb, input_is_filename=True,
-        )
-    else:
-        _parse_graph_dot(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            vertex_attribute_cb=vertex_attribute_cb,
-            edge_attribute_cb=edge_attribute_cb,
-            input_is_filename=True,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_dot(
+                graph, filename, import_id_cb=import_id_cb, input_is_filename=True,
+            )
+        else:
+            _parse_graph_dot(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                vertex_attribute_cb=vertex_attribute_cb,
+                edge_attribute_cb=edge_attribute_cb,
+                input_is_filename=True,
+            )
 
 
 def parse_dot(
@@ -864,7 +879,8 @@ def parse_dot(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: the graph to read into
     :param input_string: the input string to read from
@@ -923,10 +939,11 @@ def read_graph6sparse6(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: the graph to read into
-    :param filename: filename to read from
+    :param filename: filename to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :param vertex_attribute_cb: Callback function for vertex attributes when reading graphs with integer
@@ -935,19 +952,20 @@ def read_graph6sparse6(
       edges.
     :raises IOError: in case of an import error 
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_graph6sparse6(
-            graph, filename, import_id_cb=import_id_cb, input_is_filename=True,
-        )
-    else:
-        _parse_graph_graph6sparse6(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            vertex_attribute_cb=vertex_attribute_cb,
-            edge_attribute_cb=edge_attribute_cb,
-            input_is_filename=True,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_graph6sparse6(
+                graph, filename, import_id_cb=import_id_cb, input_is_filename=True,
+            )
+        else:
+            _parse_graph_graph6sparse6(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                vertex_attribute_cb=vertex_attribute_cb,
+                edge_attribute_cb=edge_attribute_cb,
+                input_is_filename=True,
+            )
 
 
 def parse_graph6sparse6(
@@ -983,7 +1001,8 @@ def parse_graph6sparse6(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     :param graph: the graph to read into
     :param input_string: the input string
@@ -1097,13 +1116,14 @@ def read_graphml(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     .. note:: The parameter simple affect the capabilities of the importer. It trades functionality
               for parsing speed. 
 
     :param graph: the graph to read into
-    :param filename: the input file to read from
+    :param filename: the input file to read from (or a file object opened for reading)
     :param import_id_cb: Callback to transform identifiers from file to vertices. For default graphs
       must return an integer, for any-hashable graphs any hashable. If None the graph assigns automatically.
     :param validate_schema: whether to validate the XML schema    
@@ -1114,26 +1134,27 @@ def read_graphml(
     :param simple: whether to use a simpler parser with more speed but less functionality
     :raises IOError: in case of an import error    
     """
-    if _is_anyhashable_graph(graph):
-        _parse_anyhashable_graph_graphml(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            input_is_filename=True,
-            validate_schema=validate_schema,
-            simple=simple,
-        )
-    else:
-        _parse_graph_graphml(
-            graph,
-            filename,
-            import_id_cb=import_id_cb,
-            vertex_attribute_cb=vertex_attribute_cb,
-            edge_attribute_cb=edge_attribute_cb,
-            input_is_filename=True,
-            validate_schema=validate_schema,
-            simple=simple,
-        )
+    with _input_filename(filename) as filename:
+        if _is_anyhashable_graph(graph):
+            _parse_anyhashable_graph_graphml(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                input_is_filename=True,
+                validate_schema=validate_schema,
+                simple=simple,
+            )
+        else:
+            _parse_graph_graphml(
+                graph,
+                filename,
+                import_id_cb=import_id_cb,
+                vertex_attribute_cb=vertex_attribute_cb,
+                edge_attribute_cb=edge_attribute_cb,
+                input_is_filename=True,
+                validate_schema=validate_schema,
+                simple=simple,
+            )
 
 
 def parse_graphml(
@@ -1223,7 +1244,8 @@ def parse_graphml(
     .. note:: Attribute callback functions accept three parameters. The first is the integer vertex
               or edge identifier. The second is the attribute key and the third is the 
               attribute value. They are only used for default graphs. any-hashable graphs get the
-              attributes/properties automatically loaded.
+              attributes/properties automatically loaded. A dictionary can also be given
+              instead of a callback function, see :ref:`io/importers`.
 
     .. note:: The parameter simple affects the capabilities of the importer. It trades functionality
               for parsing speed. 
@@ -1260,3 +1282,40 @@ def parse_graphml(
             validate_schema=validate_schema,
             simple=simple,
         )
+
+
+def read_binary(
+    filename,
+    kind="sparse",
+    incoming_edges_support=None,
+    vertex_supplier=None,
+    edge_supplier=None,
+):
+    """Read a graph from a binary snapshot.
+
+    The snapshot must have been written by :py:meth:`jgrapht.io.exporters.write_binary`. The
+    file is memory-mapped and the CSR arrays are handed over to the backend without any parsing.
+    The result is a new unmodifiable graph, either a sparse graph or a succinct graph. Snapshots
+    of any-hashable graphs are read back into an any-hashable sparse graph. Succinct graphs are
+    unweighted, thus reading a weighted snapshot as a succinct graph discards the weights.
+
+    .. note:: Snapshots of any-hashable graphs contain pickled objects. Only read snapshots
+              from trusted sources.
+
+    :param filename: filename to read from
+    :param kind: either "sparse" or "succinct"
+    :param incoming_edges_support: whether to support incoming edges or not. If None the default
+      of each kind of graph is used.
+    :param vertex_supplier: vertex supplier for any-hashable graphs
+    :param edge_supplier: edge supplier for any-hashable graphs
+    :returns: the graph
+    :raises ValueError: if the file is not a snapshot or the snapshot cannot be read into
+      the requested kind of graph
+    """
+    return _read_binary(
+        filename,
+        kind=kind,
+        incoming_edges_support=incoming_edges_support,
+        vertex_supplier=vertex_supplier,
+        edge_supplier=edge_supplier,
+    )
@@ -3,6 +3,12 @@ from ._internals._results import _wrap_vertex_iterator, _unwrap_vertex
 import time
 
 
+# Traversal iterators advance the search in the backend on every step, which may fail
+# or invoke callbacks of the graph. Vertices are fetched one at a time, so that this
+# happens when the vertex is requested and not ahead of it.
+_TRAVERSAL_CHUNK_SIZE = 1
+
+
 def bfs_traversal(graph, start_vertex=None):
     """Create a breadth-first search (BFS) traversal vertex iterator.
 
@@ -22,7 +28,7 @@ def bfs_traversal(graph, start_vertex=None):
         it = _backend.jgrapht_ix_traverse_create_bfs_from_vertex_vit(
             graph.handle, start_vertex
         )
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def lexicographic_bfs_traversal(graph):
@@ -39,7 +45,7 @@ def lexicographic_bfs_traversal(graph):
     :returns: A vertex iterator
     """
     it = _backend.jgrapht_xx_traverse_create_lex_bfs_vit(graph.handle)
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def dfs_traversal(graph, start_vertex=None):
@@ -61,7 +67,7 @@ def dfs_traversal(graph, start_vertex=None):
         it = _backend.jgrapht_ix_traverse_create_dfs_from_vertex_vit(
             graph.handle, start_vertex
         )
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def topological_order_traversal(graph):
@@ -79,7 +85,7 @@ def topological_order_traversal(graph):
     :returns: A vertex iterator
     """
     it = _backend.jgrapht_xx_traverse_create_topological_order_vit(graph.handle)
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def random_walk_traversal(
@@ -104,7 +110,7 @@ def random_walk_traversal(
     it = _backend.jgrapht_ix_traverse_create_custom_random_walk_from_vertex_vit(
         graph.handle, start_vertex, weighted, max_steps, seed
     )
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def max_cardinality_traversal(graph):
@@ -124,7 +130,7 @@ def max_cardinality_traversal(graph):
     :returns: A vertex iterator 
     """
     it = _backend.jgrapht_xx_traverse_create_max_cardinality_vit(graph.handle)
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def degeneracy_ordering_traversal(graph):
@@ -142,7 +148,7 @@ def degeneracy_ordering_traversal(graph):
     :returns: A vertex iterator 
     """
     it = _backend.jgrapht_xx_traverse_create_degeneracy_ordering_vit(graph.handle)
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
 
 
 def closest_first_traversal(graph, start_vertex, radius=None):
@@ -164,4 +170,4 @@ def closest_first_traversal(graph, start_vertex, radius=None):
         it = _backend.jgrapht_ix_traverse_create_custom_closest_first_from_vertex_vit(
             graph.handle, start_vertex, radius
         )
-    return _wrap_vertex_iterator(graph, it)
+    return _wrap_vertex_iterator(graph, it, chunk_size=_TRAVERSAL_CHUNK_SIZE)
@@ -1,4 +1,7 @@
+import math
 from abc import ABC, abstractmethod
+from array import array
+from collections import namedtuple
 from collections.abc import Mapping
 from .backend import GraphEvent, IncomingEdgesSupport
 
@@ -231,6 +234,40 @@ class GraphPath(ABC):
         return v_list
 
 
+# Paths of a distance matrix packed into two arrays. The edges of the path of the pair
+# with row-major index k are edges[offsets[k]:offsets[k + 1]].
+_PackedPaths = namedtuple("PackedPaths", ["offsets", "edges"])
+
+
+def _distance_matrix_from_paths(get_path, source_vertices, target_vertices, with_paths):
+    """Fill a distance matrix by computing the path of each pair."""
+    if source_vertices is None or target_vertices is None:
+        raise ValueError("Source and target vertices are required")
+
+    from ._internals._arrays import _import_numpy
+
+    np = _import_numpy()
+    source_vertices = list(source_vertices)
+    target_vertices = list(target_vertices)
+    distances = np.full((len(source_vertices), len(target_vertices)), math.inf)
+    offsets = [0]
+    edges = []
+    for i, s in enumerate(source_vertices):
+        for j, t in enumerate(target_vertices):
+            path = get_path(s, t)
+            if path is not None:
+                distances[i, j] = path.weight
+                if with_paths:
+                    edges.extend(path.edges)
+            offsets.append(len(edges))
+
+    if not with_paths:
+        return distances
+    packed_edges = np.empty(len(edges), dtype=object)
+    packed_edges[:] = edges
+    return distances, _PackedPaths(np.array(offsets, dtype=np.int64), packed_edges)
+
+
 class SingleSourcePaths(ABC):
     """A set of paths starting from a single source vertex.
     
@@ -252,6 +289,37 @@ class SingleSourcePaths(ABC):
         """
         pass
 
+    def get_distances(self, target_vertices, with_predecessors=False):
+        """Get the distances to a sequence of target vertices.
+
+        The default implementation computes each path using :py:meth:`get_path`. The backend
+        results fill the distances using a single backend call, which still builds the
+        shortest path to every target inside the backend. With predecessors it also walks
+        every edge of these paths, crossing into the backend twice per edge. This costs time
+        proportional to the sum of the path lengths, which is quadratic in the number of
+        vertices on deep shortest path trees.
+
+        :param target_vertices: the target vertices
+        :param with_predecessors: whether to also return the last edge of each path
+        :returns: an array with the distance to each target, infinity if unreachable.
+          If with_predecessors is True, a tuple with the distances and the last edge
+          of each path, None for the source and unreachable vertices.
+        """
+        distances = array("d")
+        predecessors = []
+        for v in target_vertices:
+            path = self.get_path(v)
+            if path is None:
+                distances.append(math.inf)
+                predecessors.append(None)
+            else:
+                distances.append(path.weight)
+                edges = path.edges
+                predecessors.append(edges[-1] if edges else None)
+        if with_predecessors:
+            return distances, predecessors
+        return distances
+
 
 class AllPairsPaths(ABC):
     """Paths between all pair of vertices. Used in all-pair shortest
@@ -279,6 +347,33 @@ class AllPairsPaths(ABC):
         """
         pass
 
+    def get_distance_matrix(
+        self, source_vertices=None, target_vertices=None, with_paths=False
+    ):
+        """Get the distances between all pairs of a block of source and target vertices
+        as a NumPy matrix.
+
+        The default implementation computes each path using :py:meth:`get_path` and
+        requires both the source and the target vertices. The backend results fill the
+        matrix using a single backend call, which still builds the path of every pair
+        inside the backend and walks its edges when the paths are requested. Since the
+        edges cannot be collected before their total is known, the backend then computes
+        every path twice, once to count and once to collect its edges.
+
+        :param source_vertices: the source vertices, one per row. If None
+          all vertices of the graph
+        :param target_vertices: the target vertices, one per column. If None
+          all vertices of the graph
+        :param with_paths: whether to also return the paths in packed form
+        :returns: a matrix with the distance of each pair, infinity if there is no path.
+          If with_paths is True, a tuple with the matrix and the paths as a named tuple
+          (offsets, edges), where the edges of the path of row i and column j are
+          edges[offsets[i * columns + j]:offsets[i * columns + j + 1]]
+        """
+        return _distance_matrix_from_paths(
+            self.get_path, source_vertices, target_vertices, with_paths
+        )
+
 
 class MultiObjectiveSingleSourcePaths(ABC):
     """A set of paths starting from a single source vertex.
@@ -317,6 +412,30 @@ class ManyToManyPaths(ABC):
         """
         pass
 
+    def get_distance_matrix(
+        self, source_vertices=None, target_vertices=None, with_paths=False
+    ):
+        """Get the distances between all pairs of a block of source and target vertices
+        as a NumPy matrix.
+
+        The default implementation computes each path using :py:meth:`get_path` and
+        requires both the source and the target vertices. See
+        :py:meth:`.AllPairsPaths.get_distance_matrix` for the cost of the backend results.
+
+        :param source_vertices: the source vertices, one per row. If None
+          the vertices of the query
+        :param target_vertices: the target vertices, one per column. If None
+          the vertices of the query
+        :param with_paths: whether to also return the paths in packed form
+        :returns: a matrix with the distance of each pair, infinity if there is no path.
+          If with_paths is True, a tuple with the matrix and the paths as a named tuple
+          (offsets, edges), where the edges of the path of row i and column j are
+          edges[offsets[i * columns + j]:offsets[i * columns + j + 1]]
+        """
+        return _distance_matrix_from_paths(
+            self.get_path, source_vertices, target_vertices, with_paths
+        )
+
 
 class Graph(ABC):
     """A graph."""
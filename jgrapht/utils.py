@@ -54,3 +54,29 @@ def create_edge_supplier(type="str", prefix="e", start=0):
         return IntegerSupplier(start=start)
     else:
         return StringSupplier(prefix=prefix, start=start)
+
+
+def get_iterator_chunk_size():
+    """Get the maximum number of elements which iterators fetch from the backend
+    using a single call.
+
+    :returns: the maximum chunk size
+    """
+    from ._internals._wrappers import _get_iterator_chunk_size
+
+    return _get_iterator_chunk_size()
+
+
+def set_iterator_chunk_size(chunk_size):
+    """Set the maximum number of elements which iterators fetch from the backend
+    using a single call. Iterators over integer, long and double values as well
+    as edge triples prefetch elements in chunks, which greatly reduces the
+    per-element overhead of crossing the native boundary. Iterators which are
+    already created keep their chunk size.
+
+    :param chunk_size: the maximum chunk size, must be positive
+    :raises ValueError: if the chunk size is not positive
+    """
+    from ._internals._wrappers import _set_iterator_chunk_size
+
+    _set_iterator_chunk_size(chunk_size)
@@ -6,6 +6,7 @@ from ._internals._views import (
     _UndirectedGraphView,
     _EdgeReversedGraphView,
     _MaskedSubgraphView,
+    _BitmapMaskedSubgraphView,
     _WeightedView,
     _GraphUnion,
     _ListenableView,
@@ -19,7 +20,10 @@ from ._internals._anyhashableg import (
     _as_edgereversed_anyhashable_graph as _as_edgereversed_anyhashable_graph,
     _as_weighted_anyhashable_graph as _as_weighted_anyhashable_graph,
     _as_masked_subgraph_anyhashable_graph as _as_masked_subgraph_anyhashable_graph,
+    _as_bitmap_masked_subgraph_anyhashable_graph as _as_bitmap_masked_subgraph_anyhashable_graph,
+    _as_anyhashable_mask_callback,
 )
+from ._internals._arrays import _as_mask_callback
 
 
 def as_unweighted(graph):
@@ -74,6 +78,12 @@ def as_edge_reversed(graph):
         return _EdgeReversedGraphView(graph)
 
 
+def _as_mask_cb(graph, mask, edges=False):
+    if _is_anyhashable_graph(graph):
+        return _as_anyhashable_mask_callback(graph, mask, edges=edges)
+    return _as_mask_callback(mask)
+
+
 def as_masked_subgraph(graph, vertex_mask_cb, edge_mask_cb=None):
     """Create a masked subgraph view. 
 
@@ -86,17 +96,42 @@ def as_masked_subgraph(graph, vertex_mask_cb, edge_mask_cb=None):
     .. note :: Callback functions accept the vertex or edge as a parameter and they must return 
       true or false indicating whether the vertex or edge should be masked.
 
+    Instead of callbacks, the masks can also be given as a boolean sequence or NumPy array
+    indexed by vertex or edge, as a set of masked vertices or edges, or as an integer bitset
+    where bit i masks vertex or edge i. Such masks are copied into the backend and the
+    masking does not call back into Python, unless one of the two arguments is a callback
+    and the other one a mask. For any-hashable graphs, sequences, arrays and
+    bitsets are indexed by the internal identifiers of the vertices or edges, the same as
+    attribute columns. The returned view has a method `set_masks(vertex_mask, edge_mask=None)`
+    which applies new masks in place, without creating a new view. Such a view reflects the
+    base graph as of the last application of its masks.
+
     :param graph: the original graph
-    :param vertex_mask_cb: a vertex mask callback
-    :param edge_mask_cb: an edge mask callback
+    :param vertex_mask_cb: a vertex mask callback or a vertex mask
+    :param edge_mask_cb: an edge mask callback or an edge mask
     :returns: a masked subgraph 
     """
+    no_masks = vertex_mask_cb is None and edge_mask_cb is None
+    if no_masks or callable(vertex_mask_cb) or callable(edge_mask_cb):
+        # a mask combined with a callback is looked up from the callbacks
+        if vertex_mask_cb is not None and not callable(vertex_mask_cb):
+            vertex_mask_cb = _as_mask_cb(graph, vertex_mask_cb)
+        if edge_mask_cb is not None and not callable(edge_mask_cb):
+            edge_mask_cb = _as_mask_cb(graph, edge_mask_cb, edges=True)
+
+        if _is_anyhashable_graph(graph):
+            return _as_masked_subgraph_anyhashable_graph(
+                graph, vertex_mask_cb, edge_mask_cb
+            )
+        else:
+            return _MaskedSubgraphView(graph, vertex_mask_cb, edge_mask_cb)
+
     if _is_anyhashable_graph(graph):
-        return _as_masked_subgraph_anyhashable_graph(
+        return _as_bitmap_masked_subgraph_anyhashable_graph(
             graph, vertex_mask_cb, edge_mask_cb
         )
     else:
-        return _MaskedSubgraphView(graph, vertex_mask_cb, edge_mask_cb)
+        return _BitmapMaskedSubgraphView(graph, vertex_mask_cb, edge_mask_cb)
 
 
 def as_weighted(graph, edge_weight_cb, cache_weights=True, write_weights_through=False):
@@ -119,20 +154,34 @@ def as_weighted(graph, edge_weight_cb, cache_weights=True, write_weights_through
     :py:meth:`~jgrapht.types.Graph.set_edge_weight` will be propagated to the backing graph.
     In this case the backing graph must be weighted, otherwise an error will be raised.
 
+    Instead of a function, precomputed weights can be given either as a dictionary keyed by
+    edge, or as a column such as a list or a numpy array of doubles indexed by edge identifier.
+    For any-hashable graphs a column is indexed by the internal edge identifiers, which is
+    exactly what attribute columns are, e.g. ``as_weighted(g, g.edge_attrs.column("capacity"))``.
+    Precomputed weights are copied once into the weight map of the backend and algorithms
+    never call back into python. Edges without a precomputed weight get weight 1.0. Weights
+    are always cached in this case and cannot be written through.
+
     :param graph: the original graph
-    :param edge_weight_cb: edge weight function
+    :param edge_weight_cb: edge weight function, or precomputed weights as a dictionary
+      or a column
     :param cache_weights: if true weights are cached once computed by the weight function
     :param write_weights_through: if true, any weight adjustment by method 
       :py:meth:`~jgrapht.types.Graph.set_edge_weight` will be propagated to the backing graph
     :returns: a weighted view
     """
+    weights = None
+    if edge_weight_cb is not None and not callable(edge_weight_cb):
+        weights = edge_weight_cb
+        edge_weight_cb = None
+
     if _is_anyhashable_graph(graph):
         return _as_weighted_anyhashable_graph(
-            graph, edge_weight_cb, cache_weights, write_weights_through
+            graph, edge_weight_cb, cache_weights, write_weights_through, weights
         )
     else:
         return _WeightedView(
-            graph, edge_weight_cb, cache_weights, write_weights_through
+            graph, edge_weight_cb, cache_weights, write_weights_through, weights
         )
 
 
@@ -497,6 +497,16 @@ def test_anyhashable_graph_sparse_weighted():
     assert weighted == [6.0, 3.0, 4.0, 2.0, 8.7, 4.3, 14.0, 10.999, 4.0]
 
 
+def test_anyhashable_graph_sparse_weighted_requires_weights():
+
+    with pytest.raises(ValueError):
+        _create_sparse_anyhashable_graph([("v0", "v1", 1.0), ("v1", "v2")])
+
+    g = _create_sparse_anyhashable_graph([("v0", "v1"), ("v1", "v2")], weighted=False)
+    assert not g.type.weighted
+    assert g.vertices == set(["v0", "v1", "v2"])
+
+
 
 def test_graph_copy_to_sparse():
 
@@ -626,4 +636,120 @@ def test_graph_copy_to_sparse_with_attrs():
     assert gs.vertex_attrs['10']['color'] == 'unknown'
 
     gs.graph_attrs['type'] == 'directed'
-    
\ No newline at end of file
+    
+
+def test_lazy_attributes():
+
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+        any_hashable=True,
+        vertex_supplier=create_vertex_supplier(),
+        edge_supplier=create_edge_supplier(),
+    )
+    g.add_vertices_from(range(100))
+    for v in range(99):
+        g.add_edge(v, v + 1)
+
+    # reading does not create any attribute dictionaries
+    for v in g.vertices:
+        assert len(g.vertex_attrs[v]) == 0
+        assert "color" not in g.vertex_attrs[v]
+    for e in g.edges:
+        assert dict(g.edge_attrs[e]) == {}
+        assert g.edge_attrs[e]["weight"] == 1.0
+    assert len(g.vertex_attrs) == 0
+    assert len(g.edge_attrs) == 0
+    assert len(g._vertex_hash_to_attrs) == 0
+
+    with pytest.raises(KeyError):
+        g.vertex_attrs[5]["color"]
+
+    g.vertex_attrs[5]["color"] = "red"
+    assert len(g.vertex_attrs) == 1
+    assert g.vertex_attrs[5] == {"color": "red"}
+
+    g.remove_vertex(5)
+    assert len(g.vertex_attrs) == 0
+    assert 5 not in g._vertex_id_to_hash.values()
+
+    g.add_vertex(1000)
+    assert g.contains_vertex(1000)
+    assert g.edge_source(g.add_edge(1000, 0)) == 1000
+
+
+def test_columnar_attributes():
+
+    np = pytest.importorskip("numpy")
+
+    from jgrapht.views import as_weighted
+
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=False,
+        any_hashable=True,
+        vertex_supplier=create_vertex_supplier(),
+        edge_supplier=create_edge_supplier(),
+    )
+    g.add_vertices_from(["a", "b", "c"])
+    g.add_edge("a", "b", edge="ab")
+    g.add_edge("b", "c", edge="bc")
+    g.add_edge("a", "c", edge="ac")
+
+    g.edge_attrs["ab"]["capacity"] = 5.0
+    g.edge_attrs["ab"]["color"] = "red"
+
+    g.edge_attrs.add_column("capacity", dtype="float64", default=0.0)
+    with pytest.raises(ValueError):
+        g.edge_attrs.add_column("capacity")
+
+    # existing values moved into the column
+    assert g.edge_attrs["ab"]["capacity"] == 5.0
+    assert g.edge_attrs["ab"]["color"] == "red"
+    assert g.edge_attrs["bc"]["capacity"] == 0.0
+    assert dict(g.edge_attrs["ab"]) == {"color": "red", "capacity": 5.0}
+
+    g.edge_attrs["bc"]["capacity"] = 7.0
+    g.edge_attrs["ac"] = {"capacity": 2.5}
+
+    capacity = g.edge_attrs.column("capacity")
+    assert capacity.dtype == np.float64
+    ids = [g._edge_hash_to_id[e] for e in ["ab", "bc", "ac"]]
+    assert capacity[ids].tolist() == [5.0, 7.0, 2.5]
+
+    # the column is a read-only snapshot, updated as a whole
+    with pytest.raises(ValueError):
+        capacity[ids[0]] = 1.0
+    g.edge_attrs.set_column("capacity", capacity * 2)
+    assert g.edge_attrs["bc"]["capacity"] == 14.0
+    assert capacity[ids[1]] == 7.0
+
+    with pytest.raises(KeyError):
+        g.edge_attrs.column("color")
+
+    # the column is the weight source of a weighted view
+    wg = as_weighted(g, g.edge_attrs.column("capacity"))
+    assert wg.type.weighted
+    assert wg.get_edge_weight("ab") == 10.0
+    assert wg.get_edge_weight("bc") == 14.0
+    assert wg.get_edge_weight("ac") == 5.0
+
+    with pytest.raises(ValueError):
+        as_weighted(g, capacity, write_weights_through=True)
+
+    # removing an edge resets its column value
+    eid = g._edge_hash_to_id["bc"]
+    g.remove_edge("bc")
+    assert g.edge_attrs.column("capacity")[eid] == 0.0
+
+    g.vertex_attrs.add_column("rank", dtype="int32", default=-1)
+    g.vertex_attrs["a"]["rank"] = 3
+    assert g.vertex_attrs["a"]["rank"] == 3
+    assert g.vertex_attrs["b"]["rank"] == -1
+    assert len(g.vertex_attrs) == 3
+    del g.vertex_attrs["a"]["rank"]
+    assert g.vertex_attrs["a"]["rank"] == -1
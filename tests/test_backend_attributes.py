@@ -18,6 +18,17 @@ def test_store():
     repr(s)
 
 
+def test_store_put_all():
+
+    s = _JGraphTAttributeStore()
+
+    s.put_all('color', [0, 1, 2], ['red', 'κόκκινο', ''])
+    s.put_all('color', [], [])
+
+    with pytest.raises(ValueError):
+        s.put_all('color', [0, 1], ['red'])
+
+
 def test_registry():
 
     s = _JGraphTAttributesRegistry()
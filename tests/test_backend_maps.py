@@ -72,6 +72,20 @@ def test_JGraphTIntegerStringMap():
     repr(another)
 
 
+def test_JGraphTIntegerStringMap_put_all():
+
+    s = _JGraphTIntegerStringMap()
+    s.put_all([5, 6, 7], ["node 5", "κόμβος 6", ""])
+
+    assert len(s) == 3
+    assert str(s[5]) == "node 5"
+    assert str(s[6]) == "κόμβος 6"
+    assert str(s[7]) == ""
+
+    with pytest.raises(ValueError):
+        s.put_all([1, 2], ["node 1"])
+
+
 def test_JGraphTIntegerDoubleMutableMap():
 
     s = _JGraphTIntegerDoubleMutableMap()
@@ -220,4 +234,31 @@ def test_JGraphTIntegerDoubleMap():
     assert len(s) == 0
     repr(s)
 
-    
\ No newline at end of file
+    
+
+def test_JGraphTIntegerDoubleMap_to_arrays():
+
+    s = _JGraphTIntegerDoubleMutableMap()
+    s[5] = 5.5
+    s[1] = 1.5
+    s[3] = 3.5
+
+    keys, values = s.to_arrays()
+    assert list(keys) == [5, 1, 3]
+    assert list(values) == [5.5, 1.5, 3.5]
+
+    s.clear()
+    keys, values = s.to_arrays()
+    assert len(keys) == 0
+    assert len(values) == 0
+
+
+def test_JGraphTIntegerIntegerMap_to_arrays():
+
+    s = _JGraphTIntegerIntegerMutableMap()
+    s[2] = 20
+    s[4] = 40
+
+    keys, values = s.to_arrays()
+    assert list(keys) == [2, 4]
+    assert list(values) == [20, 40]
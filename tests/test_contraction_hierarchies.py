@@ -148,3 +148,94 @@ def test_anyhashable_ch_many_to_many():
 
     with pytest.raises(ValueError):
         mm.get_path(2, 6)
+
+
+def test_ch_many_to_many_distance_matrix():
+    pytest.importorskip("numpy")
+    g = get_graph()
+
+    ch = sp.precompute_contraction_hierarchies(g, parallelism=1, seed=31)
+
+    mm = sp.contraction_hierarchies_many_to_many(g, [0, 1], [6, 7], ch=ch)
+
+    matrix = mm.get_distance_matrix()
+    assert matrix.tolist() == [[74.0, 77.0], [114.0, 117.0]]
+
+    matrix, paths = mm.get_distance_matrix([1], [6], with_paths=True)
+    assert matrix.tolist() == [[114.0]]
+    assert paths.offsets.tolist() == [0, 3]
+    assert paths.edges.tolist() == [1, 4, 8]
+
+
+def test_anyhashable_ch_many_to_many_distance_matrix():
+    pytest.importorskip("numpy")
+    g = get_anyhashableg_graph()
+
+    ch = sp.precompute_contraction_hierarchies(g, parallelism=1, seed=31)
+
+    mm = sp.contraction_hierarchies_many_to_many(g, [0], [7], ch=ch)
+
+    matrix, paths = mm.get_distance_matrix(with_paths=True)
+    assert matrix.tolist() == [[77.0]]
+    assert paths.edges.tolist() == ["2", 3, 5, 8, 10]
+
+
+def test_ch_dijkstra_batch():
+    g = get_graph()
+
+    ch = sp.precompute_contraction_hierarchies(g, parallelism=1, seed=31)
+
+    distances = sp.contraction_hierarchies_dijkstra_batch(
+        g, [0, 1, 0], [7, 6, 0], ch=ch
+    )
+    assert list(distances) == [77.0, 114.0, 0.0]
+
+    distances, paths = sp.contraction_hierarchies_dijkstra_batch(
+        g, [0, 1], [7, 6], ch=ch, with_paths=True
+    )
+    assert len(paths) == 2
+    assert paths[1].edges == [1, 4, 8]
+    assert paths[-2].edges == [2, 3, 5, 8, 10]
+
+    distances = sp.contraction_hierarchies_dijkstra_batch(g, [0], [7], ch=ch, radius=50)
+    assert list(distances) == [math.inf]
+
+    with pytest.raises(ValueError):
+        sp.contraction_hierarchies_dijkstra_batch(g, [0, 1], [7], ch=ch)
+
+
+def test_ch_dijkstra_batch_threads():
+    from jgrapht._internals._paths import _CH_BATCH_MIN_PAIRS_PER_THREAD
+
+    g = get_graph()
+    vertices = sorted(g.vertices)
+    pairs = [(s, t) for s in vertices for t in vertices]
+    repeat = 2 * _CH_BATCH_MIN_PAIRS_PER_THREAD // len(pairs) + 1
+    sources = [s for s, _ in pairs] * repeat
+    targets = [t for _, t in pairs] * repeat
+    assert len(sources) > 2 * _CH_BATCH_MIN_PAIRS_PER_THREAD
+
+    serial_ch = sp.precompute_contraction_hierarchies(g, parallelism=1, seed=31)
+    serial = sp.contraction_hierarchies_dijkstra_batch(
+        g, sources, targets, ch=serial_ch
+    )
+
+    ch = sp.precompute_contraction_hierarchies(g, parallelism=2, seed=31)
+    distances = sp.contraction_hierarchies_dijkstra_batch(g, sources, targets, ch=ch)
+
+    assert list(distances) == list(serial)
+    for s, t, d in zip(sources[: len(pairs)], targets, distances):
+        p = sp.contraction_hierarchies_dijkstra(g, s, t, ch=serial_ch)
+        assert d == (p.weight if p is not None else math.inf)
+
+
+def test_anyhashable_ch_dijkstra_batch():
+    g = get_anyhashableg_graph()
+
+    ch = sp.precompute_contraction_hierarchies(g, parallelism=1, seed=31)
+
+    distances, paths = sp.contraction_hierarchies_dijkstra_batch(
+        g, [0], [7], ch=ch, with_paths=True
+    )
+    assert list(distances) == [77.0]
+    assert paths[0].edges == ["2", 3, 5, 8, 10]
@@ -1,7 +1,13 @@
 import pytest
 
 from jgrapht import create_graph
-from jgrapht.io.edgelist import read_edgelist_csv, parse_edgelist_csv
+from jgrapht.io.edgelist import (
+    read_edgelist_csv,
+    parse_edgelist_csv,
+    read_edgelist_csv_batches,
+    read_edgelist_csv_shards,
+)
+import jgrapht.io.edgelist as edgelist_module
 
 
 def test_input_csv_from_string():
@@ -47,3 +53,105 @@ def test_input_csv_from_file(tmpdir):
     edgelist = read_edgelist_csv(tmpfilename)
 
     assert list(edgelist) == [('1', '2', 1.0), ('2', '3', 1.0), ('3', '4', 1.0), ('4', '1', 1.0)]
+
+
+def test_input_csv_from_file_object():
+    import io
+
+    input_bytes = b"""1,2
+2,3
+3,4
+4,1
+"""
+
+    edgelist = read_edgelist_csv(io.BytesIO(input_bytes))
+
+    assert list(edgelist) == [('1', '2', 1.0), ('2', '3', 1.0), ('3', '4', 1.0), ('4', '1', 1.0)]
+
+
+def test_input_csv_batches(monkeypatch):
+    import io
+
+    input_bytes = b"".join(b"%d,%d,%d.5\n" % (i, i + 1, i) for i in range(100))
+
+    # parse the input in several pieces
+    monkeypatch.setattr(edgelist_module, "_BATCH_READER_CHUNK_SIZE", 128)
+
+    batches = list(
+        read_edgelist_csv_batches(
+            io.BytesIO(input_bytes),
+            batch_size=30,
+            format="edgelist",
+            import_edge_weights=True,
+        )
+    )
+
+    assert [len(b) for b in batches] == [30, 30, 30, 10]
+    edges = [e for b in batches for e in b]
+    assert edges[0] == ('0', '1', 0.5)
+    assert edges[99] == ('99', '100', 99.5)
+
+
+def test_input_csv_batches_as_numpy():
+    np = pytest.importorskip("numpy")
+    import io
+
+    batches = list(
+        read_edgelist_csv_batches(
+            io.BytesIO(b"1,2\n2,3\n3,4\n"), batch_size=2, format="edgelist"
+        )
+    )
+    assert [len(b) for b in batches] == [2, 1]
+
+    batches = list(
+        read_edgelist_csv_batches(
+            io.BytesIO(b"1,2\n2,3\n3,4\n"),
+            batch_size=2,
+            format="edgelist",
+            as_numpy=True,
+        )
+    )
+    assert isinstance(batches[0], np.recarray)
+    assert list(batches[0].source) == ['1', '2']
+    assert list(batches[1].weight) == [1.0]
+
+    with pytest.raises(ValueError):
+        read_edgelist_csv_batches("input.csv", format="matrix")
+
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_input_csv_shards(tmpdir, executor):
+    filenames = []
+    for i, content in enumerate(["b,a,2.0\na,c,1.5\n", "c,d,3.0\n", "d,b,0.5\ne,a,1.0\n"]):
+        tmpfile = tmpdir.join("shard{}.csv".format(i))
+        tmpfile.write(content)
+        filenames.append(str(tmpfile))
+
+    edgelist = read_edgelist_csv_shards(
+        filenames, format="edgelist", import_edge_weights=True, executor=executor
+    )
+    assert edgelist == [
+        ("b", "a", 2.0),
+        ("a", "c", 1.5),
+        ("c", "d", 3.0),
+        ("d", "b", 0.5),
+        ("e", "a", 1.0),
+    ]
+
+    g, vertices = read_edgelist_csv_shards(
+        filenames,
+        format="edgelist",
+        import_edge_weights=True,
+        executor=executor,
+        max_workers=2,
+        create_graph=True,
+    )
+    assert vertices == ["b", "a", "c", "d", "e"]
+    assert g.type.directed
+    assert g.vertices == set(range(5))
+    assert g.edge_tuple(0) == (0, 1, 2.0)
+    assert g.edge_tuple(4) == (4, 1, 1.0)
+
+    with pytest.raises(ValueError):
+        read_edgelist_csv_shards(filenames, format="matrix")
@@ -1,7 +1,12 @@
 import pytest
 
 from jgrapht import create_graph
-from jgrapht.io.edgelist import read_edgelist_dimacs, parse_edgelist_dimacs
+from jgrapht.io.edgelist import (
+    read_edgelist_dimacs,
+    parse_edgelist_dimacs,
+    read_edgelist_dimacs_batches,
+)
+import jgrapht.io.edgelist as edgelist_module
 
 
 input1 = """c
@@ -188,3 +193,21 @@ def test_input_dimacs_from_string(tmpdir):
         ('9', '1', 1.0),
     ]
 
+
+def test_input_dimacs_batches(tmpdir, monkeypatch):
+    tmpfile = tmpdir.join("dimacs.out")
+    tmpfilename = str(tmpfile)
+
+    with open(tmpfilename, "w") as f:
+        f.write(input1)
+
+    expected = list(parse_edgelist_dimacs(input1))
+
+    # parse the input in several pieces
+    monkeypatch.setattr(edgelist_module, "_BATCH_READER_CHUNK_SIZE", 64)
+
+    batches = list(read_edgelist_dimacs_batches(tmpfilename, batch_size=4))
+
+    assert [len(b) for b in batches] == [4, 4, 4, 4, 2]
+    assert [e for b in batches for e in b] == expected
+
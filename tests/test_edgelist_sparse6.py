@@ -4,6 +4,7 @@ from jgrapht import create_graph
 from jgrapht.io.edgelist import (
     parse_edgelist_graph6sparse6,
     read_edgelist_graph6sparse6,
+    read_edgelist_graph6sparse6_records,
 )
 
 def test_input_sparse6_from_file(tmpdir):
@@ -158,4 +159,42 @@ def test_input_graph6_no_import_cb(tmpdir):
 
     print(edgelist)
 
-    assert list(edgelist) == [('1', '0', 1.0), ('2', '0', 1.0), ('3', '0', 1.0), ('3', '2', 1.0)]
\ No newline at end of file
+    assert list(edgelist) == [('1', '0', 1.0), ('2', '0', 1.0), ('3', '0', 1.0), ('3', '2', 1.0)]
+
+
+@pytest.mark.parametrize("executor", [None, "process"])
+def test_input_graph6sparse6_records(tmpdir, executor):
+    tmpfile = tmpdir.join("collection.g6")
+    tmpfilename = str(tmpfile)
+
+    with open(tmpfilename, "w") as f:
+        f.write(">>graph6<<DQc\n:Cca\n\n:Fa@x^\n@\n")
+
+    records = list(read_edgelist_graph6sparse6_records(tmpfilename, executor=executor))
+
+    assert [r.num_of_vertices for r in records] == [5, 4, 7, 1]
+    assert list(zip(records[0].sources, records[0].targets)) == [(0, 2), (1, 3), (0, 4), (3, 4)]
+    assert list(zip(records[1].sources, records[1].targets)) == [(0, 1), (0, 2), (0, 3), (2, 3)]
+    assert list(zip(records[2].sources, records[2].targets)) == [(0, 1), (0, 2), (1, 2), (5, 6)]
+    assert len(records[3].sources) == 0
+
+    graphs = list(
+        read_edgelist_graph6sparse6_records(
+            tmpfilename, create_graphs=True, executor=executor
+        )
+    )
+
+    assert len(graphs) == 4
+    assert not graphs[2].type.directed
+    assert graphs[2].vertices == set(range(7))
+    assert graphs[2].edge_tuple(3) == (5, 6, 1.0)
+
+
+def test_input_graph6sparse6_records_invalid():
+    import io
+
+    with pytest.raises(ValueError):
+        list(read_edgelist_graph6sparse6_records(io.BytesIO(b"DQc\n&DQc\n")))
+
+    with pytest.raises(ValueError):
+        read_edgelist_graph6sparse6_records("input.g6", executor="thread")
@@ -1,4 +1,5 @@
 import pytest
+from array import array
 
 from jgrapht import (
     create_graph,
@@ -795,3 +796,195 @@ def test_hashable_graph_succinct():
     assert gs.vertices == set(["0", "1", 2, 3, 4])
     assert len(gs.edges) == 8
 
+
+
+def test_graph_add_edges_from_buffers():
+
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=True,
+        weighted=True,
+    )
+    g.add_vertices_from(range(4))
+
+    sources = array("i", [0, 1, 2, 0])
+    targets = array("i", [1, 2, 3, 3])
+    weights = array("d", [1.5, 2.5, 3.5, 4.5])
+
+    edges = g.add_edges_from(sources=sources, targets=targets, weights=weights)
+
+    assert list(edges) == [0, 1, 2, 3]
+    assert g.edge_tuple(edges[2]) == (2, 3, 3.5)
+    assert g.get_edge_weight(edges[3]) == 4.5
+
+    # plain sequences are also accepted
+    edges = g.add_edges_from(sources=[3, 3], targets=[0, 1])
+    assert list(edges) == [4, 5]
+    assert g.edge_tuple(5) == (3, 1, 1.0)
+
+    with pytest.raises(ValueError):
+        g.add_edges_from(sources=[0, 1], targets=[1])
+
+    with pytest.raises(ValueError):
+        g.add_edges_from(sources=[0])
+
+    with pytest.raises(ValueError):
+        g.add_edges_from(sources=[5], targets=[0])
+
+    # a failure leaves the graph unmodified
+    with pytest.raises(ValueError):
+        g.add_edges_from(sources=[0, 1, 5], targets=[1, 2, 0])
+    assert g.number_of_edges == 6
+
+    # unsigned values which do not fit are not wrapped
+    with pytest.raises(OverflowError):
+        g.add_edges_from(sources=array("I", [2 ** 32 - 1]), targets=array("I", [0]))
+    assert g.number_of_edges == 6
+
+
+def test_graph_to_csr():
+
+    np = pytest.importorskip("numpy")
+
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=True,
+        weighted=True,
+    )
+    g.add_vertices_from(range(4))
+    g.add_edge(0, 1, weight=1.5)
+    g.add_edge(0, 2, weight=2.5)
+    g.add_edge(2, 3, weight=3.5)
+    g.add_edge(3, 0, weight=4.5)
+
+    csr = g.to_csr()
+
+    assert csr.indptr.tolist() == [0, 2, 2, 3, 4]
+    assert csr.indices.tolist() == [1, 2, 3, 0]
+    assert csr.edge_ids.tolist() == [0, 1, 2, 3]
+    assert csr.weights.tolist() == [1.5, 2.5, 3.5, 4.5]
+    assert csr.weights.dtype == np.float64
+
+    gs = create_sparse_graph(csr=csr)
+    assert gs.vertices == set([0, 1, 2, 3])
+    assert sorted(gs.edge_tuple(e) for e in gs.edges) == [
+        (0, 1, 1.5),
+        (0, 2, 2.5),
+        (2, 3, 3.5),
+        (3, 0, 4.5),
+    ]
+
+    # undirected graphs contain each edge in both rows
+    gu = create_sparse_graph([(0, 1, 2.0), (1, 2, 3.0)], 3, directed=False)
+    csr = gu.to_csr()
+    assert csr.indptr.tolist() == [0, 1, 3, 4]
+    assert len(csr.indices) == 4
+
+    gu2 = create_sparse_graph(csr=csr, directed=False)
+    assert len(gu2.edges) == 2
+    assert sorted(gu2.edge_tuple(e) for e in gu2.edges) == [(0, 1, 2.0), (1, 2, 3.0)]
+
+    # vertices must be 0 up to n-1
+    g.add_vertex(10)
+    with pytest.raises(ValueError):
+        g.to_csr()
+
+    with pytest.raises(ValueError):
+        create_sparse_graph([(0, 1)], csr=csr)
+
+
+def test_graph_sparse_from_invalid_csr():
+
+    indices = array("i", [1, 2, 0])
+    weights = array("d", [1.0, 2.0, 3.0])
+
+    g = create_sparse_graph(csr=(array("i", [0, 2, 2, 3]), indices, None, weights))
+    assert len(g.edges) == 3
+
+    # must start at zero
+    with pytest.raises(ValueError):
+        create_sparse_graph(csr=(array("i", [1, 2, 2, 3]), indices, None, weights))
+
+    # must be non-decreasing
+    with pytest.raises(ValueError):
+        create_sparse_graph(csr=(array("i", [0, 3, 2, 3]), indices, None, weights))
+
+    # weighted graphs need weights
+    with pytest.raises(ValueError):
+        create_sparse_graph(csr=(array("i", [0, 2, 2, 3]), indices, None, None))
+
+    g = create_sparse_graph(
+        csr=(array("i", [0, 2, 2, 3]), indices, None, None), weighted=False
+    )
+    assert not g.type.weighted
+
+
+def test_graph_sparse_from_columns():
+
+    sources = array("i", [0, 0, 1, 2])
+    targets = array("i", [1, 2, 3, 3])
+    weights = array("d", [1.5, 2.5, 3.5, 4.5])
+
+    g = create_sparse_graph(sources=sources, targets=targets, weights=weights)
+
+    assert g.type.weighted
+    assert g.vertices == set([0, 1, 2, 3])
+    assert sorted(g.edge_tuple(e) for e in g.edges) == [
+        (0, 1, 1.5),
+        (0, 2, 2.5),
+        (1, 3, 3.5),
+        (2, 3, 4.5),
+    ]
+
+    g = create_sparse_graph(
+        sources=[0, 1], targets=[1, 2], num_of_vertices=5, weighted=False
+    )
+    assert not g.type.weighted
+    assert g.vertices == set([0, 1, 2, 3, 4])
+
+    with pytest.raises(ValueError):
+        create_sparse_graph(sources=[0, 1], targets=[1])
+
+    with pytest.raises(ValueError):
+        create_sparse_graph([(0, 1)], sources=[0], targets=[1])
+
+    with pytest.raises(ValueError):
+        create_sparse_graph(sources=[0], targets=[1], any_hashable=True)
+
+
+def test_graph_sparse_and_succinct_from_edgelist_edge_cases():
+
+    g = create_sparse_graph([])
+    assert g.vertices == set([0])
+    assert len(g.edges) == 0
+
+    gs = create_succinct_graph([])
+    assert gs.vertices == set([0])
+    assert len(gs.edges) == 0
+
+    g = create_sparse_graph(sources=[], targets=[])
+    assert len(g.vertices) == 0
+
+    with pytest.raises(ValueError):
+        create_sparse_graph([(0, 1, 2.0), (1, 2)], weighted=True)
+
+    g = create_sparse_graph([(0, 1), (1, 2)], weighted=False)
+    assert g.vertices == set([0, 1, 2])
+
+
+def test_graph_succinct_from_columns():
+
+    np = pytest.importorskip("numpy")
+
+    sources = np.array([0, 1, 0, 0, 3, 4, 4, 3], dtype=np.int32)
+    targets = np.array([1, 2, 3, 4, 4, 0, 2, 3], dtype=np.int32)
+
+    gs = create_succinct_graph(sources=sources, targets=targets, directed=True)
+
+    assert {gs.opposite(e, 4) for e in gs.inedges_of(4)} == {0, 3}
+    assert {gs.opposite(e, 0) for e in gs.outedges_of(0)} == {1, 4, 3}
+
+    assert gs.vertices == set([0, 1, 2, 3, 4])
+    assert len(gs.edges) == 8
@@ -0,0 +1,61 @@
+import pytest
+
+from jgrapht._internals._idmaps import _IdToObjectMap
+
+
+def test_id_to_object_map():
+
+    m = _IdToObjectMap()
+
+    for i in range(10):
+        m[i] = "v{}".format(i)
+
+    assert len(m) == 10
+    assert m[3] == "v3"
+    assert 3 in m
+    assert list(m) == list(range(10))
+
+    del m[3]
+    assert 3 not in m
+    assert m.get(3) is None
+    assert len(m) == 9
+    with pytest.raises(KeyError):
+        m[3]
+    with pytest.raises(KeyError):
+        del m[3]
+
+    # removed slots are reused
+    m[3] = "again"
+    assert m[3] == "again"
+    assert len(m) == 10
+
+    # trailing empty slots are released
+    del m[9]
+    del m[8]
+    assert len(m._slots) == 8
+    assert m.pop(7) == "v7"
+    assert len(m) == 7
+
+
+def test_id_to_object_map_overflow():
+
+    m = _IdToObjectMap()
+
+    m[1 << 40] = "large"
+    m[-1] = "negative"
+    assert len(m) == 2
+    assert len(m._slots) == 0
+    assert m[1 << 40] == "large"
+    assert m[-1] == "negative"
+
+    for i in range(5000):
+        m[i] = i
+    m[2000] = "updated"
+
+    assert len(m) == 5002
+    assert m[2000] == "updated"
+    assert dict(m.items())[1 << 40] == "large"
+
+    del m[-1]
+    assert -1 not in m
+    assert len(m) == 5001
@@ -0,0 +1,113 @@
+import pytest
+
+from jgrapht import create_graph
+from jgrapht.io.exporters import write_binary
+from jgrapht.io.importers import read_binary
+
+
+def build_graph(any_hashable=False):
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=True,
+        allowing_multiple_edges=True,
+        weighted=True,
+        any_hashable=any_hashable,
+    )
+
+    if any_hashable:
+        vertices = ["v{}".format(i) for i in range(5)]
+        g.add_vertices_from(vertices)
+        for i, (u, v) in enumerate([(0, 1), (1, 2), (2, 2), (3, 4), (4, 0), (0, 1)]):
+            g.add_edge(vertices[u], vertices[v], edge="e{}".format(i))
+            g.set_edge_weight("e{}".format(i), float(i + 1))
+    else:
+        g.add_vertices_from(range(5))
+        for i, (u, v) in enumerate([(0, 1), (1, 2), (2, 2), (3, 4), (4, 0), (0, 1)]):
+            e = g.add_edge(u, v)
+            g.set_edge_weight(e, float(i + 1))
+
+    return g
+
+
+def edge_triples(g):
+    return sorted(
+        (min(g.edge_source(e), g.edge_target(e)), max(g.edge_source(e), g.edge_target(e)), g.get_edge_weight(e))
+        for e in g.edges
+    )
+
+
+@pytest.mark.parametrize("kind", ["sparse", "succinct"])
+def test_binary(tmpdir, kind):
+    pytest.importorskip("numpy")
+
+    g = build_graph()
+    tmpfile = tmpdir.join("graph.bin")
+    write_binary(g, str(tmpfile))
+
+    g1 = read_binary(str(tmpfile), kind=kind)
+
+    assert not g1.type.directed
+    assert g1.vertices == set(range(5))
+    assert len(g1.edges) == 6
+    if kind == "sparse":
+        assert edge_triples(g1) == edge_triples(g)
+    else:
+        # the weights are discarded
+        assert not g1.type.weighted
+        assert [t[:2] for t in edge_triples(g1)] == [t[:2] for t in edge_triples(g)]
+
+
+def test_binary_vertices_with_gaps(tmpdir):
+    pytest.importorskip("numpy")
+
+    g = build_graph()
+    g.remove_vertex(2)
+
+    tmpfile = tmpdir.join("graph.bin")
+    write_binary(g, str(tmpfile))
+
+    g1 = read_binary(str(tmpfile))
+
+    # vertices 0, 1, 3, 4 are renumbered to 0, 1, 2, 3
+    assert g1.vertices == set(range(4))
+    assert edge_triples(g1) == [(0, 1, 1.0), (0, 1, 6.0), (0, 3, 5.0), (2, 3, 4.0)]
+
+
+def test_binary_anyhashable(tmpdir):
+    pytest.importorskip("numpy")
+
+    g = build_graph(any_hashable=True)
+    g.vertex_attrs["v1"]["color"] = "red"
+    g.edge_attrs.add_column("capacity", dtype="int64", default=-1)
+    g.edge_attrs["e3"]["capacity"] = 7
+    g.graph_attrs["name"] = "snapshot"
+
+    # leave a gap in the vertex identifiers
+    g.add_vertex("v5")
+    g.remove_vertex("v2")
+
+    tmpfile = tmpdir.join("graph.bin")
+    write_binary(g, str(tmpfile))
+
+    g1 = read_binary(str(tmpfile))
+
+    assert g1.vertices == {"v0", "v1", "v3", "v4", "v5"}
+    assert g1.edges == {"e0", "e3", "e4", "e5"}
+    assert g1.edge_tuple("e3") == ("v3", "v4", 4.0)
+    assert g1.vertex_attrs["v1"]["color"] == "red"
+    assert g1.edge_attrs["e3"]["capacity"] == 7
+    assert g1.edge_attrs["e0"]["capacity"] == -1
+    assert g1.graph_attrs["name"] == "snapshot"
+
+    with pytest.raises(ValueError):
+        read_binary(str(tmpfile), kind="succinct")
+
+
+def test_binary_not_a_snapshot(tmpdir):
+    pytest.importorskip("numpy")
+
+    tmpfile = tmpdir.join("graph.txt")
+    tmpfile.write("0 1\n" * 10)
+
+    with pytest.raises(ValueError):
+        read_binary(str(tmpfile))
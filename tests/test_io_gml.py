@@ -495,6 +495,59 @@ def test_output_gml_without_automatic_labels(tmpdir):
     assert contents == expected4
 
 
+def test_output_gml_to_stream(tmpdir, monkeypatch):
+    import gzip
+    import io
+    import jgrapht.io.exporters as exporters_module
+
+    monkeypatch.setattr(exporters_module, "_OUTPUT_CHUNK_SIZE", 7)
+
+    g = build_graph()
+    v_labels = {
+        0: {"label": "label 0"},
+        1: {"label": "label 1"},
+        2: {"label": "label 2"},
+        3: {"label": "label 3"},
+    }
+    e_labels = {9: {"label": "edge 1-2"}}
+
+    stream = io.BytesIO()
+    write_gml(g, stream, False, True, True, v_labels, e_labels)
+    assert stream.getvalue().decode("utf-8") == expected
+
+    tmpfile = tmpdir.join("gml.out.gz")
+    tmpfilename = str(tmpfile)
+    write_gml(g, tmpfilename, False, True, True, v_labels, e_labels, compression="gzip")
+
+    with gzip.open(tmpfilename, "rt", encoding="utf-8") as f:
+        contents = f.read()
+
+    assert contents == expected
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz"])
+def test_gml_compressed_roundtrip(tmpdir, extension):
+    g = build_graph()
+
+    tmpfile = tmpdir.join("gml.out" + extension)
+    tmpfilename = str(tmpfile)
+    write_gml(g, tmpfilename)
+
+    with open(tmpfilename, "rb") as f:
+        assert not f.read().startswith(b"graph")
+
+    g1 = create_graph(
+        directed=False,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+    read_gml(g1, tmpfilename)
+
+    assert g1.vertices == g.vertices
+    assert len(g1.edges) == len(g.edges)
+
+
 def test_input_gml(tmpdir):
     tmpfile = tmpdir.join("gml.out")
     tmpfilename = str(tmpfile)
@@ -560,6 +613,50 @@ def test_input_gml_from_string(tmpdir):
     assert e_attrs[9]["label"] == "edge 1-2"
 
 
+def test_input_gml_into_dicts():
+
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+
+    v_attrs = dict()
+    e_attrs = {9: {"color": "red"}}
+
+    parse_gml(g, expected, vertex_attribute_cb=v_attrs, edge_attribute_cb=e_attrs)
+
+    assert v_attrs[2]["label"] == "label 2"
+    assert v_attrs[5]["label"] == "5"
+    assert e_attrs[9]["label"] == "edge 1-2"
+    assert e_attrs[9]["color"] == "red"
+
+
+def test_input_gml_from_file_object(tmpdir):
+    import gzip
+
+    tmpfile = tmpdir.join("gml.out.gz")
+    tmpfilename = str(tmpfile)
+
+    with gzip.open(tmpfilename, "wt") as f:
+        f.write(expected)
+
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+
+    v_attrs = dict()
+    with gzip.open(tmpfilename, "rb") as f:
+        read_gml(g, f, vertex_attribute_cb=v_attrs)
+
+    assert len(g.vertices) == 10
+    assert v_attrs[2]["label"] == "label 2"
+
+
 def test_input_anyhashableg_gml_from_file(tmpdir):
     tmpfile = tmpdir.join("gml.out")
     tmpfilename = str(tmpfile)
@@ -583,6 +680,22 @@ def test_input_anyhashableg_gml_from_file(tmpdir):
 
 
 
+def test_input_anyhashableg_gml_with_bad_vertex_supplier():
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+        any_hashable=True,
+        vertex_supplier=lambda: "v",
+    )
+
+    input_string = "Version 1 graph [ directed 0 node [ id 5 ] node [ id 7 ] edge [ source 5 target 7 ] ]"
+
+    with pytest.raises(ValueError):
+        parse_gml(g, input_string)
+
+
 def test_input_gml_nocallbacks(tmpdir):
     tmpfile = tmpdir.join("gml.out")
     tmpfilename = str(tmpfile)
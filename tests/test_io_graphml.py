@@ -584,3 +584,45 @@ def test_property_graph_non_weighted_from_string_without_importid():
 
     with pytest.raises(ValueError):
         g.edge_attrs["e1"]["weight"] = 2.0
+
+
+def test_weighted_property_graph_from_string_skips_weight_attribute():
+    # the weight is imported as a string attribute, which must not be written
+    # into the weight aware attribute dictionaries
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=True,
+        weighted=True,
+        any_hashable=True,
+        vertex_supplier=create_vertex_supplier(),
+        edge_supplier=create_edge_supplier(),
+    )
+
+    parse_graphml(g, expected2, validate_schema=True, simple=True)
+
+    assert g.get_edge_weight("e1") == 4.4
+    assert g.get_edge_weight("e0") == 1.0
+    assert g.edge_attrs["e1"] == {"source": "0", "target": "2"}
+
+
+def test_weighted_property_graph_from_string_reads_attributes_in_chunks(monkeypatch):
+    import jgrapht._internals._attributes as _attributes
+
+    # one attribute per backend call, so that the weight is skipped across chunks
+    monkeypatch.setattr(_attributes, "_ATTRIBUTE_TABLE_CHUNK_SIZE", 1)
+
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=True,
+        weighted=True,
+        any_hashable=True,
+        vertex_supplier=create_vertex_supplier(),
+        edge_supplier=create_edge_supplier(),
+    )
+
+    parse_graphml(g, expected2, validate_schema=True, simple=True)
+
+    assert g.get_edge_weight("e1") == 4.4
+    assert g.edge_attrs["e1"] == {"source": "0", "target": "2"}
@@ -270,4 +270,28 @@ def test_anyhashableg_coreness():
     assert degeneracy == 3
     result = [scores[v] for v in g.vertices]
     expected = [3, 3, 3, 3, 3, 3, 3, 3, 3, 3]
-    assert result == expected
\ No newline at end of file
+    assert result == expected
+
+
+def test_pagerank_to_numpy():
+    np = pytest.importorskip("numpy")
+
+    g = build_graph()
+    scores = scoring.pagerank(g)
+    keys, values = scores.to_numpy()
+
+    assert keys.dtype == np.int64
+    assert values.dtype == np.float64
+    assert list(keys) == list(scores.keys())
+    assert list(values) == [scores[v] for v in scores.keys()]
+
+
+def test_anyhashableg_pagerank_to_numpy():
+    pytest.importorskip("numpy")
+
+    g = build_anyhashableg_graph()
+    scores = scoring.pagerank(g)
+    keys, values = scores.to_numpy()
+
+    assert list(keys) == list(scores.keys())
+    assert list(values) == [scores[v] for v in scores.keys()]
@@ -1,6 +1,7 @@
 import pytest
 
 from jgrapht import create_graph
+from jgrapht.types import AllPairsPaths, SingleSourcePaths
 import jgrapht.algorithms.shortestpaths as sp
 import math
 
@@ -179,6 +180,69 @@ def test_anyhashableg_dijkstra():
     assert list(single_path.edges) == [0, 1]
 
 
+def test_dijkstra_distances():
+    g = get_graph()
+    g.add_vertex(6)
+
+    distances = sp.dijkstra_distances(g, 0)
+    assert list(distances) == [0.0, 3.0, 40.0, 103.0, 60.0, 62.0, math.inf]
+
+    distances, predecessors = sp.dijkstra_distances(
+        g, 0, target_vertices=[5, 3, 6], with_predecessors=True
+    )
+    assert list(distances) == [62.0, 103.0, math.inf]
+    assert list(predecessors) == [5, 1, -1]
+
+    for alg in [sp.bellman_ford_distances, sp.delta_stepping_distances]:
+        assert list(alg(g, 0, target_vertices=[5, 3])) == [62.0, 103.0]
+
+    distances, predecessors = sp.bfs_distances(g, 0, with_predecessors=True)
+    assert list(distances)[:6] == [0.0, 3.0, 40.0, 103.0, 60.0, 1000.0]
+    assert list(predecessors) == [-1, 0, 2, 1, 3, 7, -1]
+
+
+def test_single_source_default_distances():
+    g = get_graph()
+    g.add_vertex(6)
+
+    class UserSingleSourcePaths(SingleSourcePaths):
+        def __init__(self, paths):
+            self._paths = paths
+
+        def source_vertex(self):
+            return self._paths.source_vertex
+
+        def get_path(self, target_vertex):
+            return self._paths.get_path(target_vertex)
+
+    paths = UserSingleSourcePaths(sp.dijkstra(g, 0))
+    distances, predecessors = paths.get_distances([5, 3, 6, 0], with_predecessors=True)
+    assert list(distances) == [62.0, 103.0, math.inf, 0.0]
+    assert predecessors == [5, 1, None, None]
+
+
+def test_dijkstra_distances_numpy():
+    np = pytest.importorskip("numpy")
+    g = get_graph()
+
+    distances, predecessors = sp.dijkstra_distances(
+        g, 0, with_predecessors=True, as_numpy=True
+    )
+    assert distances.dtype == np.float64
+    assert distances.tolist() == [0.0, 3.0, 40.0, 103.0, 60.0, 62.0]
+    assert predecessors.tolist() == [-1, 0, 2, 1, 3, 5]
+
+
+def test_anyhashableg_dijkstra_distances():
+    g = get_anyhashableg_graph()
+
+    distances, predecessors = sp.dijkstra_distances(
+        g, 0, target_vertices=[0, 5, 3], with_predecessors=True
+    )
+    assert list(distances) == [0.0, 62.0, 103.0]
+    assert predecessors == [None, 5, 1]
+
+
 def test_bfs():
     g = get_graph()
 
@@ -290,6 +354,56 @@ def test_anyhashableg_johnsons():
     assert list(path05.edges) == ["2", 3, 5]
 
 
+def test_allpairs_distance_matrix():
+    pytest.importorskip("numpy")
+    g = get_graph_with_negative_edges()
+
+    for allpairs in [sp.johnson_allpairs(g), sp.floyd_warshall_allpairs(g)]:
+        matrix = allpairs.get_distance_matrix()
+        assert matrix.shape == (7, 7)
+        assert matrix[0, 5] == 62.0
+        assert matrix[1, 5] == 102.0
+
+        matrix, paths = allpairs.get_distance_matrix([0, 1], [5, 3], with_paths=True)
+        assert matrix.tolist() == [[62.0, 100.0], [102.0, 100.0]]
+        assert paths.offsets.tolist() == [0, 3, 5, 7, 8]
+        assert paths.edges.tolist() == [2, 3, 5, 7, 8, 1, 4, 1]
+
+
+def test_allpairs_default_distance_matrix():
+    pytest.importorskip("numpy")
+    g = get_graph_with_negative_edges()
+
+    class UserAllPairsPaths(AllPairsPaths):
+        def __init__(self, allpairs):
+            self._allpairs = allpairs
+
+        def get_path(self, source_vertex, target_vertex):
+            return self._allpairs.get_path(source_vertex, target_vertex)
+
+        def get_paths_from(self, source_vertex):
+            return self._allpairs.get_paths_from(source_vertex)
+
+    allpairs = UserAllPairsPaths(sp.floyd_warshall_allpairs(g))
+    matrix, paths = allpairs.get_distance_matrix([0, 1], [5, 3], with_paths=True)
+    assert matrix.tolist() == [[62.0, 100.0], [102.0, 100.0]]
+    assert paths.offsets.tolist() == [0, 3, 5, 7, 8]
+    assert paths.edges.tolist() == [2, 3, 5, 7, 8, 1, 4, 1]
+
+    with pytest.raises(ValueError):
+        allpairs.get_distance_matrix()
+
+
+def test_anyhashableg_allpairs_distance_matrix():
+    pytest.importorskip("numpy")
+    g = get_anyhashableg_graph_with_negative_edges()
+
+    allpairs = sp.johnson_allpairs(g)
+    matrix, paths = allpairs.get_distance_matrix([0], [5], with_paths=True)
+    assert matrix.tolist() == [[62.0]]
+    assert paths.edges.tolist() == ["2", 3, 5]
+
+
 def test_floyd_warshall():
     g = get_graph_with_negative_edges()
 
@@ -495,6 +609,49 @@ def test_a_star_with_alt_heuristic():
     assert path1.end_vertex == 8
 
 
+def test_a_star_with_precomputed_alt_landmarks():
+    g = get_graph()
+
+    landmarks = sp.precompute_alt_landmarks(g, [1, 4])
+    assert landmarks.landmarks == [1, 4]
+    repr(landmarks)
+
+    for use_bidirectional in [False, True]:
+        path = sp.a_star_with_alt_heuristic(
+            g, 0, 5, landmarks=landmarks, use_bidirectional=use_bidirectional
+        )
+        assert path.weight == 62.0
+        assert list(path.edges) == [2, 3, 5]
+
+    for strategy in ["random", "farthest", "avoid"]:
+        landmarks = sp.precompute_alt_landmarks(g, 2, strategy=strategy, seed=17)
+        assert len(landmarks) == 2
+        assert len(set(landmarks.landmarks)) == 2
+        path = sp.a_star_with_alt_heuristic(g, 1, 0, landmarks=landmarks)
+        assert path.weight == 115.0
+
+    with pytest.raises(ValueError):
+        sp.precompute_alt_landmarks(g, 2, strategy="unknown")
+
+    with pytest.raises(ValueError):
+        sp.precompute_alt_landmarks(g, 7)
+
+    with pytest.raises(TypeError):
+        sp.precompute_alt_landmarks(g, True)
+
+    with pytest.raises(ValueError):
+        sp.a_star_with_alt_heuristic(get_graph(), 0, 5, landmarks=landmarks)
+
+
+def test_anyhashableg_a_star_with_precomputed_alt_landmarks():
+    g = get_anyhashableg_graph()
+
+    landmarks = sp.precompute_alt_landmarks(g, 3, strategy="avoid", seed=1)
+    path = sp.a_star_with_alt_heuristic(g, 0, 5, landmarks=landmarks)
+    assert path.weight == 62.0
+    assert list(path.edges) == ["2", 3, 5]
+
+
 def test_anyhashableg_a_star_with_alt_heuristic():
 
     g = create_graph(
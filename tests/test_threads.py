@@ -0,0 +1,50 @@
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from jgrapht import create_graph
+import jgrapht.algorithms.scoring as scoring
+import jgrapht.algorithms.shortestpaths as sp
+import jgrapht.generators as generators
+
+
+def build_graph(seed):
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+    generators.gnm_random_graph(g, 200, 1000, seed=seed)
+    return g
+
+
+def test_algorithms_from_many_threads():
+
+    graphs = [build_graph(seed) for seed in range(8)]
+
+    def run(g):
+        return dict(scoring.betweenness_centrality(g))
+
+    expected = [run(g) for g in graphs]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, graphs))
+
+    assert results == expected
+
+
+def test_exceptions_from_many_threads():
+
+    g = create_graph(directed=True, weighted=True)
+    g.add_vertices_from([0, 1])
+    g.add_edge(0, 1, weight=-1.0)
+    g.add_edge(1, 0, weight=-1.0)
+
+    def run(_):
+        with pytest.raises(ValueError):
+            sp.bellman_ford(g, 0)
+        return True
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert all(executor.map(run, range(16)))
@@ -179,3 +179,24 @@ def test_anyhashableg_dag():
 
     topo = list(traversal.topological_order_traversal(g1))
     assert topo == [0, 3, 1, 2]
+
+
+def test_topological_order_traversal_fails_when_reached():
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=False,
+    )
+
+    g.add_vertices_from(range(0, 4))
+    g.add_edge(0, 1)
+    g.add_edge(2, 3)
+    g.add_edge(3, 2)
+
+    # vertices are not fetched ahead, the cycle is only detected after them
+    it = traversal.topological_order_traversal(g)
+    assert next(it) == 0
+    assert next(it) == 1
+    with pytest.raises(ValueError):
+        next(it)
@@ -95,3 +95,30 @@ def test_vertex_supplier():
     assert es() == 4
     assert es() == 5
 
+
+
+def test_iterator_chunk_size():
+
+    import jgrapht
+
+    default_chunk_size = utils.get_iterator_chunk_size()
+
+    with pytest.raises(ValueError):
+        utils.set_iterator_chunk_size(0)
+
+    utils.set_iterator_chunk_size(3)
+    try:
+        assert utils.get_iterator_chunk_size() == 3
+
+        g = jgrapht.create_graph(directed=True, weighted=True)
+        g.add_vertices_from(range(100))
+        for v in range(99):
+            g.add_edge(v, v + 1, weight=2.0 * v)
+
+        assert list(g.vertices) == list(range(100))
+        assert sorted(g.edges) == list(range(99))
+        assert [g.edge_source(e) for e in g.outedges_of(50)] == [50]
+    finally:
+        utils.set_iterator_chunk_size(default_chunk_size)
+
+    assert utils.get_iterator_chunk_size() == default_chunk_size
@@ -203,6 +203,102 @@ def test_as_masked_subgraph():
         masked_graph.add_vertex(6)
 
 
+def test_as_masked_subgraph_with_masks():
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=True,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+
+    g.add_vertices_from(range(5))
+    g.add_edge(0, 1)
+    g.add_edge(0, 2)
+    g.add_edge(0, 3)
+    g.add_edge(2, 3)
+    g.add_edge(1, 3)
+    g.add_edge(2, 4)
+
+    masked_graph = as_masked_subgraph(
+        g, [False, False, False, True], edge_mask_cb={5}
+    )
+
+    assert masked_graph.vertices == {0, 1, 2, 4}
+    assert masked_graph.edges == {0, 1}
+    assert not masked_graph.type.modifiable
+
+    # bitsets, applied without rebuilding the view
+    masked_graph.set_masks(0b00001, 0b000010)
+    assert masked_graph.vertices == {1, 2, 3, 4}
+    assert masked_graph.edges == {3, 4, 5}
+
+    masked_graph.set_masks(None)
+    assert masked_graph.vertices == {0, 1, 2, 3, 4}
+    assert masked_graph.number_of_edges == 6
+
+    with pytest.raises(ValueError):
+        masked_graph.add_vertex(6)
+
+    with pytest.raises(ValueError):
+        masked_graph.set_masks({-1})
+
+
+def test_as_masked_subgraph_with_mixed_masks():
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=True,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+
+    g.add_vertices_from(range(4))
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    masked_graph = as_masked_subgraph(g, lambda v: v == 3, edge_mask_cb={0})
+    assert masked_graph.vertices == {0, 1, 2}
+    assert masked_graph.edges == {1}
+
+    masked_graph = as_masked_subgraph(g, 0b0001, edge_mask_cb=lambda e: e == 1)
+    assert masked_graph.vertices == {1, 2, 3}
+    assert masked_graph.edges == {2}
+
+    masked_graph = as_masked_subgraph(g, None, None)
+    assert masked_graph.vertices == {0, 1, 2, 3}
+    assert masked_graph.edges == {0, 1, 2}
+
+    with pytest.raises(TypeError):
+        as_masked_subgraph(g, True)
+
+
+def test_as_masked_subgraph_with_numpy_masks():
+    np = pytest.importorskip("numpy")
+
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=True,
+        allowing_multiple_edges=False,
+        weighted=False,
+    )
+
+    g.add_vertices_from(range(4))
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    vertex_mask = np.zeros(4, dtype=bool)
+    vertex_mask[3] = True
+    masked_graph = as_masked_subgraph(g, vertex_mask)
+
+    assert masked_graph.vertices == {0, 1, 2}
+    assert masked_graph.edges == {0, 1}
+
+    masked_graph.set_masks(np.zeros(4, dtype=bool), np.array([True, False, False]))
+    assert masked_graph.vertices == {0, 1, 2, 3}
+    assert masked_graph.edges == {1, 2}
+
+
 def test_anyhashableg_as_masked_subgraph():
     g = create_graph(
         directed=False,
@@ -304,6 +400,70 @@ def test_anyhashableg_as_masked_subgraph():
 
     repr(masked_graph)
 
+
+def test_anyhashableg_as_masked_subgraph_with_masks():
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=True,
+        allowing_multiple_edges=False,
+        weighted=True,
+        any_hashable=True,
+    )
+
+    for v in ["v0", "v1", "v2", "v3"]:
+        g.add_vertex(v)
+    g.add_edge("v0", "v1", edge="e1")
+    g.add_edge("v1", "v2", edge="e2")
+    g.add_edge("v2", "v3", edge="e3")
+
+    masked_graph = as_masked_subgraph(g, {"v3"}, edge_mask_cb={"e1"})
+
+    assert masked_graph.vertices == {"v0", "v1", "v2"}
+    assert masked_graph.edges == {"e2"}
+    assert not masked_graph.contains_vertex("v3")
+    assert masked_graph.contains_edge("e2")
+
+    with pytest.raises(ValueError):
+        masked_graph.degree_of("v3")
+
+    masked_graph.set_masks({"v0"})
+    assert masked_graph.vertices == {"v1", "v2", "v3"}
+    assert masked_graph.edges == {"e2", "e3"}
+
+    with pytest.raises(ValueError):
+        masked_graph.add_vertex("v4")
+
+
+def test_anyhashableg_as_masked_subgraph_with_mixed_masks():
+    g = create_graph(
+        directed=False,
+        allowing_self_loops=True,
+        allowing_multiple_edges=False,
+        weighted=True,
+        any_hashable=True,
+    )
+
+    for v in ["v0", "v1", "v2", "v3"]:
+        g.add_vertex(v)
+    g.add_edge("v0", "v1", edge="e1")
+    g.add_edge("v1", "v2", edge="e2")
+    g.add_edge("v2", "v3", edge="e3")
+
+    masked_graph = as_masked_subgraph(g, lambda v: v == "v3", edge_mask_cb={"e1"})
+    assert masked_graph.vertices == {"v0", "v1", "v2"}
+    assert masked_graph.edges == {"e2"}
+
+    masked_graph = as_masked_subgraph(g, {"v0"}, edge_mask_cb=lambda e: e == "e2")
+    assert masked_graph.vertices == {"v1", "v2", "v3"}
+    assert masked_graph.edges == {"e3"}
+
+    with pytest.raises(ValueError):
+        as_masked_subgraph(g, {"v7"})
+
+    with pytest.raises(TypeError):
+        as_masked_subgraph(g, False, edge_mask_cb={"e1"})
+
+
 def test_as_weighted():
     g = create_graph(
         directed=False,
@@ -1151,3 +1311,94 @@ def test_anyhashableg_as_edge_reversed():
     assert g.edge_target(e45) == v5
     assert g4.edge_source(e45) == v5
     assert g4.edge_target(e45) == v4
+
+
+def test_as_weighted_with_column():
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=False,
+    )
+
+    g.add_vertices_from(range(4))
+    g.add_edge(0, 1)
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    from array import array
+
+    wg = as_weighted(g, array("d", [5.5, 6.5]))
+
+    assert wg.type.weighted
+    assert wg.get_edge_weight(0) == 5.5
+    assert wg.get_edge_weight(1) == 6.5
+    # outside of the column
+    assert wg.get_edge_weight(2) == 1.0
+
+    # weights are cached and can be adjusted
+    wg.set_edge_weight(2, 3.0)
+    assert wg.get_edge_weight(2) == 3.0
+    assert g.get_edge_weight(2) == 1.0
+
+
+def test_as_weighted_with_dict():
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=True,
+    )
+
+    g.add_vertices_from(range(4))
+    g.add_edge(0, 1, weight=10.0)
+    g.add_edge(1, 2, weight=10.0)
+    g.add_edge(0, 2, weight=10.0)
+
+    wg = as_weighted(g, {0: 1.5, 2: 4.0})
+
+    assert wg.get_edge_weight(0) == 1.5
+    assert wg.get_edge_weight(1) == 1.0
+    assert wg.get_edge_weight(2) == 4.0
+    assert g.get_edge_weight(0) == 10.0
+
+    # plain lists are columns
+    wg = as_weighted(g, [3.0, 2.0, 1.0])
+    assert [wg.get_edge_weight(e) for e in range(3)] == [3.0, 2.0, 1.0]
+
+    with pytest.raises(ValueError):
+        as_weighted(g, {0: 1.5}, write_weights_through=True)
+
+
+def test_anyhashableg_as_weighted_with_dict():
+    g = create_graph(
+        directed=True,
+        allowing_self_loops=False,
+        allowing_multiple_edges=False,
+        weighted=False,
+        any_hashable=True,
+    )
+
+    g.add_vertices_from(["a", "b", "c"])
+    g.add_edge("a", "b", edge="ab")
+    g.add_edge("b", "c", edge="bc")
+
+    wg = as_weighted(g, {"ab": 2.5, "bc": 3.5})
+
+    assert wg.type.weighted
+    assert wg.get_edge_weight("ab") == 2.5
+    assert wg.get_edge_weight("bc") == 3.5
+
+    with pytest.raises(ValueError):
+        as_weighted(g, {"cd": 1.0})
+
+
+def test_mask_callback_ignores_negative_ids():
+    from jgrapht._internals._arrays import _as_mask_callback
+
+    mask_cb = _as_mask_callback([False, True])
+
+    assert mask_cb(1)
+    assert not mask_cb(0)
+    assert not mask_cb(2)
+    assert not mask_cb(-1)